@@ -4,9 +4,11 @@ import (
 	"flag"
 	"fmt"
 	"os"
+	"runtime"
 
 	"github.com/emmett/vox/internal/app"
 	"github.com/emmett/vox/internal/config"
+	"github.com/emmett/vox/internal/stt"
 )
 
 var (
@@ -26,19 +28,34 @@ var (
 	setDefault      = flag.String("set-default", "", "Set a model as the default")
 	outputFormat    = flag.String("format", "console", "Output format: console, json, text")
 	outputFile      = flag.String("output", "", "Output file (default: stdout)")
+	partialInterval = flag.Float64("partial-interval", 0, "Minimum seconds between partial results (0 = after every decoded batch)")
 	enableVAD       = flag.Bool("vad", true, "Enable Voice Activity Detection for better pause handling")
-	vadThreshold    = flag.Float64("vad-threshold", 0.1, "VAD energy threshold (0.001-0.1, lower=more sensitive)")
+	vadMode         = flag.String("vad-mode", "energy", "VAD detector: energy, or spectral to also reject hum and broadband noise")
+	vadAdaptive     = flag.Bool("vad-adaptive", true, "Track the noise floor and derive the VAD threshold from it (--vad-threshold becomes the minimum)")
+	vadThreshold    = flag.Float64("vad-threshold", 0.01, "VAD energy threshold (0.001-0.1, lower=more sensitive)")
 	vadSilenceDelay = flag.Float64("vad-silence-delay", 2.5, "Delay in seconds after last speech before returning to silence")
+	vadPreRoll      = flag.Float64("vad-pre-roll", 0.3, "Seconds of audio before detected speech to replay into the recognizer")
+	endpointing     = flag.String("endpointing", "vad", "Utterance endpointing: vad to wait for the silence delay, or decoder to also finalize on the recognizer's endpoints and short trailing silence (requires --vad)")
+	endpointSilence = flag.Float64("endpoint-silence", 0.3, "Trailing silence in seconds that ends an utterance with a stable hypothesis (--endpointing decoder)")
 	audioDevice     = flag.String("device", "", "Audio input device name (use --list-devices to see available devices)")
+	inputSource     = flag.String("input", "", "Read audio from a 16-bit WAV (any rate/channels) or 16kHz mono raw PCM file, or - for stdin, instead of a device")
+	inputPacing     = flag.String("pacing", "realtime", "Pacing of --input audio: realtime to simulate a microphone, or fast for throughput runs")
 	listDevices     = flag.Bool("list-devices", false, "List all available audio input devices")
+	overflowPolicy  = flag.String("overflow-policy", "drop-newest", "Capture overflow policy: drop-newest, drop-oldest, coalesce, spill")
+	overflowBudget  = flag.Int("overflow-budget-kb", 1024, "Maximum audio (KB) held back by the coalesce and spill overflow policies")
 	showVersion     = flag.Bool("version", false, "Show version information")
 	autoDownload    = flag.Bool("auto-download", false, "Automatically download default model if not found (no prompt)")
 	pttMode         = flag.Bool("ptt", false, "Enable push-to-talk mode")
 	pttHotkey       = flag.String("ptt-hotkey", "ctrl+shift+space", "Hotkey combo for push-to-talk")
+	transcribe      = flag.Bool("transcribe", false, "Transcribe the recordings given as arguments (16-bit .wav at any rate/channels, or 16kHz mono raw PCM) instead of the microphone")
+	jobs            = flag.Int("jobs", runtime.NumCPU(), "Number of recognizers decoding in parallel with --transcribe")
+	grammarList     = flag.String("grammar", "", "Comma-separated phrases to restrict recognition to (small/lgraph models), e.g. \"lights on,lights off\"")
+	grammarFile     = flag.String("grammar-file", "", "File of phrases, one per line, to restrict recognition to")
+	mlockModel      = flag.Bool("mlock-model", false, "Lock the model files in memory (needs a sufficient locked memory limit, ulimit -l) so they are never paged out")
 )
 
 func main() {
-	flag.Parse()
+	parseArgs()
 
 	cfg, err := config.LoadWithFallback(*configFile)
 	if err != nil {
@@ -124,18 +141,42 @@ func applyConfigDefaults(cfg *config.Config) {
 	if !flagsSet["output"] && cfg.Output.File != "" {
 		*outputFile = cfg.Output.File
 	}
+	if !flagsSet["partial-interval"] && cfg.Output.PartialInterval > 0 {
+		*partialInterval = cfg.Output.PartialInterval
+	}
 	if !flagsSet["vad"] {
 		*enableVAD = cfg.VAD.Enabled
 	}
+	if !flagsSet["vad-mode"] && cfg.VAD.Mode != "" {
+		*vadMode = cfg.VAD.Mode
+	}
+	if !flagsSet["vad-adaptive"] {
+		*vadAdaptive = cfg.VAD.Adaptive
+	}
 	if !flagsSet["vad-threshold"] && cfg.VAD.Threshold > 0 {
 		*vadThreshold = cfg.VAD.Threshold
 	}
 	if !flagsSet["vad-silence-delay"] && cfg.VAD.SilenceDelay > 0 {
 		*vadSilenceDelay = cfg.VAD.SilenceDelay
 	}
+	if !flagsSet["vad-pre-roll"] && cfg.VAD.PreRoll > 0 {
+		*vadPreRoll = cfg.VAD.PreRoll
+	}
+	if !flagsSet["endpointing"] && cfg.VAD.Endpointing != "" {
+		*endpointing = cfg.VAD.Endpointing
+	}
+	if !flagsSet["endpoint-silence"] && cfg.VAD.EndpointSilence > 0 {
+		*endpointSilence = cfg.VAD.EndpointSilence
+	}
 	if !flagsSet["device"] && cfg.Audio.Device != "" {
 		*audioDevice = cfg.Audio.Device
 	}
+	if !flagsSet["overflow-policy"] && cfg.Audio.OverflowPolicy != "" {
+		*overflowPolicy = cfg.Audio.OverflowPolicy
+	}
+	if !flagsSet["overflow-budget-kb"] && cfg.Audio.OverflowBudgetKB > 0 {
+		*overflowBudget = cfg.Audio.OverflowBudgetKB
+	}
 	if !flagsSet["ptt"] && cfg.PushToTalk.Enabled {
 		*pttMode = cfg.PushToTalk.Enabled
 	}
@@ -144,6 +185,19 @@ func applyConfigDefaults(cfg *config.Config) {
 	}
 }
 
+// inputFiles holds the positional arguments, the recordings for --transcribe
+var inputFiles []string
+
+// parseArgs parses the command line, also accepting flags after positional
+// arguments (vox --transcribe a.wav b.wav --jobs 4)
+func parseArgs() {
+	flag.Parse()
+	for args := flag.Args(); len(args) > 0; args = flag.Args() {
+		inputFiles = append(inputFiles, args[0])
+		flag.CommandLine.Parse(args[1:])
+	}
+}
+
 func run() error {
 	mgr := app.NewModelManager()
 	selectedModel := *modelName
@@ -155,15 +209,53 @@ func run() error {
 		}
 	}
 
+	grammar := stt.ParseGrammar(*grammarList)
+	if *grammarFile != "" {
+		phrases, err := stt.ReadGrammarFile(*grammarFile)
+		if err != nil {
+			return err
+		}
+		grammar = append(grammar, phrases...)
+	}
+
 	config := app.TranscriberConfig{
 		ModelName:       selectedModel,
 		OutputFormat:    *outputFormat,
 		OutputFile:      *outputFile,
+		PartialInterval: *partialInterval,
 		EnableVAD:       *enableVAD,
+		VADMode:         *vadMode,
+		VADAdaptive:     *vadAdaptive,
 		VADThreshold:    *vadThreshold,
 		VADSilenceDelay: *vadSilenceDelay,
+		VADPreRoll:      *vadPreRoll,
+		Endpointing:     *endpointing,
+		EndpointSilence: *endpointSilence,
 		AudioDevice:     *audioDevice,
 		AutoDownload:    *autoDownload,
+		OverflowPolicy:  *overflowPolicy,
+		OverflowBudget:  *overflowBudget * 1024,
+		AudioSource:     *inputSource,
+		AudioPacing:     *inputPacing,
+		LockModel:       *mlockModel,
+		Grammar:         grammar,
+	}
+
+	if *transcribe {
+		fileTranscriber := app.NewFileTranscriber(app.FileTranscriberConfig{
+			ModelName:    selectedModel,
+			Files:        inputFiles,
+			Jobs:         *jobs,
+			OutputFormat: *outputFormat,
+			OutputFile:   *outputFile,
+			VADMode:      *vadMode,
+			VADAdaptive:  *vadAdaptive,
+			VADThreshold: *vadThreshold,
+			AutoDownload: *autoDownload,
+			LockModel:    *mlockModel,
+			Grammar:      grammar,
+		})
+		return fileTranscriber.Run()
 	}
 
 	if *pttMode {
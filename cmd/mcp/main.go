@@ -18,8 +18,14 @@ var (
 var (
 	modelName       = flag.String("model", "", "Use a specific model (default: vosk-model-small-en-us-0.15)")
 	enableVAD       = flag.Bool("vad", true, "Enable Voice Activity Detection")
-	vadThreshold    = flag.Float64("vad-threshold", 0.001, "VAD energy threshold (0.001-0.1, lower=more sensitive)")
+	vadMode         = flag.String("vad-mode", "energy", "VAD detector: energy or spectral")
+	vadAdaptive     = flag.Bool("vad-adaptive", true, "Derive the VAD threshold from the tracked noise floor (--vad-threshold becomes the minimum)")
+	vadThreshold    = flag.Float64("vad-threshold", 0.01, "VAD energy threshold (0.001-0.1, lower=more sensitive)")
 	vadSilenceDelay = flag.Float64("vad-silence-delay", 5.0, "Delay in seconds after last speech before returning to silence")
+	modelMemory     = flag.Int("model-memory-mb", 0, "Memory budget (MB) for models loaded on request; least recently used idle models are evicted beyond it (0 = no limit)")
+	inputSource     = flag.String("input", "", "Read audio from a 16-bit WAV (any rate/channels) or 16kHz mono raw PCM file instead of the microphone")
+	inputPacing     = flag.String("pacing", "realtime", "Pacing of --input audio: realtime, or fast for throughput runs")
+	mlockModel      = flag.Bool("mlock-model", false, "Lock the model files in memory (needs a sufficient locked memory limit, ulimit -l) so they are never paged out")
 	showVersion     = flag.Bool("version", false, "Show version information")
 )
 
@@ -34,7 +40,20 @@ func main() {
 		os.Exit(0)
 	}
 
-	handler := app.NewMCPHandler(*modelName, Version, GitCommit, *vadThreshold, *vadSilenceDelay, *enableVAD)
+	handler := app.NewMCPHandler(app.MCPHandlerConfig{
+		ModelName:       *modelName,
+		Version:         Version,
+		GitCommit:       GitCommit,
+		VADMode:         *vadMode,
+		VADAdaptive:     *vadAdaptive,
+		VADThreshold:    *vadThreshold,
+		VADSilenceDelay: *vadSilenceDelay,
+		VADEnabled:      *enableVAD,
+		ModelMemoryMB:   *modelMemory,
+		AudioSource:     *inputSource,
+		AudioPacing:     *inputPacing,
+		LockModel:       *mlockModel,
+	})
 	if err := handler.Run(); err != nil {
 		fmt.Fprintf(os.Stderr, "MCP server error: %v\n", err)
 		os.Exit(1)
@@ -8,7 +8,6 @@ import (
 	"syscall"
 
 	"github.com/emmett/vox/internal/app"
-	"github.com/emmett/vox/internal/models"
 	grpcserver "github.com/emmett/vox/internal/server/grpc"
 )
 
@@ -19,9 +18,18 @@ var (
 	GitBranch = "unknown"
 )
 
+// sessionDefaults supplies the defaults of the stream admission flags
+var sessionDefaults = grpcserver.DefaultSessionConfig()
+
 var (
 	port        = flag.Int("port", 50051, "gRPC server port")
 	modelName   = flag.String("model", "", "STT model name (default: vosk-model-small-en-us-0.15)")
+	modelMemory = flag.Int("model-memory-mb", 0, "Memory budget (MB) for STT models loaded on request; least recently used idle models are evicted beyond it (0 = no limit)")
+	mlockModel  = flag.Bool("mlock-model", false, "Lock STT model files in memory (needs a sufficient locked memory limit, ulimit -l) so they are never paged out")
+	maxSessions = flag.Int("max-sessions", sessionDefaults.MaxSessions, "Maximum number of transcription streams decoding at once")
+	maxQueued   = flag.Int("max-queued", sessionDefaults.MaxQueue, "Maximum number of streams waiting for a session; further streams are rejected with RESOURCE_EXHAUSTED")
+	queueWait   = flag.Duration("queue-timeout", sessionDefaults.QueueTimeout, "How long a stream waits for a session before it is rejected with RESOURCE_EXHAUSTED (0 = until the client gives up)")
+	idleTimeout = flag.Duration("idle-timeout", sessionDefaults.IdleTimeout, "End transcription streams that send no audio for this long (0 = never)")
 	ttsModel    = flag.String("tts-model", "", "TTS model path (piper .onnx file)")
 	showVersion = flag.Bool("version", false, "Show version information")
 )
@@ -53,19 +61,20 @@ func main() {
 		os.Exit(1)
 	}
 
-	// Get model path
-	modelPath, err := models.GetModelPath(selectedModel)
-	if err != nil {
-		fmt.Fprintf(os.Stderr, "Error getting model path: %v\n", err)
-		os.Exit(1)
-	}
-
 	fmt.Printf("Using model: %s\n", selectedModel)
 
 	// Create and start server
 	cfg := grpcserver.Config{
 		Port:         *port,
-		STTModelPath: modelPath,
+		STTModel:     selectedModel,
+		STTMemory:    int64(*modelMemory) << 20,
+		LockSTTModel: *mlockModel,
+		Sessions: grpcserver.SessionConfig{
+			MaxSessions:  *maxSessions,
+			MaxQueue:     *maxQueued,
+			QueueTimeout: *queueWait,
+			IdleTimeout:  *idleTimeout,
+		},
 		TTSModelPath: *ttsModel,
 	}
 
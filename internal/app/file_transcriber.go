@@ -0,0 +1,202 @@
+package app
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"os/signal"
+	"strings"
+	"syscall"
+	"time"
+
+	"github.com/emmett/vox/internal/audio"
+	"github.com/emmett/vox/internal/models"
+	"github.com/emmett/vox/internal/output"
+	"github.com/emmett/vox/internal/stt"
+)
+
+// FileTranscriberConfig holds configuration for transcribing recordings
+type FileTranscriberConfig struct {
+	ModelName    string
+	Files        []string
+	Jobs         int
+	OutputFormat string
+	OutputFile   string
+	VADMode      string
+	VADAdaptive  bool
+	VADThreshold float64
+	AutoDownload bool
+	LockModel    bool     // Lock the model files in memory
+	Grammar      []string // Phrases to restrict recognition to, if set
+}
+
+// FileTranscriber transcribes recorded files in parallel
+// Files are split at silence and their speech decoded by Jobs recognizers
+// sharing one model; results are written in file order with offsets.
+type FileTranscriber struct {
+	config FileTranscriberConfig
+}
+
+// fileResult is the outcome of transcribing one file
+type fileResult struct {
+	results []stt.TimedResult
+	audio   time.Duration
+	err     error
+}
+
+// NewFileTranscriber creates a new FileTranscriber instance
+func NewFileTranscriber(config FileTranscriberConfig) *FileTranscriber {
+	return &FileTranscriber{config: config}
+}
+
+// Run transcribes the configured files
+func (f *FileTranscriber) Run() error {
+	if len(f.config.Files) == 0 {
+		return fmt.Errorf("no files to transcribe")
+	}
+
+	// Status goes to stderr, keeping stdout for transcripts
+	statusOut := output.NewConsoleOutput(output.ConsoleConfig{
+		ShowTimestamp: true,
+		Writer:        os.Stderr,
+	})
+
+	mgr := NewModelManager()
+	selectedModel, err := mgr.SelectModel(f.config.ModelName, false)
+	if err != nil {
+		return fmt.Errorf("failed to select model: %w", err)
+	}
+	selectedModel, err = mgr.EnsureModel(selectedModel, f.config.AutoDownload)
+	if err != nil {
+		return err
+	}
+	modelPath, err := models.GetModelPath(selectedModel)
+	if err != nil {
+		return fmt.Errorf("failed to get model path: %w", err)
+	}
+
+	statusOut.Info(fmt.Sprintf("Loading model: %s", selectedModel))
+	model, err := stt.LoadModel(modelPath, f.config.LockModel)
+	if err != nil {
+		return fmt.Errorf("failed to initialize STT engine: %w", err)
+	}
+	defer model.Release()
+	statusOut.Info(fmt.Sprintf("Model %s", model.LoadStats()))
+
+	parallelConfig := stt.DefaultParallelConfig()
+	if f.config.Jobs > 0 {
+		parallelConfig.Jobs = f.config.Jobs
+	}
+	vadMode, err := audio.ParseVADMode(f.config.VADMode)
+	if err != nil {
+		return err
+	}
+	parallelConfig.Grammar = f.config.Grammar
+	parallelConfig.Segmenter.VAD.Mode = vadMode
+	parallelConfig.Segmenter.VAD.AdaptiveThreshold = f.config.VADAdaptive
+	if f.config.VADThreshold > 0 {
+		parallelConfig.Segmenter.VAD.EnergyThreshold = f.config.VADThreshold
+	}
+
+	transcriber, err := stt.NewParallelTranscriber(model, parallelConfig)
+	if err != nil {
+		return fmt.Errorf("failed to create recognizers: %w", err)
+	}
+	defer transcriber.Close()
+
+	// Determine output writer
+	writer := os.Stdout
+	if f.config.OutputFile != "" {
+		outFile, err := os.Create(f.config.OutputFile)
+		if err != nil {
+			return fmt.Errorf("failed to create output file: %w", err)
+		}
+		defer outFile.Close()
+		writer = outFile
+	}
+
+	var formatter output.Formatter
+	switch strings.ToLower(f.config.OutputFormat) {
+	case "json":
+		formatter = output.NewJSONFormatter(writer)
+	case "text", "console":
+		formatter = output.NewPlainTextFormatter(writer)
+	default:
+		return fmt.Errorf("unknown output format: %s (valid: console, json, text)", f.config.OutputFormat)
+	}
+	defer formatter.Close()
+
+	ctx, cancel := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	defer cancel()
+
+	statusOut.Info(fmt.Sprintf("Transcribing %d file(s) with %d recognizers", len(f.config.Files), parallelConfig.Jobs))
+	start := time.Now()
+
+	// Up to Jobs files are loaded and segmented at once, so small files keep
+	// every recognizer busy; results are still written in file order
+	done := make([]chan fileResult, len(f.config.Files))
+	slots := make(chan struct{}, parallelConfig.Jobs)
+	for i, path := range f.config.Files {
+		done[i] = make(chan fileResult, 1)
+		go func(path string, done chan<- fileResult) {
+			select {
+			case slots <- struct{}{}:
+			case <-ctx.Done():
+				done <- fileResult{err: ctx.Err()}
+				return
+			}
+			defer func() { <-slots }()
+
+			pcm, err := audio.ReadPCMFile(path, parallelConfig.SampleRate)
+			if err != nil {
+				done <- fileResult{err: err}
+				return
+			}
+			results, err := transcriber.Transcribe(ctx, pcm)
+			done <- fileResult{
+				results: results,
+				audio:   time.Duration(len(pcm)/2) * time.Second / time.Duration(parallelConfig.SampleRate),
+				err:     err,
+			}
+		}(path, done[i])
+	}
+
+	var totalAudio time.Duration
+	index := 0
+	failed := 0
+	for i, path := range f.config.Files {
+		result := <-done[i]
+		if result.err != nil {
+			if ctx.Err() != nil {
+				return ctx.Err()
+			}
+			statusOut.Error(fmt.Sprintf("%s: %v", path, result.err))
+			failed++
+			continue
+		}
+		totalAudio += result.audio
+		for _, r := range result.results {
+			index++
+			start, end := r.Start.Seconds(), r.End.Seconds()
+			formatter.WriteResult(output.TranscriptionResult{
+				Index:      index,
+				Text:       r.Text,
+				Confidence: r.Confidence,
+				Timestamp:  time.Now(),
+				Source:     path,
+				Start:      &start,
+				End:        &end,
+			})
+		}
+	}
+	formatter.Flush()
+
+	elapsed := time.Since(start)
+	statusOut.Info(fmt.Sprintf("Transcribed %v of audio in %v (%.1fx real time)",
+		totalAudio.Round(time.Millisecond), elapsed.Round(time.Millisecond), totalAudio.Seconds()/elapsed.Seconds()))
+
+	if failed > 0 {
+		return fmt.Errorf("%d of %d files failed", failed, len(f.config.Files))
+	}
+	return nil
+}
@@ -1,50 +1,56 @@
 package app
 
 import (
+	"context"
 	"encoding/json"
 	"fmt"
 	"os"
 	"os/signal"
 	"syscall"
+	"time"
 
 	"github.com/emmett/vox/internal/models"
 	"github.com/emmett/vox/internal/server/mcp"
 )
 
+// MCPHandlerConfig holds configuration for the MCP server
+type MCPHandlerConfig struct {
+	ModelName       string
+	Version         string
+	GitCommit       string
+	VADMode         string
+	VADAdaptive     bool
+	VADThreshold    float64
+	VADSilenceDelay float64
+	VADEnabled      bool
+	ModelMemoryMB   int
+	AudioSource     string // Recorded input file instead of the microphone (stdin is the MCP transport)
+	AudioPacing     string
+	LockModel       bool
+}
+
 // MCPHandler handles MCP server operations
 type MCPHandler struct {
-	modelName       string
-	version         string
-	gitCommit       string
-	vadThreshold    float64
-	vadSilenceDelay float64
-	vadEnabled      bool
+	config MCPHandlerConfig
 }
 
 // NewMCPHandler creates a new MCP handler
-func NewMCPHandler(modelName, version, gitCommit string, vadThreshold, vadSilenceDelay float64, vadEnabled bool) *MCPHandler {
-	return &MCPHandler{
-		modelName:       modelName,
-		version:         version,
-		gitCommit:       gitCommit,
-		vadThreshold:    vadThreshold,
-		vadSilenceDelay: vadSilenceDelay,
-		vadEnabled:      vadEnabled,
-	}
+func NewMCPHandler(config MCPHandlerConfig) *MCPHandler {
+	return &MCPHandler{config: config}
 }
 
 // Run starts the MCP server
 func (h *MCPHandler) Run() error {
 	fmt.Fprintf(os.Stderr, "Starting MCP server...\n")
 	fmt.Fprintf(os.Stderr, "Protocol: Model Context Protocol (stdio transport)\n")
-	fmt.Fprintf(os.Stderr, "Version: %s (commit: %s)\n\n", h.version, h.gitCommit)
+	fmt.Fprintf(os.Stderr, "Version: %s (commit: %s)\n\n", h.config.Version, h.config.GitCommit)
 
 	// Get default model
 	var modelPath string
 	var selectedModel string
 
-	if h.modelName != "" {
-		selectedModel = h.modelName
+	if h.config.ModelName != "" {
+		selectedModel = h.config.ModelName
 	} else {
 		var err error
 		selectedModel, err = models.GetDefaultModel()
@@ -123,12 +129,17 @@ func (h *MCPHandler) Run() error {
 	// Create MCP server
 	serverConfig := mcp.Config{
 		ServerName:      "vox-mcp",
-		ServerVersion:   h.version,
-		ModelPath:       modelPath,
+		ServerVersion:   h.config.Version,
 		DefaultModel:    selectedModel,
-		VADThreshold:    h.vadThreshold,
-		VADSilenceDelay: h.vadSilenceDelay,
-		VADEnabled:      h.vadEnabled,
+		ModelMemory:     int64(h.config.ModelMemoryMB) << 20,
+		VADMode:         h.config.VADMode,
+		VADAdaptive:     h.config.VADAdaptive,
+		VADThreshold:    h.config.VADThreshold,
+		VADSilenceDelay: h.config.VADSilenceDelay,
+		VADEnabled:      h.config.VADEnabled,
+		AudioSource:     h.config.AudioSource,
+		AudioPacing:     h.config.AudioPacing,
+		LockModel:       h.config.LockModel,
 	}
 
 	server, err := mcp.NewServer(serverConfig)
@@ -149,6 +160,17 @@ func (h *MCPHandler) Run() error {
 	fmt.Fprintf(os.Stderr, "MCP server ready. Listening on stdin/stdout...\n")
 	fmt.Fprintf(os.Stderr, "Press Ctrl+C to stop.\n\n")
 
+	// Report when the model finishes loading in the background
+	go func() {
+		start := time.Now()
+		stats, err := server.WaitReady(context.Background())
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Error: %v\n", err)
+			return
+		}
+		fmt.Fprintf(os.Stderr, "Model %s %s, ready in %v\n", selectedModel, stats, time.Since(start).Round(time.Millisecond))
+	}()
+
 	// Wait for shutdown signal or error
 	select {
 	case <-sigChan:
@@ -63,19 +63,23 @@ func (p *PTTTranscriber) Run() error {
 	}
 
 	// Select audio device
-	deviceMgr := NewDeviceManager()
-	selectedDevice, err := deviceMgr.SelectDevice(p.config.AudioDevice)
+	deviceID, _, err := selectInput(p.config.TranscriberConfig)
 	if err != nil {
 		return err
 	}
 
 	// Initialize STT engine
 	fmt.Println("Initializing speech recognition engine...")
-	p.engine = stt.NewVoskEngine()
+	engine := stt.NewVoskEngine()
+	p.engine = engine
 	sttConfig := stt.DefaultConfig(modelPath)
+	sttConfig.SkipPartials = true // Only the final result is printed
+	sttConfig.LockModel = p.config.LockModel
+	sttConfig.Grammar = p.config.Grammar
 	if err := p.engine.Initialize(sttConfig); err != nil {
 		return fmt.Errorf("failed to initialize STT engine: %w", err)
 	}
+	fmt.Printf("Model %s\n", engine.LoadStats())
 	defer func() {
 
 		p.engine.Close()
@@ -83,8 +87,9 @@ func (p *PTTTranscriber) Run() error {
 	}()
 
 	// Set up audio config (stored for recreating capturer each session)
-	p.audioConfig = getAudioConfigForModel(selectedModel)
-	p.audioConfig.DeviceID = selectedDevice.ID
+	p.audioConfig, _ = getCalibratedAudioConfig(p.engine, sttConfig.SampleRate)
+	p.audioConfig.DeviceID = deviceID
+	applyCaptureConfig(p.config.TranscriberConfig, &p.audioConfig)
 
 	// Status output
 	p.statusOut = output.DefaultConsoleOutput()
@@ -207,6 +212,7 @@ func (p *PTTTranscriber) collectSamples(ctx context.Context) {
 				return
 			}
 			p.audioBuffer = append(p.audioBuffer, sample.Data...)
+			sample.Release()
 		case err, ok := <-p.capturer.Errors():
 			if !ok {
 				return
@@ -20,11 +20,23 @@ type TranscriberConfig struct {
 	ModelName       string
 	OutputFormat    string
 	OutputFile      string
+	PartialInterval float64 // Minimum seconds between partial results
 	EnableVAD       bool
+	VADMode         string
+	VADAdaptive     bool
 	VADThreshold    float64
 	VADSilenceDelay float64
+	VADPreRoll      float64
+	Endpointing     string  // "vad" or "decoder"
+	EndpointSilence float64 // Trailing silence (seconds) for decoder endpointing
 	AudioDevice     string
 	AutoDownload    bool
+	OverflowPolicy  string
+	OverflowBudget  int
+	AudioSource     string // Recorded input (file or "-" for stdin) instead of a device
+	AudioPacing     string
+	LockModel       bool     // Lock the model files in memory
+	Grammar         []string // Phrases to restrict recognition to, if set
 }
 
 // Transcriber orchestrates the transcription process
@@ -39,6 +51,15 @@ func NewTranscriber(config TranscriberConfig) *Transcriber {
 
 // Run starts the transcription session
 func (t *Transcriber) Run() error {
+	// Decoder endpointing measures trailing silence with the VAD
+	endpointMode, err := stt.ParseEndpointMode(t.config.Endpointing)
+	if err != nil {
+		return err
+	}
+	if endpointMode == stt.EndpointDecoder && !t.config.EnableVAD {
+		return fmt.Errorf("decoder endpointing requires the VAD (use --vad, or --endpointing vad)")
+	}
+
 	mgr := NewModelManager()
 
 	// Determine which model to use
@@ -62,8 +83,7 @@ func (t *Transcriber) Run() error {
 	}
 
 	// Select audio device
-	deviceMgr := NewDeviceManager()
-	selectedDevice, err := deviceMgr.SelectDevice(t.config.AudioDevice)
+	deviceID, inputName, err := selectInput(t.config)
 	if err != nil {
 		return err
 	}
@@ -72,16 +92,21 @@ func (t *Transcriber) Run() error {
 	fmt.Println("Initializing speech recognition engine...")
 	engine := stt.NewVoskEngine()
 	sttConfig := stt.DefaultConfig(modelPath)
+	sttConfig.LockModel = t.config.LockModel
+	sttConfig.Grammar = t.config.Grammar
+	sttConfig.PartialInterval = time.Duration(t.config.PartialInterval * float64(time.Second))
 	if err := engine.Initialize(sttConfig); err != nil {
 		return fmt.Errorf("failed to initialize STT engine: %w", err)
 	}
 	defer engine.Close()
+	fmt.Printf("Model %s\n", engine.LoadStats())
 
-	// Select audio configuration based on model size
-	audioConfig := getAudioConfigForModel(selectedModel)
+	// Size the audio buffer from the model's measured decode speed
+	audioConfig, calibratedRTF := getCalibratedAudioConfig(engine, sttConfig.SampleRate)
 
 	// Set the selected device
-	audioConfig.DeviceID = selectedDevice.ID
+	audioConfig.DeviceID = deviceID
+	applyCaptureConfig(t.config, &audioConfig)
 
 	fmt.Printf("Audio buffer: %d samples (%.1f seconds at 16kHz)\n",
 		audioConfig.SampleBufferSize,
@@ -137,8 +162,12 @@ func (t *Transcriber) Run() error {
 
 	statusOut.Info("Speech recognition ready!")
 	statusOut.Info(fmt.Sprintf("Listening on %s (sample rate: %d Hz, channels: %d)",
-		selectedDevice.Name, audioConfig.SampleRate, audioConfig.Channels))
-	statusOut.Info("Speak into your microphone. Press Ctrl+C to stop.")
+		inputName, audioConfig.SampleRate, audioConfig.Channels))
+	if t.config.AudioSource != "" {
+		statusOut.Info("Transcribing recorded input. Press Ctrl+C to stop.")
+	} else {
+		statusOut.Info("Speak into your microphone. Press Ctrl+C to stop.")
+	}
 
 	// Only show transcription header in console mode
 	if formatter == nil {
@@ -166,30 +195,112 @@ func (t *Transcriber) Run() error {
 		return fmt.Errorf("failed to start capture: %w", err)
 	}
 	defer capturer.Stop()
+	samples := capturer.Samples()
+	captureErrors := capturer.Errors()
 
 	// Initialize VAD if enabled
-	var vad *audio.VAD
+	var vad audio.VAD
+	var vadMode audio.VADMode
+	var preRoll *audio.PreRoll
 	if t.config.EnableVAD {
+		vadMode, err = audio.ParseVADMode(t.config.VADMode)
+		if err != nil {
+			return err
+		}
 		vadConfig := audio.DefaultVADConfig()
+		vadConfig.Mode = vadMode
+		vadConfig.SampleRate = sttConfig.SampleRate
 		vadConfig.EnergyThreshold = t.config.VADThreshold
-		// Convert silence delay (seconds) to frames
-		// Assuming 30ms per frame (16kHz, ~480 samples per frame)
-		framesPerSecond := 33.33 // ~30ms per frame
-		vadConfig.SilenceFrames = int(t.config.VADSilenceDelay * framesPerSecond)
-		vad = audio.NewVAD(vadConfig)
-		statusOut.Info(fmt.Sprintf("Voice Activity Detection enabled (threshold: %.4f, silence delay: %.1fs)", t.config.VADThreshold, t.config.VADSilenceDelay))
+		vadConfig.AdaptiveThreshold = t.config.VADAdaptive
+		vadConfig.SilenceDuration = time.Duration(t.config.VADSilenceDelay * float64(time.Second))
+		vadConfig.PreRoll = time.Duration(t.config.VADPreRoll * float64(time.Second))
+		preRoll = audio.NewPreRoll(vadConfig.PreRoll, vadConfig.SampleRate)
+		vad, err = audio.NewVAD(vadConfig)
+		if err != nil {
+			return fmt.Errorf("failed to create VAD: %w", err)
+		}
+		thresholdDesc := fmt.Sprintf("threshold: %.4f", t.config.VADThreshold)
+		if vadConfig.AdaptiveThreshold {
+			thresholdDesc = fmt.Sprintf("adaptive threshold, minimum %.4f", t.config.VADThreshold)
+		}
+		statusOut.Info(fmt.Sprintf("Voice Activity Detection enabled (mode: %s, %s, silence delay: %.1fs, pre-roll: %v)",
+			vadConfig.Mode, thresholdDesc, t.config.VADSilenceDelay, vadConfig.PreRoll))
 	}
 
+	// Decoder endpointing finalizes utterances on the recognizer's endpoints
+	// and short trailing silence, using the VAD to measure the silence
+	var endpointer *stt.Endpointer
+	if endpointMode == stt.EndpointDecoder {
+		endpointConfig := stt.DefaultEndpointConfig(sttConfig.SampleRate)
+		if t.config.EndpointSilence > 0 {
+			endpointConfig.TrailingSilence = time.Duration(t.config.EndpointSilence * float64(time.Second))
+			endpointConfig.MaxTrailingSilence = max(endpointConfig.MaxTrailingSilence, 2*endpointConfig.TrailingSilence)
+		}
+		endpointer = stt.NewEndpointer(endpointConfig)
+		statusOut.Info(fmt.Sprintf("Decoder endpointing enabled (trailing silence: %v, max: %v)",
+			endpointConfig.TrailingSilence, endpointConfig.MaxTrailingSilence))
+	}
+
+	// Batch capture frames before they reach the recognizer, and keep
+	// re-sizing the capture buffer from the measured decode speed
+	tuner := audio.NewBufferTuner(audioConfig, calibratedRTF)
+	batchConfig := stt.DefaultBatchConfig(sttConfig.SampleRate)
+	batchConfig.OnProcess = func(audioTime, processing time.Duration) {
+		if size, changed := tuner.Observe(audioTime, processing); changed {
+			capturer.SetSampleBufferSize(size)
+		}
+	}
+	batcher := stt.NewBatcher(engine, batchConfig)
+
 	// Track state
 	var lastPartialText string
 	var transcriptionCount int
+	var levels audio.FrameStats
+	var samplesCaptured, samplesDecoded int
+	var endpoints int
+	var endpointLatency, maxEndpointLatency time.Duration
+
+	// writeFinal outputs an utterance's final result; utterances ended by the
+	// endpointer also report the rule and the latency after end of speech
+	writeFinal := func(result *stt.Result, endpoint stt.Endpoint, latency time.Duration) {
+		transcriptionCount++
+		if endpoint.Reason != stt.EndpointNone {
+			endpoints++
+			endpointLatency += latency
+			maxEndpointLatency = max(maxEndpointLatency, latency)
+		}
+
+		if formatter != nil {
+			formatter.WriteResult(output.TranscriptionResult{
+				Index:      transcriptionCount,
+				Text:       result.Text,
+				Confidence: result.Confidence,
+				Timestamp:  time.Now(),
+				Partial:    false,
+				Endpoint:   string(endpoint.Reason),
+				LatencyMs:  float64(latency.Microseconds()) / 1000,
+			})
+		} else {
+			// Console output: clear partial result line
+			fmt.Printf("\r%s\r", strings.Repeat(" ", 80))
+			fmt.Printf("[%d] %s", transcriptionCount, result.Text)
+			if result.Confidence > 0 {
+				fmt.Printf(" (confidence: %.2f)", result.Confidence)
+			}
+			if endpoint.Reason != stt.EndpointNone {
+				fmt.Printf(" [%s endpoint, +%v]", endpoint.Reason, latency.Round(time.Millisecond))
+			}
+			fmt.Println()
+		}
+		lastPartialText = ""
+	}
 
 	// Process audio samples
 	for {
 		select {
 		case <-ctx.Done():
-			// Get final result
-			finalResult, err := engine.FinalResult()
+			// Get final result (ctx is already cancelled, flush without it)
+			finalResult, err := flushAndFinalize(context.Background(), batcher, engine)
 			if err == nil && finalResult.Text != "" {
 				if formatter != nil {
 					// Write final result to formatter
@@ -218,21 +329,64 @@ func (t *Transcriber) Run() error {
 			}
 			statusOut.Info("Transcription stopped")
 			statusOut.Info(fmt.Sprintf("Total transcriptions: %d", transcriptionCount))
+			captureStats := capturer.Stats()
+			statusOut.Info(fmt.Sprintf("Frame pool: %d allocated, %d reused, %d outstanding",
+				captureStats.FramePool.Allocs, captureStats.FramePool.Reuses, captureStats.FramePool.Outstanding))
+			statusOut.Info(fmt.Sprintf("Capture overflow (%s): %d frames dropped (%v), peak queue depth %d of %d",
+				audioConfig.OverflowPolicy, captureStats.DroppedFrames, captureStats.DroppedDuration,
+				captureStats.PeakQueueDepth, captureStats.SampleBufferSize))
+			statusOut.Info(fmt.Sprintf("Input level: RMS %.4f, peak %.3f, %d clipped samples",
+				levels.RMS(), levels.PeakLevel(), levels.Clipped))
+			if levels.Clipped > 0 {
+				statusOut.Info("Input clipped - consider lowering the microphone gain")
+			}
+			if vad != nil && vad.NoiseFloor() > 0 {
+				statusOut.Info(fmt.Sprintf("VAD noise floor: %.6f, threshold: %.6f", vad.NoiseFloor(), vad.Threshold()))
+			}
+			if vad != nil && samplesCaptured > 0 {
+				statusOut.Info(fmt.Sprintf("VAD (%s): %v of %v audio sent to the recognizer (%.1f%%)",
+					vadMode, samplesDuration(samplesDecoded, sttConfig.SampleRate), samplesDuration(samplesCaptured, sttConfig.SampleRate),
+					100*float64(samplesDecoded)/float64(samplesCaptured)))
+			}
+			if endpoints > 0 {
+				statusOut.Info(fmt.Sprintf("Endpointing (%s): %d utterances, latency after speech mean %v, max %v",
+					endpointMode, endpoints, (endpointLatency / time.Duration(endpoints)).Round(time.Millisecond),
+					maxEndpointLatency.Round(time.Millisecond)))
+			}
+			batchStats := batcher.Stats()
+			statusOut.Info(fmt.Sprintf("Decoder %s: RTF %.3f (%v audio in %d calls, batch %v)",
+				selectedModel, batchStats.RTF(), batchStats.Audio.Round(time.Millisecond), batchStats.Calls, batchStats.Chunk))
+			if resetStats := engine.ResetStats(); resetStats.Resets > 0 {
+				statusOut.Info(fmt.Sprintf("Recognizer resets: %d, mean %v, max %v",
+					resetStats.Resets, resetStats.Mean(), resetStats.Max))
+			}
 			return nil
 
-		case sample, ok := <-capturer.Samples():
+		case sample, ok := <-samples:
 			if !ok {
-				return nil
+				// A recorded input ended, finish up as on Ctrl+C
+				samples = nil
+				cancel()
+				continue
 			}
 
+			// Scan the frame once for the VAD, level meter and clipping diagnostics
+			stats := audio.AnalyzeFrame(sample.Data)
+			levels.Add(stats)
+			samplesCaptured += stats.Samples
+
 			// Process VAD if enabled
 			if vad != nil {
-				isSpeaking, speechStarted, speechEnded := vad.ProcessFrame(sample.Data)
+				isSpeaking, speechStarted, speechEnded := vad.ProcessAnalyzed(sample.Data, stats)
 
 				// Debug: show energy levels
-				energy := vad.GetEnergyLevel(sample.Data)
 				if formatter == nil {
-					fmt.Printf("\r[Energy: %.6f, Speaking: %v]", energy, isSpeaking)
+					clipping := ""
+					if stats.Clipped > 0 {
+						clipping = ", CLIPPING"
+					}
+					fmt.Printf("\r[Energy: %.6f, Threshold: %.6f, Noise: %.6f, Peak: %.3f, Speaking: %v%s]",
+						stats.RMS(), vad.Threshold(), vad.NoiseFloor(), stats.PeakLevel(), isSpeaking, clipping)
 				}
 
 				// Handle speech start
@@ -242,6 +396,20 @@ func (t *Transcriber) Run() error {
 					} else {
 						fmt.Printf("\n[Speech detected]\n")
 					}
+
+					// Replay the audio that led up to speech start, so the
+					// recognizer also hears the onset the VAD spent confirming.
+					// The batcher is empty between utterances, so the pre-roll
+					// is decoded straight from its ring without copying.
+					first, second := preRoll.Spans()
+					result, err := engine.ProcessAudioSpans(ctx, first, second)
+					samplesDecoded += (len(first) + len(second)) / 2
+					preRoll.Reset()
+					if err != nil {
+						statusOut.Error(fmt.Sprintf("STT error: %v", err))
+					} else if result != nil && !result.Partial && result.Text != "" {
+						writeFinal(result, stt.Endpoint{}, 0)
+					}
 				}
 
 				// Handle speech end - finalize current utterance
@@ -253,30 +421,16 @@ func (t *Transcriber) Run() error {
 					}
 
 					// Get final result for this utterance
-					finalResult, err := engine.FinalResult()
+					finalResult, err := flushAndFinalize(ctx, batcher, engine)
 					if err == nil && finalResult.Text != "" {
-						transcriptionCount++
-
-						if formatter != nil {
-							formatter.WriteResult(output.TranscriptionResult{
-								Index:      transcriptionCount,
-								Text:       finalResult.Text,
-								Confidence: finalResult.Confidence,
-								Timestamp:  time.Now(),
-								Partial:    false,
-							})
-						} else {
-							// Clear partial text
-							fmt.Printf("\r%s\r", strings.Repeat(" ", 80))
-							fmt.Printf("[%d] %s", transcriptionCount, finalResult.Text)
-							if finalResult.Confidence > 0 {
-								fmt.Printf(" (confidence: %.2f)", finalResult.Confidence)
-							}
-							fmt.Println()
-						}
+						writeFinal(finalResult, stt.Endpoint{}, 0)
 					}
 
+					batcher.Reset()
 					engine.Reset()
+					if endpointer != nil {
+						endpointer.Reset()
+					}
 					// Reset for next utterance
 					if formatter != nil {
 						formatter.WriteEvent("stt", "Ready for next utterance")
@@ -284,22 +438,50 @@ func (t *Transcriber) Run() error {
 						fmt.Printf("\n[Ready for next utterance]\n")
 					}
 					lastPartialText = ""
+					sample.Release()
 					continue
 				}
 
-				// Skip processing during silence
+				// Skip processing during silence, keeping it as pre-roll
 				if !isSpeaking {
+					preRoll.Add(sample.Data)
+					sample.Release()
 					continue
 				}
 			}
 
-			// Process audio through STT engine
-			result, err := engine.ProcessAudio(ctx, sample.Data)
+			// Process audio through STT engine, batching frames while it keeps up
+			samplesDecoded += stats.Samples
+			result, err := batcher.Add(ctx, sample.Data, len(capturer.Samples()))
+			sample.Release()
 			if err != nil {
 				statusOut.Error(fmt.Sprintf("STT error: %v", err))
 				continue
 			}
 
+			var endpoint stt.Endpoint
+			if endpointer != nil {
+				endpoint = endpointer.Observe(stats.Samples, result, vad.TrailingSilence())
+				if endpoint.Reason != stt.EndpointNone && endpoint.Reason != stt.EndpointFinal {
+					// The speaker is done: finalize now instead of waiting out
+					// the VAD silence delay, and listen for the next utterance
+					start := time.Now()
+					finalResult, err := flushAndFinalize(ctx, batcher, engine)
+					if err == nil && finalResult.Text != "" {
+						writeFinal(finalResult, endpoint, endpoint.TrailingSilence+time.Since(start))
+					}
+					batcher.Reset()
+					engine.Reset()
+					endpointer.Reset()
+					vad.Reset()
+					preRoll.Reset()
+					continue
+				}
+				if endpoint.Reason == stt.EndpointFinal {
+					endpointer.Reset()
+				}
+			}
+
 			if result == nil {
 				continue
 			}
@@ -321,59 +503,90 @@ func (t *Transcriber) Run() error {
 
 			// Handle final results (complete phrases/sentences)
 			if !result.Partial && result.Text != "" {
-				transcriptionCount++
-
-				if formatter != nil {
-					// Write to formatter
-					formatter.WriteResult(output.TranscriptionResult{
-						Index:      transcriptionCount,
-						Text:       result.Text,
-						Confidence: result.Confidence,
-						Timestamp:  time.Now(),
-						Partial:    false,
-					})
-				} else {
-					// Console output: clear partial result line
-					fmt.Printf("\r%s\r", strings.Repeat(" ", 80))
-
-					// Print final transcription
-					fmt.Printf("[%d] %s", transcriptionCount, result.Text)
-					if result.Confidence > 0 {
-						fmt.Printf(" (confidence: %.2f)", result.Confidence)
-					}
-					fmt.Println()
-				}
-
-				lastPartialText = ""
+				writeFinal(result, endpoint, endpoint.TrailingSilence)
 			}
 
-		case err, ok := <-capturer.Errors():
+		case err, ok := <-captureErrors:
 			if !ok {
-				return nil
+				captureErrors = nil
+				continue
 			}
 			statusOut.Error(fmt.Sprintf("Capture error: %v", err))
 		}
 	}
 }
 
-// getAudioConfigForModel selects the appropriate audio configuration based on model size
-func getAudioConfigForModel(modelName string) audio.CaptureConfig {
-	modelLower := strings.ToLower(modelName)
+// flushAndFinalize sends batched audio to the engine and returns the utterance's final result
+// A final result produced by the flush itself is merged into the returned text.
+func flushAndFinalize(ctx context.Context, batcher *stt.Batcher, engine stt.Engine) (*stt.Result, error) {
+	flushed, flushErr := batcher.Flush(ctx)
 
-	// Large model detection (1.8GB model or "large" in name)
-	if strings.Contains(modelLower, "vosk-model-en-us-0.22") && !strings.Contains(modelLower, "lgraph") {
-		fmt.Println("[INFO] Large model detected - using large buffer configuration")
-		return audio.LargeModelConfig()
+	finalResult, err := engine.FinalResult()
+	if err != nil {
+		return nil, err
+	}
+	if flushErr == nil && flushed != nil && !flushed.Partial && flushed.Text != "" {
+		finalResult.Text = strings.TrimSpace(flushed.Text + " " + finalResult.Text)
+		if finalResult.Confidence == 0 {
+			finalResult.Confidence = flushed.Confidence
+		}
 	}
+	return finalResult, nil
+}
+
+// applyCaptureConfig copies overflow and input settings from the transcriber config to a capture config
+func applyCaptureConfig(config TranscriberConfig, audioConfig *audio.CaptureConfig) {
+	if config.OverflowPolicy != "" {
+		audioConfig.OverflowPolicy = audio.OverflowPolicy(config.OverflowPolicy)
+	}
+	if config.OverflowBudget > 0 {
+		audioConfig.OverflowBudget = config.OverflowBudget
+	}
+	audioConfig.Source = config.AudioSource
+	audioConfig.Pacing = audio.Pacing(config.AudioPacing)
+}
+
+// selectInput picks the capture device, or names the recorded input when one is configured
+func selectInput(config TranscriberConfig) (deviceID, name string, err error) {
+	switch config.AudioSource {
+	case "":
+	case audio.StdinSource:
+		return "", "standard input", nil
+	default:
+		return "", config.AudioSource, nil
+	}
+
+	device, err := NewDeviceManager().SelectDevice(config.AudioDevice)
+	if err != nil {
+		return "", "", err
+	}
+	return device.ID, device.Name, nil
+}
+
+// calibrationDuration is the amount of synthetic audio decoded at startup to measure throughput
+const calibrationDuration = 1 * time.Second
+
+// getCalibratedAudioConfig sizes the capture sample buffer from the engine's measured
+// real-time factor, so custom or renamed models get a buffer that fits their speed
+func getCalibratedAudioConfig(engine stt.Engine, sampleRate int) (audio.CaptureConfig, float64) {
+	audioConfig := audio.DefaultConfig()
 
-	// Medium model detection
-	if strings.Contains(modelLower, "lgraph") ||
-		strings.Contains(modelLower, "medium") {
-		fmt.Println("[INFO] Medium model detected - using medium buffer configuration")
-		return audio.MediumModelConfig()
+	fmt.Println("Calibrating decoder throughput...")
+	rtf, err := stt.MeasureRTF(context.Background(), engine, sampleRate, calibrationDuration)
+	if err != nil {
+		fmt.Printf("[WARN] Calibration failed (%v) - using default buffer configuration\n", err)
+		return audioConfig, 0
 	}
 
-	// Small/default model
-	fmt.Println("[INFO] Small model detected - using default buffer configuration")
-	return audio.DefaultConfig()
+	audioConfig.SampleBufferSize = audio.SampleBufferSizeForRTF(rtf, audioConfig)
+	fmt.Printf("[INFO] Decoder real-time factor: %.3f\n", rtf)
+	return audioConfig, rtf
+}
+
+// samplesDuration converts a count of samples at sampleRate to a duration
+func samplesDuration(samples, sampleRate int) time.Duration {
+	if sampleRate <= 0 {
+		return 0
+	}
+	return (time.Duration(samples) * time.Second / time.Duration(sampleRate)).Round(time.Millisecond)
 }
@@ -52,33 +52,64 @@ func (rb *RingBuffer) Write(data []byte) (int, error) {
 // Read reads up to len(data) bytes from the buffer
 // Returns the number of bytes read
 func (rb *RingBuffer) Read(data []byte) int {
-	rb.mu.Lock()
-	defer rb.mu.Unlock()
+	first, second := rb.Peek(len(data))
+	n := copy(data, first)
+	n += copy(data[n:], second)
+	rb.Commit(n)
+	return n
+}
+
+// Peek returns up to limit readable bytes without consuming them (limit <= 0 means all)
+// The data is returned in place as at most two slices over the internal buffer,
+// second being non-empty only when the readable region wraps around. The slices
+// stay valid until Commit is called, since the writer never touches unread bytes.
+func (rb *RingBuffer) Peek(limit int) (first, second []byte) {
+	rb.mu.RLock()
+	defer rb.mu.RUnlock()
 
-	if rb.readPos == rb.writePos && !rb.full {
-		return 0 // Buffer is empty
+	available := rb.available()
+	if limit <= 0 || limit > available {
+		limit = available
+	}
+	if limit == 0 {
+		return nil, nil
 	}
 
-	bytesRead := 0
-	for i := range data {
-		data[i] = rb.buffer[rb.readPos]
-		rb.readPos = (rb.readPos + 1) % rb.size
-		rb.full = false
-		bytesRead++
+	end := rb.readPos + limit
+	if end <= rb.size {
+		return rb.buffer[rb.readPos:end], nil
+	}
+	return rb.buffer[rb.readPos:], rb.buffer[:end-rb.size]
+}
 
-		if rb.readPos == rb.writePos {
-			break
-		}
+// Commit advances the read position by n bytes after a Peek
+// Returns the number of bytes actually consumed
+func (rb *RingBuffer) Commit(n int) int {
+	rb.mu.Lock()
+	defer rb.mu.Unlock()
+
+	available := rb.available()
+	if n > available {
+		n = available
+	}
+	if n <= 0 {
+		return 0
 	}
 
-	return bytesRead
+	rb.readPos = (rb.readPos + n) % rb.size
+	rb.full = false
+	return n
 }
 
 // Available returns the number of bytes available to read
 func (rb *RingBuffer) Available() int {
 	rb.mu.RLock()
 	defer rb.mu.RUnlock()
+	return rb.available()
+}
 
+// available returns the number of readable bytes; callers must hold the lock
+func (rb *RingBuffer) available() int {
 	if rb.full {
 		return rb.size
 	}
@@ -95,11 +126,7 @@ func (rb *RingBuffer) Free() int {
 	rb.mu.RLock()
 	defer rb.mu.RUnlock()
 
-	if rb.full {
-		return 0
-	}
-
-	return rb.size - rb.Available()
+	return rb.size - rb.available()
 }
 
 // Reset clears the buffer
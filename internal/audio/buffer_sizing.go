@@ -0,0 +1,96 @@
+package audio
+
+import "time"
+
+const (
+	// baseBufferedAudio is the sample buffer kept even for engines far faster than real time
+	baseBufferedAudio = 1500 * time.Millisecond
+
+	// stallWindow is how much audio a decoder burst (e.g. finalizing a long
+	// utterance) may have to process while capture keeps running
+	stallWindow = 10 * time.Second
+
+	// minBufferedAudio and maxBufferedAudio bound the tuned sample buffer
+	minBufferedAudio = 1 * time.Second
+	maxBufferedAudio = 15 * time.Second
+)
+
+// SampleBufferSizeForRTF returns the sample buffer size (in capture periods)
+// needed to absorb decoder stalls for an engine with the given real-time factor
+// (processing time / audio time, e.g. 0.05 for a small model, 0.8 for a large one)
+func SampleBufferSizeForRTF(rtf float64, config CaptureConfig) int {
+	buffered := baseBufferedAudio + time.Duration(rtf*float64(stallWindow))
+	if buffered < minBufferedAudio {
+		buffered = minBufferedAudio
+	}
+	if buffered > maxBufferedAudio {
+		buffered = maxBufferedAudio
+	}
+	return periodsFor(buffered, config)
+}
+
+// maxSampleBufferSize returns the largest sample buffer size a tuner may select
+func maxSampleBufferSize(config CaptureConfig) int {
+	return periodsFor(maxBufferedAudio, config)
+}
+
+// periodsFor converts an audio duration to a number of capture periods (at least 1)
+func periodsFor(d time.Duration, config CaptureConfig) int {
+	period := config.PeriodDuration()
+	if period <= 0 {
+		return 1
+	}
+	periods := int((d + period - 1) / period)
+	if periods < 1 {
+		periods = 1
+	}
+	return periods
+}
+
+// BufferTuner continuously re-derives the sample buffer size from measured decode throughput
+//
+// It keeps an exponentially weighted average of the engine's real-time factor
+// and grows the buffer as soon as the engine slows down, but only shrinks it
+// once the estimate has dropped well below the current size.
+type BufferTuner struct {
+	config CaptureConfig
+	rtf    float64
+	size   int
+}
+
+// NewBufferTuner creates a tuner seeded with a calibrated real-time factor
+func NewBufferTuner(config CaptureConfig, initialRTF float64) *BufferTuner {
+	return &BufferTuner{
+		config: config,
+		rtf:    initialRTF,
+		size:   SampleBufferSizeForRTF(initialRTF, config),
+	}
+}
+
+// Observe records that processing took the given time for the given amount of audio
+// Returns the recommended sample buffer size and whether it changed.
+func (t *BufferTuner) Observe(audio, processing time.Duration) (int, bool) {
+	if audio <= 0 {
+		return t.size, false
+	}
+
+	const alpha = 0.2
+	t.rtf += alpha * (float64(processing)/float64(audio) - t.rtf)
+
+	size := SampleBufferSizeForRTF(t.rtf, t.config)
+	if size > t.size || size < t.size*3/4 {
+		t.size = size
+		return size, true
+	}
+	return t.size, false
+}
+
+// RTF returns the current real-time factor estimate
+func (t *BufferTuner) RTF() float64 {
+	return t.rtf
+}
+
+// Size returns the current recommended sample buffer size
+func (t *BufferTuner) Size() int {
+	return t.size
+}
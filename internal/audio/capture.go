@@ -30,6 +30,22 @@ type CaptureConfig struct {
 	// DeviceID is the audio device identifier
 	// Empty string = use default device
 	DeviceID string
+
+	// OverflowPolicy selects what happens when the sample channel is full
+	// Empty = drop-newest
+	OverflowPolicy OverflowPolicy
+
+	// OverflowBudget is the maximum number of bytes held back by the
+	// coalesce and spill overflow policies (0 = DefaultOverflowBudget)
+	OverflowBudget int
+
+	// Source is a recorded input to read instead of a capture device: a WAV
+	// or raw PCM file, or StdinSource. Empty = capture from DeviceID
+	Source string
+
+	// Pacing selects how fast a recorded Source is delivered
+	// Empty = PacingRealtime
+	Pacing Pacing
 }
 
 // DefaultConfig returns a default configuration optimized for fast/small models
@@ -41,6 +57,8 @@ func DefaultConfig() CaptureConfig {
 		BufferFrames:     480,   // 30ms at 16kHz
 		SampleBufferSize: 50,    // Buffer 50 samples (~1.5 seconds)
 		DeviceID:         "",    // Default device
+		OverflowPolicy:   OverflowDropNewest,
+		OverflowBudget:   DefaultOverflowBudget,
 	}
 }
 
@@ -54,6 +72,8 @@ func MediumModelConfig() CaptureConfig {
 		BufferFrames:     480,   // 30ms at 16kHz
 		SampleBufferSize: 150,   // Buffer 150 samples (~4.5 seconds)
 		DeviceID:         "",    // Default device
+		OverflowPolicy:   OverflowDropNewest,
+		OverflowBudget:   DefaultOverflowBudget,
 	}
 }
 
@@ -67,6 +87,8 @@ func LargeModelConfig() CaptureConfig {
 		BufferFrames:     480,   // 30ms at 16kHz
 		SampleBufferSize: 300,   // Buffer 300 samples (~9 seconds)
 		DeviceID:         "",    // Default device
+		OverflowPolicy:   OverflowDropNewest,
+		OverflowBudget:   DefaultOverflowBudget,
 	}
 }
 
@@ -75,6 +97,64 @@ type AudioSample struct {
 	Data      []byte    // Raw audio data
 	Timestamp time.Time // When the sample was captured
 	Frames    uint32    // Number of audio frames in this sample
+
+	pool *FramePool // Pool Data was taken from, if any
+}
+
+// Release returns the sample's buffer to the capturer's frame pool
+// Data must not be used after Release. Releasing a sample twice, or a sample
+// that was not pooled, is a no-op.
+func (s *AudioSample) Release() {
+	if s.pool != nil && s.Data != nil {
+		s.pool.Put(s.Data)
+	}
+	s.Data = nil
+	s.pool = nil
+}
+
+// FrameBytes returns the size in bytes of one capture period for this configuration
+func (c CaptureConfig) FrameBytes() int {
+	bytesPerSample := int(c.BitDepth / 8)
+	if bytesPerSample == 0 {
+		bytesPerSample = 2
+	}
+	channels := int(c.Channels)
+	if channels == 0 {
+		channels = 1
+	}
+	return int(c.BufferFrames) * channels * bytesPerSample
+}
+
+// PeriodDuration returns the duration of one capture period for this configuration
+func (c CaptureConfig) PeriodDuration() time.Duration {
+	if c.SampleRate == 0 {
+		return 0
+	}
+	return time.Duration(c.BufferFrames) * time.Second / time.Duration(c.SampleRate)
+}
+
+// CaptureStats holds runtime counters for a capturer
+type CaptureStats struct {
+	// FramePool holds the allocation counters of the capture frame pool
+	FramePool FramePoolStats
+
+	// DroppedFrames is the number of audio frames lost to overflow
+	DroppedFrames uint64
+
+	// DroppedDuration is the amount of audio lost to overflow
+	DroppedDuration time.Duration
+
+	// CoalescedFrames is the number of frames merged into larger chunks
+	CoalescedFrames uint64
+
+	// SpilledFrames is the number of frames queued in the spill ring
+	SpilledFrames uint64
+
+	// PeakQueueDepth is the highest number of samples waiting for the consumer
+	PeakQueueDepth int
+
+	// SampleBufferSize is the current sample buffer limit
+	SampleBufferSize int
 }
 
 // Capturer is the interface for audio capture implementations
@@ -93,9 +173,20 @@ type Capturer interface {
 
 	// IsRunning returns true if capture is currently active
 	IsRunning() bool
+
+	// Stats returns runtime counters for the capturer
+	Stats() CaptureStats
+
+	// SetSampleBufferSize changes how many samples may queue for the consumer
+	// before the overflow policy applies; it may be called while running
+	SetSampleBufferSize(size int)
 }
 
 // NewCapturer creates a new audio capturer with the given configuration
+// A configured Source is read from instead of a capture device.
 func NewCapturer(config CaptureConfig) (Capturer, error) {
+	if config.Source != "" {
+		return NewStreamCapturer(config)
+	}
 	return NewMalgoCapturer(config)
 }
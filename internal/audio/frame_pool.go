@@ -0,0 +1,91 @@
+package audio
+
+import "sync/atomic"
+
+// FramePool is a fixed-size allocator for capture frame buffers
+//
+// Buffers are recycled through a bounded free list rather than sync.Pool, so
+// recycled frames survive garbage collections and a capture loop that releases
+// every sample reaches steady-state zero allocation.
+type FramePool struct {
+	frameSize int
+	free      chan []byte
+
+	allocs   atomic.Uint64
+	reuses   atomic.Uint64
+	releases atomic.Uint64
+}
+
+// FramePoolStats holds allocation counters for a FramePool
+type FramePoolStats struct {
+	// Allocs is the number of frame buffers allocated from the heap
+	Allocs uint64
+
+	// Reuses is the number of frames served from the free list
+	Reuses uint64
+
+	// Releases is the number of frames returned to the pool
+	Releases uint64
+
+	// Outstanding is the number of frames handed out and not yet released
+	Outstanding uint64
+}
+
+// NewFramePool creates a pool of frameSize-byte buffers keeping up to capacity free frames
+func NewFramePool(frameSize, capacity int) *FramePool {
+	if capacity < 1 {
+		capacity = 1
+	}
+	return &FramePool{
+		frameSize: frameSize,
+		free:      make(chan []byte, capacity),
+	}
+}
+
+// Get returns a buffer of length n, reusing a released frame when n fits a frame
+// Requests larger than the frame size are allocated outside the pool.
+func (p *FramePool) Get(n int) []byte {
+	if n <= p.frameSize {
+		select {
+		case buf := <-p.free:
+			p.reuses.Add(1)
+			return buf[:n]
+		default:
+		}
+	}
+
+	p.allocs.Add(1)
+	return make([]byte, n, max(n, p.frameSize))
+}
+
+// Put returns a buffer to the pool
+// Only frame-sized buffers are kept: smaller or much larger ones, and any
+// beyond the free list capacity, are left to the GC.
+func (p *FramePool) Put(buf []byte) {
+	p.releases.Add(1)
+	if cap(buf) < p.frameSize || cap(buf) > 2*p.frameSize {
+		return
+	}
+	select {
+	case p.free <- buf[:0]:
+	default:
+	}
+}
+
+// FrameSize returns the size in bytes of pooled frames
+func (p *FramePool) FrameSize() int {
+	return p.frameSize
+}
+
+// Stats returns a snapshot of the pool's allocation counters
+func (p *FramePool) Stats() FramePoolStats {
+	stats := FramePoolStats{
+		Allocs:   p.allocs.Load(),
+		Reuses:   p.reuses.Load(),
+		Releases: p.releases.Load(),
+	}
+	if handedOut := stats.Allocs + stats.Reuses; handedOut > stats.Releases {
+		stats.Outstanding = handedOut - stats.Releases
+	}
+	return stats
+}
@@ -0,0 +1,42 @@
+package audio
+
+import "testing"
+
+func TestFramePoolReuse(t *testing.T) {
+	pool := NewFramePool(960, 4)
+
+	frame := pool.Get(960)
+	pool.Put(frame)
+
+	// A request larger than a frame is allocated without draining the free list
+	large := pool.Get(4 * 960)
+	if len(large) != 4*960 {
+		t.Fatalf("Get(%d) returned %d bytes", 4*960, len(large))
+	}
+	if got := pool.Get(480); len(got) != 480 || cap(got) != 960 {
+		t.Errorf("Get(480) = len %d cap %d; want the released frame", len(got), cap(got))
+	}
+
+	// Oversized and undersized buffers are not kept
+	pool.Put(large)
+	pool.Put(make([]byte, 100))
+	if n := len(pool.free); n != 0 {
+		t.Errorf("free list holds %d buffers after putting non-frame buffers; want 0", n)
+	}
+
+	if stats := pool.Stats(); stats.Allocs != 2 || stats.Reuses != 1 {
+		t.Errorf("stats = %+v; want 2 allocs and 1 reuse", stats)
+	}
+}
+
+func TestFramePoolSteadyState(t *testing.T) {
+	pool := NewFramePool(960, 4)
+	pool.Put(pool.Get(960))
+
+	allocs := testing.AllocsPerRun(100, func() {
+		pool.Put(pool.Get(960))
+	})
+	if allocs != 0 {
+		t.Errorf("Get/Put allocated %.1f times per frame; want 0", allocs)
+	}
+}
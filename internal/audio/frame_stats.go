@@ -0,0 +1,163 @@
+package audio
+
+import (
+	"encoding/binary"
+	"math"
+)
+
+// FrameStats holds level features of 16-bit mono PCM audio, computed in one pass
+// It is consumed by the VAD and reused for level meters and clipping diagnostics.
+type FrameStats struct {
+	// Samples is the number of 16-bit samples analyzed
+	Samples int
+
+	// SumSquares is the sum of squared raw sample values
+	SumSquares uint64
+
+	// Peak is the largest absolute raw sample value (0 to 32768)
+	Peak int
+
+	// ZeroCrossings is the number of sign changes between adjacent samples
+	ZeroCrossings int
+
+	// Clipped is the number of samples at full scale
+	Clipped int
+}
+
+// AnalyzeFrame computes the stats of a buffer of little-endian 16-bit samples
+func AnalyzeFrame(data []byte) FrameStats {
+	var stats FrameStats
+	if len(data) >= 2 {
+		stats.analyze(data, int64(int16(binary.LittleEndian.Uint16(data))))
+	}
+	return stats
+}
+
+// AnalyzeSpans computes the stats of a buffer split across two in-place spans,
+// such as the slices returned by RingBuffer.Peek, without copying it
+// A sample straddling the two spans (odd-length first span) is reassembled.
+func AnalyzeSpans(first, second []byte) FrameStats {
+	if len(second) == 0 {
+		return AnalyzeFrame(first)
+	}
+	if len(first) < 2 {
+		if len(first) == 0 {
+			return AnalyzeFrame(second)
+		}
+		// Only the straddling byte is in the first span
+		straddle := [2]byte{first[0], second[0]}
+		stats := AnalyzeFrame(straddle[:])
+		stats.analyze(second[1:], int64(int16(binary.LittleEndian.Uint16(straddle[:]))))
+		return stats
+	}
+
+	stats := AnalyzeFrame(first)
+	last := int64(int16(binary.LittleEndian.Uint16(first[len(first)-len(first)%2-2:])))
+	if len(first)%2 == 1 {
+		straddle := [2]byte{first[len(first)-1], second[0]}
+		last = stats.analyze(straddle[:], last)
+		second = second[1:]
+	}
+	stats.analyze(second, last)
+	return stats
+}
+
+// analyze folds the samples in data into the stats and returns the last sample
+// prev is the sample preceding data, used for zero crossing detection.
+//
+// Samples are accumulated as integers four at a time, so the loop has no float
+// conversions or divisions and does not allocate. It is also branch-free: a
+// sign change between two samples shows up as the sign bit of their XOR, and
+// a full-scale absolute value (32767 or 32768) as bit 15 of value+1.
+func (s *FrameStats) analyze(data []byte, prev int64) int64 {
+	var s0, s1, s2, s3 int64
+	var crossings int64
+	var clipped int64
+	peak := int64(s.Peak)
+
+	i := 0
+	for ; i+8 <= len(data); i += 8 {
+		b := data[i : i+8 : i+8]
+		a0 := int64(int16(binary.LittleEndian.Uint16(b[0:])))
+		a1 := int64(int16(binary.LittleEndian.Uint16(b[2:])))
+		a2 := int64(int16(binary.LittleEndian.Uint16(b[4:])))
+		a3 := int64(int16(binary.LittleEndian.Uint16(b[6:])))
+
+		s0 += a0 * a0
+		s1 += a1 * a1
+		s2 += a2 * a2
+		s3 += a3 * a3
+
+		crossings += int64(uint64(prev^a0)>>63 + uint64(a0^a1)>>63 + uint64(a1^a2)>>63 + uint64(a2^a3)>>63)
+		prev = a3
+
+		a0, a1, a2, a3 = abs64(a0), abs64(a1), abs64(a2), abs64(a3)
+		peak = max(peak, a0, a1, a2, a3)
+		clipped += (a0+1)>>15 + (a1+1)>>15 + (a2+1)>>15 + (a3+1)>>15
+	}
+	for ; i+2 <= len(data); i += 2 {
+		a := int64(int16(binary.LittleEndian.Uint16(data[i:])))
+		s0 += a * a
+		crossings += int64(uint64(prev^a) >> 63)
+		prev = a
+
+		a = abs64(a)
+		peak = max(peak, a)
+		clipped += (a + 1) >> 15
+	}
+
+	s.Samples += len(data) / 2
+	s.SumSquares += uint64(s0 + s1 + s2 + s3)
+	s.ZeroCrossings += int(crossings)
+	s.Peak = int(peak)
+	s.Clipped += int(clipped)
+	return prev
+}
+
+// abs64 returns the absolute value of a without branching
+func abs64(a int64) int64 {
+	m := a >> 63
+	return (a ^ m) - m
+}
+
+// Add accumulates other into s, e.g. to summarize the levels of a whole stream
+// Zero crossings at the boundary between the two are not counted.
+func (s *FrameStats) Add(other FrameStats) {
+	s.Samples += other.Samples
+	s.SumSquares += other.SumSquares
+	s.ZeroCrossings += other.ZeroCrossings
+	s.Clipped += other.Clipped
+	if other.Peak > s.Peak {
+		s.Peak = other.Peak
+	}
+}
+
+// MeanSquare returns the mean square of the samples normalized to -1.0 to 1.0
+//
+// Each squared sample is at most 2^30 and the scale is a power of two, so for
+// frames under 2^23 samples this is bit-identical to accumulating normalized
+// float64 squares.
+func (s FrameStats) MeanSquare() float64 {
+	if s.Samples == 0 {
+		return 0
+	}
+	return float64(s.SumSquares) / (32768 * 32768) / float64(s.Samples)
+}
+
+// RMS returns the root mean square energy (0.0 to 1.0)
+func (s FrameStats) RMS() float64 {
+	return math.Sqrt(s.MeanSquare())
+}
+
+// PeakLevel returns the peak absolute sample value normalized to 0.0 to 1.0
+func (s FrameStats) PeakLevel() float64 {
+	return float64(s.Peak) / 32768
+}
+
+// ZeroCrossingRate returns the fraction of adjacent sample pairs that change sign
+func (s FrameStats) ZeroCrossingRate() float64 {
+	if s.Samples < 2 {
+		return 0
+	}
+	return float64(s.ZeroCrossings) / float64(s.Samples-1)
+}
@@ -0,0 +1,138 @@
+package audio
+
+import (
+	"encoding/binary"
+	"math"
+	"math/rand"
+	"testing"
+)
+
+// referenceEnergy is the float RMS the VAD computed before FrameStats
+func referenceEnergy(data []byte) float64 {
+	sum, count := referenceSumSquares(data)
+	if count == 0 {
+		return 0
+	}
+	return math.Sqrt(sum / float64(count))
+}
+
+// referenceEnergySpans is referenceEnergy over a buffer split in two spans
+func referenceEnergySpans(first, second []byte) float64 {
+	if len(second) == 0 {
+		return referenceEnergy(first)
+	}
+
+	sum, count := referenceSumSquares(first)
+	if len(first)%2 == 1 {
+		sample := int16(first[len(first)-1]) | int16(second[0])<<8
+		normalized := float64(sample) / 32768.0
+		sum += normalized * normalized
+		count++
+		second = second[1:]
+	}
+	secondSum, secondCount := referenceSumSquares(second)
+	sum += secondSum
+	count += secondCount
+
+	if count == 0 {
+		return 0
+	}
+	return math.Sqrt(sum / float64(count))
+}
+
+// referenceSumSquares returns the sum of squared normalized samples and their count
+func referenceSumSquares(data []byte) (float64, int) {
+	var sum float64
+	count := len(data) / 2
+	for i := 0; i < count; i++ {
+		sample := int16(data[i*2]) | int16(data[i*2+1])<<8
+		normalized := float64(sample) / 32768.0
+		sum += normalized * normalized
+	}
+	return sum, count
+}
+
+// randomPCM returns n bytes of random samples, with full-scale samples mixed in
+func randomPCM(rng *rand.Rand, n int) []byte {
+	data := make([]byte, n)
+	rng.Read(data)
+	for i := 0; i+1 < n; i += 2 {
+		switch rng.Intn(50) {
+		case 0:
+			binary.LittleEndian.PutUint16(data[i:], uint16(0x8000)) // -32768
+		case 1:
+			binary.LittleEndian.PutUint16(data[i:], 0x7fff)
+		}
+	}
+	return data
+}
+
+func TestAnalyzeFrameMatchesReference(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	for _, n := range []int{0, 1, 2, 3, 6, 8, 9, 14, 16, 640, 641, 3200, 32000} {
+		data := randomPCM(rng, n)
+		if got, want := AnalyzeFrame(data).RMS(), referenceEnergy(data); got != want {
+			t.Errorf("%d bytes: RMS = %v; reference %v", n, got, want)
+		}
+	}
+}
+
+func TestAnalyzeSpansMatchesReference(t *testing.T) {
+	rng := rand.New(rand.NewSource(2))
+	data := randomPCM(rng, 641)
+	whole := AnalyzeFrame(data)
+
+	for split := 0; split <= len(data); split++ {
+		first, second := data[:split], data[split:]
+		stats := AnalyzeSpans(first, second)
+		if got, want := stats.RMS(), referenceEnergySpans(first, second); got != want {
+			t.Fatalf("split at %d: RMS = %v; reference %v", split, got, want)
+		}
+		if stats != whole {
+			t.Fatalf("split at %d: stats = %+v; whole buffer %+v", split, stats, whole)
+		}
+	}
+}
+
+func TestAnalyzeFrameFeatures(t *testing.T) {
+	samples := []int16{0, 100, -100, 32767, -32768, -5, 7, 7, -32767}
+	data := make([]byte, 2*len(samples))
+	for i, s := range samples {
+		binary.LittleEndian.PutUint16(data[2*i:], uint16(s))
+	}
+
+	stats := AnalyzeFrame(data)
+	want := FrameStats{
+		Samples:       len(samples),
+		Peak:          32768,
+		ZeroCrossings: 5, // 100→-100, -100→32767, 32767→-32768, -5→7, 7→-32767
+		Clipped:       3,
+	}
+	for _, s := range samples {
+		want.SumSquares += uint64(int64(s) * int64(s))
+	}
+	if stats != want {
+		t.Fatalf("AnalyzeFrame = %+v; want %+v", stats, want)
+	}
+}
+
+func BenchmarkAnalyzeFrame(b *testing.B) {
+	// One 20 ms frame of 16 kHz mono PCM
+	data := randomPCM(rand.New(rand.NewSource(3)), 640)
+
+	b.SetBytes(int64(len(data)))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		AnalyzeFrame(data)
+	}
+}
+
+func BenchmarkReferenceEnergy(b *testing.B) {
+	data := randomPCM(rand.New(rand.NewSource(3)), 640)
+
+	b.SetBytes(int64(len(data)))
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		referenceEnergy(data)
+	}
+}
@@ -16,10 +16,14 @@ type MalgoCapturer struct {
 	malgoContext *malgo.AllocatedContext
 	samples      chan AudioSample
 	errors       chan error
+	framePool    *FramePool
 	running      bool
 	mu           sync.RWMutex
 	stopChan     chan struct{}
 	wg           sync.WaitGroup
+
+	// queue applies the overflow policy, only delivered to from the data callback
+	queue *overflowQueue
 }
 
 // NewMalgoCapturer creates a new malgo-based audio capturer
@@ -30,12 +34,29 @@ func NewMalgoCapturer(config CaptureConfig) (*MalgoCapturer, error) {
 		bufferSize = 50
 	}
 
-	return &MalgoCapturer{
-		config:   config,
-		samples:  make(chan AudioSample, bufferSize),
-		errors:   make(chan error, 10),
-		stopChan: make(chan struct{}),
-	}, nil
+	// Allocate the channel for the largest buffer a tuner may select; the
+	// effective limit is enforced separately so it can change while running
+	capacity := maxSampleBufferSize(config)
+	if bufferSize > capacity {
+		capacity = bufferSize
+	}
+
+	// Pool enough frames to fill the sample channel plus the ones being processed
+	framePool := NewFramePool(config.FrameBytes(), capacity+4)
+
+	m := &MalgoCapturer{
+		config:    config,
+		samples:   make(chan AudioSample, capacity),
+		errors:    make(chan error, 10),
+		framePool: framePool,
+		stopChan:  make(chan struct{}),
+	}
+	queue, err := newOverflowQueue(config, m.samples, m.errors, framePool)
+	if err != nil {
+		return nil, err
+	}
+	m.queue = queue
+	return m, nil
 }
 
 // Start begins audio capture
@@ -81,26 +102,18 @@ func (m *MalgoCapturer) Start(ctx context.Context) error {
 			return
 		}
 
-		// Copy the input samples to avoid data races
-		dataCopy := make([]byte, len(pInputSamples))
+		// Copy the input samples into a pooled frame to avoid data races
+		dataCopy := m.framePool.Get(len(pInputSamples))
 		copy(dataCopy, pInputSamples)
 
 		sample := AudioSample{
 			Data:      dataCopy,
 			Timestamp: time.Now(),
 			Frames:    framecount,
+			pool:      m.framePool,
 		}
 
-		// Non-blocking send to samples channel
-		select {
-		case m.samples <- sample:
-		default:
-			// Channel is full, log or handle overflow
-			select {
-			case m.errors <- fmt.Errorf("sample buffer overflow, dropping frames"):
-			default:
-			}
-		}
+		m.queue.deliver(sample)
 	}
 
 	// Initialize device
@@ -177,6 +190,9 @@ func (m *MalgoCapturer) Stop() error {
 	// Wait for goroutines
 	m.wg.Wait()
 
+	// Release audio still held back by the overflow policy
+	m.queue.release()
+
 	// Close channels
 	close(m.samples)
 	close(m.errors)
@@ -201,6 +217,16 @@ func (m *MalgoCapturer) IsRunning() bool {
 	return m.running
 }
 
+// SetSampleBufferSize changes the sample buffer limit, clamped to the channel capacity
+func (m *MalgoCapturer) SetSampleBufferSize(size int) {
+	m.queue.setLimit(size)
+}
+
+// Stats returns runtime counters for the capturer
+func (m *MalgoCapturer) Stats() CaptureStats {
+	return m.queue.stats()
+}
+
 // GetDeviceInfo returns information about the capture device
 func (m *MalgoCapturer) GetDeviceInfo() (malgo.DeviceInfo, error) {
 	if m.malgoContext == nil {
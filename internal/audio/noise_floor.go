@@ -0,0 +1,154 @@
+package audio
+
+import (
+	"math"
+	"time"
+)
+
+const (
+	// noiseSubwindows is the number of sub-windows the noise window is split into
+	noiseSubwindows = 8
+
+	// noiseSmoothing is the time constant of the recursive smoothing applied
+	// to frame power before taking minima
+	noiseSmoothing = 100 * time.Millisecond
+)
+
+// NoiseFloorTracker estimates the background noise level with minimum statistics
+//
+// Frame power is smoothed and its minimum tracked over a sliding window of
+// recent audio. Speech has pauses between words and syllables, so the minimum
+// follows the noise floor even while someone is talking, and it rises with
+// the background noise once the window slides past quieter frames.
+type NoiseFloorTracker struct {
+	sampleRate       int
+	subwindowSamples int
+	minima           []float64
+	filled           int
+	next             int
+	current          float64
+	count            int
+	smoothed         float64
+	floor            float64
+	started          bool
+}
+
+// NewNoiseFloorTracker creates a tracker over a window of recent audio at sampleRate
+func NewNoiseFloorTracker(window time.Duration, sampleRate int) *NoiseFloorTracker {
+	subwindowSamples := samplesFor(window, sampleRate) / noiseSubwindows
+	if subwindowSamples < 1 {
+		subwindowSamples = 1
+	}
+	return &NoiseFloorTracker{
+		sampleRate:       sampleRate,
+		subwindowSamples: subwindowSamples,
+		minima:           make([]float64, noiseSubwindows),
+	}
+}
+
+// Update feeds the mean square of a frame of the given number of samples and
+// returns the noise floor estimate (mean square)
+func (t *NoiseFloorTracker) Update(power float64, samples int) float64 {
+	if !t.started {
+		t.smoothed = power
+		t.started = true
+	} else {
+		// Smoothing factor for this frame's duration, so frame size doesn't matter
+		alpha := math.Exp(-float64(samples) / (noiseSmoothing.Seconds() * float64(t.sampleRate)))
+		t.smoothed = alpha*t.smoothed + (1-alpha)*power
+	}
+
+	if t.count == 0 || t.smoothed < t.current {
+		t.current = t.smoothed
+	}
+	t.count += samples
+
+	floor := t.current
+	for _, m := range t.minima[:t.filled] {
+		floor = min(floor, m)
+	}
+	t.floor = floor
+
+	// Close the sub-window, dropping the oldest once the window is full
+	if t.count >= t.subwindowSamples {
+		t.minima[t.next] = t.current
+		t.next = (t.next + 1) % len(t.minima)
+		t.filled = min(t.filled+1, len(t.minima))
+		t.count = 0
+	}
+
+	return floor
+}
+
+// Warm reports whether the tracker has seen a full window of frames
+func (t *NoiseFloorTracker) Warm() bool {
+	return t.filled == len(t.minima)
+}
+
+// Floor returns the current noise floor estimate (mean square)
+func (t *NoiseFloorTracker) Floor() float64 {
+	return t.floor
+}
+
+// Reset discards the noise history
+func (t *NoiseFloorTracker) Reset() {
+	t.filled = 0
+	t.next = 0
+	t.count = 0
+	t.floor = 0
+	t.started = false
+}
+
+// gate holds the speech threshold of a detector, fixed or derived from the noise floor
+// Thresholds are kept as mean squares so detectors can compare without sqrt.
+type gate struct {
+	minimum float64
+	margin  float64
+	tracker *NoiseFloorTracker
+	current float64
+}
+
+// newGate creates the threshold gate for a VAD configuration
+func newGate(config VADConfig) gate {
+	g := gate{
+		minimum: config.EnergyThreshold * config.EnergyThreshold,
+		margin:  math.Pow(10, config.NoiseMarginDB/10),
+	}
+	g.current = g.minimum
+	if config.AdaptiveThreshold {
+		sampleRate := config.SampleRate
+		if sampleRate <= 0 {
+			sampleRate = DefaultVADConfig().SampleRate
+		}
+		g.tracker = NewNoiseFloorTracker(config.NoiseWindow, sampleRate)
+	}
+	return g
+}
+
+// update feeds a frame's mean square and sample count and returns the current threshold (mean square)
+// With adaptive thresholds this is the noise floor plus the margin, but never
+// below the configured EnergyThreshold. The configured threshold is also used
+// until the tracker has seen a full window, so speech right at startup is not
+// mistaken for the noise floor.
+func (g *gate) update(power float64, samples int) float64 {
+	if g.tracker != nil {
+		floor := g.tracker.Update(power, samples)
+		if g.tracker.Warm() {
+			g.current = max(floor*g.margin, g.minimum)
+		}
+	}
+	return g.current
+}
+
+// threshold returns the current threshold as an RMS level
+func (g *gate) threshold() float64 {
+	return math.Sqrt(g.current)
+}
+
+// noiseFloor returns the noise floor estimate as an RMS level (0 when not adaptive)
+func (g *gate) noiseFloor() float64 {
+	if g.tracker == nil {
+		return 0
+	}
+	return math.Sqrt(g.tracker.Floor())
+}
@@ -0,0 +1,357 @@
+package audio
+
+import (
+	"fmt"
+	"strings"
+	"sync/atomic"
+	"time"
+)
+
+// OverflowPolicy selects what a capturer does when the consumer falls behind
+// and the sample channel is full
+type OverflowPolicy string
+
+const (
+	// OverflowDropNewest discards the frame that did not fit (default)
+	OverflowDropNewest OverflowPolicy = "drop-newest"
+
+	// OverflowDropOldest discards the oldest queued frame to make room for the new one
+	OverflowDropOldest OverflowPolicy = "drop-oldest"
+
+	// OverflowCoalesce merges frames that did not fit into one larger chunk
+	// which is delivered as soon as the channel has room
+	OverflowCoalesce OverflowPolicy = "coalesce"
+
+	// OverflowSpill queues frames that did not fit in a growable ring bounded
+	// by the overflow byte budget and forwards them in order
+	OverflowSpill OverflowPolicy = "spill"
+)
+
+// DefaultOverflowBudget is the default byte budget for the coalesce and spill
+// policies (~32 seconds of 16kHz 16-bit mono audio)
+const DefaultOverflowBudget = 1 << 20
+
+// ParseOverflowPolicy parses an overflow policy name
+// An empty string selects OverflowDropNewest.
+func ParseOverflowPolicy(name string) (OverflowPolicy, error) {
+	switch policy := OverflowPolicy(strings.ToLower(strings.TrimSpace(name))); policy {
+	case "":
+		return OverflowDropNewest, nil
+	case OverflowDropNewest, OverflowDropOldest, OverflowCoalesce, OverflowSpill:
+		return policy, nil
+	default:
+		return "", fmt.Errorf("unknown overflow policy: %s (valid: drop-newest, drop-oldest, coalesce, spill)", name)
+	}
+}
+
+// sampleQueue is a growable FIFO ring of audio samples bounded by a byte budget
+// It is only accessed from the capture callback and is not thread-safe.
+type sampleQueue struct {
+	items  []AudioSample
+	head   int
+	count  int
+	bytes  int
+	budget int
+}
+
+// newSampleQueue creates a sample queue holding at most budget bytes of audio
+func newSampleQueue(budget int) *sampleQueue {
+	return &sampleQueue{
+		items:  make([]AudioSample, 8),
+		budget: budget,
+	}
+}
+
+// push appends a sample, returning false if it would exceed the byte budget
+func (q *sampleQueue) push(sample AudioSample) bool {
+	if q.bytes+len(sample.Data) > q.budget {
+		return false
+	}
+	if q.count == len(q.items) {
+		// Grow the ring, unwrapping it into the new backing array
+		items := make([]AudioSample, len(q.items)*2)
+		n := copy(items, q.items[q.head:])
+		copy(items[n:], q.items[:q.head])
+		q.items = items
+		q.head = 0
+	}
+	q.items[(q.head+q.count)%len(q.items)] = sample
+	q.count++
+	q.bytes += len(sample.Data)
+	return true
+}
+
+// peek returns the oldest queued sample
+func (q *sampleQueue) peek() (AudioSample, bool) {
+	if q.count == 0 {
+		return AudioSample{}, false
+	}
+	return q.items[q.head], true
+}
+
+// pop removes the oldest queued sample
+func (q *sampleQueue) pop() {
+	if q.count == 0 {
+		return
+	}
+	q.bytes -= len(q.items[q.head].Data)
+	q.items[q.head] = AudioSample{}
+	q.head = (q.head + 1) % len(q.items)
+	q.count--
+}
+
+// len returns the number of queued samples
+func (q *sampleQueue) len() int {
+	return q.count
+}
+
+// overflowQueue hands captured samples to the consumer without blocking,
+// applying an overflow policy when the consumer falls behind
+// deliver is only called from the capturing goroutine; the counters and the
+// sample buffer limit may be read and changed from any goroutine.
+type overflowQueue struct {
+	samples    chan AudioSample
+	errors     chan error
+	framePool  *FramePool
+	sampleRate uint32
+
+	policy  OverflowPolicy
+	budget  int
+	pending AudioSample  // coalesce: chunk waiting for channel space
+	merged  []byte       // coalesce: growable buffer pending is built in, handed off with it
+	spill   *sampleQueue // spill: frames waiting for channel space
+
+	droppedFrames   atomic.Uint64
+	coalescedFrames atomic.Uint64
+	spilledFrames   atomic.Uint64
+	peakQueueDepth  atomic.Int64
+
+	// limit is the tunable sample buffer size, at most cap(samples)
+	limit atomic.Int64
+}
+
+// newOverflowQueue creates a queue for config's overflow policy and sample
+// buffer size, delivering to samples and reporting overflows on errors
+func newOverflowQueue(config CaptureConfig, samples chan AudioSample, errors chan error, framePool *FramePool) (*overflowQueue, error) {
+	policy, err := ParseOverflowPolicy(string(config.OverflowPolicy))
+	if err != nil {
+		return nil, err
+	}
+	budget := config.OverflowBudget
+	if budget <= 0 {
+		budget = DefaultOverflowBudget
+	}
+	bufferSize := config.SampleBufferSize
+	if bufferSize == 0 {
+		bufferSize = 50
+	}
+
+	q := &overflowQueue{
+		samples:    samples,
+		errors:     errors,
+		framePool:  framePool,
+		sampleRate: config.SampleRate,
+		policy:     policy,
+		budget:     budget,
+	}
+	q.limit.Store(int64(min(bufferSize, cap(samples))))
+	if policy == OverflowSpill {
+		q.spill = newSampleQueue(budget)
+	}
+	return q, nil
+}
+
+// deliver hands a captured sample to the consumer without blocking,
+// applying the overflow policy when the sample channel is full
+func (q *overflowQueue) deliver(sample AudioSample) {
+	defer q.trackQueueDepth()
+
+	switch q.policy {
+	case OverflowDropOldest:
+		for {
+			if q.trySend(sample) {
+				return
+			}
+			// Make room by dropping the oldest queued frame
+			select {
+			case oldest := <-q.samples:
+				q.dropped(oldest, "dropping oldest frame")
+			default:
+			}
+		}
+
+	case OverflowCoalesce:
+		if q.pending.Data == nil {
+			if !q.trySend(sample) {
+				q.pending = sample
+			}
+			return
+		}
+		if len(q.pending.Data)+len(sample.Data) > q.budget {
+			q.dropped(sample, "coalesce budget exceeded, dropping newest frame")
+		} else {
+			q.coalesce(sample)
+		}
+		if q.trySend(q.pending) {
+			q.handOff()
+		}
+
+	case OverflowSpill:
+		// Forward spilled frames first so ordering is preserved
+		for next, ok := q.spill.peek(); ok && q.trySend(next); next, ok = q.spill.peek() {
+			q.spill.pop()
+		}
+		if q.spill.len() == 0 && q.trySend(sample) {
+			return
+		}
+		if q.spill.push(sample) {
+			q.spilledFrames.Add(1)
+		} else {
+			q.dropped(sample, "spill budget exceeded, dropping newest frame")
+		}
+
+	default:
+		if !q.trySend(sample) {
+			q.dropped(sample, "dropping newest frame")
+		}
+	}
+}
+
+// coalesce appends a sample to the pending chunk
+// The chunk is built in a buffer owned by the queue that grows by doubling, up
+// to the budget, so a long stall costs a few allocations rather than a copy
+// of the whole chunk per frame.
+func (q *overflowQueue) coalesce(sample AudioSample) {
+	prev := q.pending
+	need := len(prev.Data) + len(sample.Data)
+	if q.merged == nil {
+		// First merge: move the pending frame out of the frame pool
+		q.merged = make([]byte, 0, min(2*need, q.budget))
+		q.merged = append(q.merged, prev.Data...)
+		prev.Release()
+	} else if need > cap(q.merged) {
+		grown := make([]byte, len(q.merged), min(max(2*cap(q.merged), need), q.budget))
+		copy(grown, q.merged)
+		q.merged = grown
+	}
+	q.merged = append(q.merged, sample.Data...)
+	sample.Release()
+
+	q.pending = AudioSample{
+		Data:      q.merged,
+		Timestamp: prev.Timestamp,
+		Frames:    prev.Frames + sample.Frames,
+	}
+	q.coalescedFrames.Add(1)
+}
+
+// handOff forgets the pending chunk once it has been sent; the consumer now
+// owns its buffer
+func (q *overflowQueue) handOff() {
+	q.pending = AudioSample{}
+	q.merged = nil
+}
+
+// trySend queues a sample for the consumer unless the sample buffer limit is reached
+func (q *overflowQueue) trySend(sample AudioSample) bool {
+	if len(q.samples) >= int(q.limit.Load()) {
+		return false
+	}
+	select {
+	case q.samples <- sample:
+		return true
+	default:
+		return false
+	}
+}
+
+// flush sends the audio held back by the policy, waiting for channel space,
+// and returns false if stop closes first
+func (q *overflowQueue) flush(stop <-chan struct{}) bool {
+	if q.pending.Data != nil {
+		select {
+		case q.samples <- q.pending:
+			q.handOff()
+		case <-stop:
+			return false
+		}
+	}
+	if q.spill != nil {
+		for next, ok := q.spill.peek(); ok; next, ok = q.spill.peek() {
+			select {
+			case q.samples <- next:
+				q.spill.pop()
+			case <-stop:
+				return false
+			}
+		}
+	}
+	return true
+}
+
+// release frees the audio still held back by the policy
+func (q *overflowQueue) release() {
+	q.pending.Release()
+	q.handOff()
+	if q.spill != nil {
+		for sample, ok := q.spill.peek(); ok; sample, ok = q.spill.peek() {
+			sample.Release()
+			q.spill.pop()
+		}
+	}
+}
+
+// setLimit changes the sample buffer limit, clamped to the channel capacity
+func (q *overflowQueue) setLimit(size int) {
+	q.limit.Store(int64(min(max(size, 1), cap(q.samples))))
+}
+
+// dropped releases a lost sample, counts it and reports the overflow
+func (q *overflowQueue) dropped(sample AudioSample, reason string) {
+	frames := q.droppedFrames.Add(uint64(sample.Frames))
+	sample.Release()
+	select {
+	case q.errors <- fmt.Errorf("sample buffer overflow (%s): %d frames (%v) lost so far",
+		reason, frames, q.framesDuration(frames)):
+	default:
+	}
+}
+
+// trackQueueDepth records the peak number of samples waiting for the consumer
+func (q *overflowQueue) trackQueueDepth() {
+	depth := int64(len(q.samples))
+	if q.spill != nil {
+		depth += int64(q.spill.len())
+	}
+	if q.pending.Data != nil {
+		depth++
+	}
+	for {
+		peak := q.peakQueueDepth.Load()
+		if depth <= peak || q.peakQueueDepth.CompareAndSwap(peak, depth) {
+			return
+		}
+	}
+}
+
+// framesDuration converts a number of audio frames to a duration
+func (q *overflowQueue) framesDuration(frames uint64) time.Duration {
+	if q.sampleRate == 0 {
+		return 0
+	}
+	return time.Duration(frames) * time.Second / time.Duration(q.sampleRate)
+}
+
+// stats returns the queue's counters
+func (q *overflowQueue) stats() CaptureStats {
+	dropped := q.droppedFrames.Load()
+	return CaptureStats{
+		FramePool:        q.framePool.Stats(),
+		DroppedFrames:    dropped,
+		DroppedDuration:  q.framesDuration(dropped),
+		CoalescedFrames:  q.coalescedFrames.Load(),
+		SpilledFrames:    q.spilledFrames.Load(),
+		PeakQueueDepth:   int(q.peakQueueDepth.Load()),
+		SampleBufferSize: int(q.limit.Load()),
+	}
+}
@@ -0,0 +1,165 @@
+package audio
+
+import (
+	"bytes"
+	"context"
+	"os"
+	"path/filepath"
+	"runtime"
+	"testing"
+	"time"
+)
+
+// testQueue returns an overflow queue for policy with a sample buffer of one,
+// on a channel with room for everything flush hands over
+func testQueue(t *testing.T, policy OverflowPolicy) *overflowQueue {
+	t.Helper()
+	config := DefaultConfig()
+	config.SampleBufferSize = 1
+	config.OverflowPolicy = policy
+	queue, err := newOverflowQueue(config, make(chan AudioSample, 4), make(chan error, 10), NewFramePool(4, 8))
+	if err != nil {
+		t.Fatal(err)
+	}
+	return queue
+}
+
+// frame returns a one-frame sample holding value
+func frame(value byte) AudioSample {
+	return AudioSample{Data: []byte{value, value}, Frames: 1}
+}
+
+func TestOverflowQueuePolicies(t *testing.T) {
+	tests := []struct {
+		policy  OverflowPolicy
+		want    []byte // first byte of each sample delivered, in order
+		dropped uint64
+	}{
+		{OverflowDropNewest, []byte{1}, 2},
+		{OverflowDropOldest, []byte{3}, 2},
+		{OverflowSpill, []byte{1, 2, 3}, 0},
+		{OverflowCoalesce, []byte{1, 2}, 0},
+	}
+	for _, tt := range tests {
+		t.Run(string(tt.policy), func(t *testing.T) {
+			queue := testQueue(t, tt.policy)
+			for value := byte(1); value <= 3; value++ {
+				queue.deliver(frame(value))
+			}
+
+			queue.flush(nil)
+			close(queue.samples)
+
+			var got []byte
+			for sample := range queue.samples {
+				got = append(got, sample.Data[0])
+			}
+			if string(got) != string(tt.want) {
+				t.Errorf("delivered %v; want %v", got, tt.want)
+			}
+			if stats := queue.stats(); stats.DroppedFrames != tt.dropped {
+				t.Errorf("dropped %d frames; want %d", stats.DroppedFrames, tt.dropped)
+			}
+		})
+	}
+}
+
+func TestOverflowQueueCoalesceStall(t *testing.T) {
+	// A consumer stalled for 1000 frames of 30 ms while the capturer coalesces
+	const frames, frameBytes = 1000, 960
+	config := DefaultConfig()
+	config.SampleBufferSize = 1
+	config.OverflowPolicy = OverflowCoalesce
+	pool := NewFramePool(frameBytes, 8)
+	queue, err := newOverflowQueue(config, make(chan AudioSample, 1), make(chan error, 10), pool)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	var want []byte
+	input := make([]AudioSample, frames+1)
+	for i := range input {
+		data := bytes.Repeat([]byte{byte(i), byte(i >> 8)}, frameBytes/2)
+		input[i] = AudioSample{Data: data, Frames: frameBytes / 2}
+		if i > 0 {
+			want = append(want, data...)
+		}
+	}
+
+	var before, after runtime.MemStats
+	runtime.ReadMemStats(&before)
+	for _, sample := range input {
+		queue.deliver(sample)
+	}
+	runtime.ReadMemStats(&after)
+
+	// The first frame fills the channel; the rest are merged into one chunk
+	<-queue.samples
+	if !queue.flush(nil) {
+		t.Fatal("flush stopped")
+	}
+	chunk := <-queue.samples
+	if !bytes.Equal(chunk.Data, want) {
+		t.Errorf("coalesced chunk is %d bytes and differs from the %d input bytes", len(chunk.Data), len(want))
+	}
+	if chunk.Frames != frames*frameBytes/2 {
+		t.Errorf("coalesced chunk holds %d frames; want %d", chunk.Frames, frames*frameBytes/2)
+	}
+
+	// The buffer grows by doubling, so the stall costs a few allocations
+	if allocs := after.Mallocs - before.Mallocs; allocs > 32 {
+		t.Errorf("coalescing %d frames allocated %d times; want at most 32", frames, allocs)
+	}
+	if stats := pool.Stats(); stats.Allocs != 0 {
+		t.Errorf("coalescing allocated %d pool frames; want 0", stats.Allocs)
+	}
+}
+
+func TestStreamCapturerOverflowPolicy(t *testing.T) {
+	// 300 ms of raw PCM read in real time by a consumer that only starts
+	// reading once the input has ended
+	path := filepath.Join(t.TempDir(), "speech.raw")
+	pcm := make([]byte, 16000*2*3/10)
+	for i := range pcm {
+		pcm[i] = byte(i / 960)
+	}
+	if err := os.WriteFile(path, pcm, 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	for _, policy := range []OverflowPolicy{OverflowDropNewest, OverflowSpill} {
+		t.Run(string(policy), func(t *testing.T) {
+			config := DefaultConfig()
+			config.Source = path
+			config.SampleBufferSize = 1
+			config.OverflowPolicy = policy
+			capturer, err := NewStreamCapturer(config)
+			if err != nil {
+				t.Fatal(err)
+			}
+			if err := capturer.Start(context.Background()); err != nil {
+				t.Fatal(err)
+			}
+			time.Sleep(500 * time.Millisecond)
+
+			var got []byte
+			for sample := range capturer.Samples() {
+				got = append(got, sample.Data...)
+				sample.Release()
+			}
+
+			stats := capturer.Stats()
+			if policy == OverflowSpill {
+				if string(got) != string(pcm) || stats.DroppedFrames != 0 {
+					t.Errorf("spill delivered %d of %d bytes and dropped %d frames; want all audio in order",
+						len(got), len(pcm), stats.DroppedFrames)
+				}
+				return
+			}
+			if stats.DroppedFrames == 0 || len(got) >= len(pcm) {
+				t.Errorf("drop-newest delivered %d of %d bytes and dropped %d frames; want frames dropped",
+					len(got), len(pcm), stats.DroppedFrames)
+			}
+		})
+	}
+}
@@ -0,0 +1,56 @@
+package audio
+
+import "time"
+
+// PreRoll keeps the most recent audio while the VAD reports silence
+//
+// A VAD only confirms speech after SpeechDuration of it, and quiet word onsets
+// stay below the threshold before that. Replaying the pre-roll into the
+// recognizer when speech starts keeps those onsets, so VAD thresholds can be
+// raised without clipping the first phoneme of each utterance.
+type PreRoll struct {
+	ring *SPSCRingBuffer
+}
+
+// NewPreRoll creates a pre-roll holding up to duration of 16-bit mono audio at sampleRate
+// Returns nil if duration is not positive; a nil PreRoll ignores all calls.
+func NewPreRoll(duration time.Duration, sampleRate int) *PreRoll {
+	size := samplesFor(duration, sampleRate) * 2
+	if size <= 0 {
+		return nil
+	}
+	return &PreRoll{ring: NewSPSCRingBuffer(size, OverwriteOldest)}
+}
+
+// Add appends a frame, discarding the oldest audio once the pre-roll is full
+func (p *PreRoll) Add(data []byte) {
+	if p == nil {
+		return
+	}
+	p.ring.Write(data)
+}
+
+// Spans returns the buffered audio, oldest first, as at most two in-place slices
+// The slices are valid until the next Add or Reset.
+func (p *PreRoll) Spans() (first, second []byte) {
+	if p == nil {
+		return nil, nil
+	}
+	return p.ring.Peek(0)
+}
+
+// Duration returns how much audio is buffered
+func (p *PreRoll) Duration(sampleRate int) time.Duration {
+	if p == nil || sampleRate <= 0 {
+		return 0
+	}
+	return time.Duration(p.ring.Available()/2) * time.Second / time.Duration(sampleRate)
+}
+
+// Reset discards the buffered audio
+func (p *PreRoll) Reset() {
+	if p == nil {
+		return
+	}
+	p.ring.Reset()
+}
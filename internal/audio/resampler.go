@@ -0,0 +1,301 @@
+package audio
+
+import (
+	"encoding/binary"
+	"fmt"
+	"io"
+	"math"
+)
+
+const (
+	// resamplerZeroCrossings is the number of sinc zero crossings on each
+	// side of the filter center, trading filter length for steepness
+	resamplerZeroCrossings = 16
+
+	// resamplerRolloff places the filter cutoff just below the lower Nyquist
+	// frequency, leaving room for the transition band
+	resamplerRolloff = 0.94
+
+	// resamplerKaiserBeta shapes the window for about 80 dB of stopband rejection
+	resamplerKaiserBeta = 8.0
+
+	// resamplerMaxChannels bounds the channel count a stream may declare
+	resamplerMaxChannels = 8
+)
+
+// Resampler converts a stream of interleaved 16-bit PCM to mono at another
+// sample rate
+//
+// Channels are averaged down to mono, then a polyphase windowed-sinc filter
+// converts by the reduced ratio of the two rates (e.g. 1/3 for 48 kHz to
+// 16 kHz, 160/441 for 44.1 kHz). Filter history and any partial frame are
+// carried between calls, so a stream may be fed in chunks of any size.
+// Buffers are reused, so steady-state calls don't allocate.
+type Resampler struct {
+	inRate   int
+	outRate  int
+	channels int
+
+	up   int       // Interpolation factor L
+	down int       // Decimation factor M
+	taps int       // Filter taps per phase
+	bank []float32 // taps coefficients per phase, reversed for a forward dot product
+
+	// history holds the last taps-1 input samples followed by the unfiltered
+	// input; next is the position of the next output in units of 1/up input
+	// samples from the start of history
+	history []float32
+	next    int
+	start   int // Initial value of next, aligning output with input
+
+	pending    []byte // Partial input frame carried to the next call
+	pendingLen int
+
+	out []byte
+}
+
+// NewResampler creates a resampler from inRate with channels interleaved
+// channels to mono at outRate
+func NewResampler(inRate, channels, outRate int) (*Resampler, error) {
+	if inRate <= 0 || outRate <= 0 {
+		return nil, fmt.Errorf("invalid sample rates: %d Hz to %d Hz", inRate, outRate)
+	}
+	if channels < 1 || channels > resamplerMaxChannels {
+		return nil, fmt.Errorf("unsupported channel count: %d (1-%d)", channels, resamplerMaxChannels)
+	}
+
+	divisor := gcd(inRate, outRate)
+	r := &Resampler{
+		inRate:   inRate,
+		outRate:  outRate,
+		channels: channels,
+		up:       outRate / divisor,
+		down:     inRate / divisor,
+		pending:  make([]byte, channels*2),
+	}
+	r.design()
+	r.history = make([]float32, r.taps-1, r.taps-1+inRate/10)
+	r.next = r.start
+	return r, nil
+}
+
+// design builds the polyphase filter bank for the conversion ratio
+func (r *Resampler) design() {
+	if r.up == 1 && r.down == 1 {
+		// Same rate, only downmixing
+		r.taps = 1
+		r.bank = []float32{1}
+		return
+	}
+
+	// The cutoff sits below the lower of the two Nyquist frequencies, in
+	// cycles per sample at the interpolated rate (up times the input rate)
+	factor := max(r.up, r.down)
+	cutoff := resamplerRolloff * 0.5 / float64(factor)
+
+	// Cover the zero crossings on both sides, measured in input samples
+	r.taps = 2 * int(math.Ceil(resamplerZeroCrossings*float64(factor)/float64(r.up)))
+
+	// Center on a whole tap so the output lines up with the input exactly
+	length := r.taps * r.up
+	center := float64((length - 1) / 2)
+	r.start = (r.taps-1)*r.up + (length-1)/2
+
+	prototype := make([]float64, length)
+	for n := range prototype {
+		x := float64(n) - center
+		sinc := 2 * cutoff
+		if x != 0 {
+			sinc = math.Sin(2*math.Pi*cutoff*x) / (math.Pi * x)
+		}
+		ratio := x / (center + 1)
+		window := besselI0(resamplerKaiserBeta*math.Sqrt(1-ratio*ratio)) / besselI0(resamplerKaiserBeta)
+		prototype[n] = sinc * window
+	}
+
+	// Split into phases, normalizing each to unity gain so DC passes unchanged
+	r.bank = make([]float32, length)
+	for p := 0; p < r.up; p++ {
+		sum := 0.0
+		for k := 0; k < r.taps; k++ {
+			sum += prototype[p+k*r.up]
+		}
+		for k := 0; k < r.taps; k++ {
+			r.bank[p*r.taps+r.taps-1-k] = float32(prototype[p+k*r.up] / sum)
+		}
+	}
+}
+
+// InputRate returns the sample rate the resampler converts from
+func (r *Resampler) InputRate() int {
+	return r.inRate
+}
+
+// Channels returns the input channel count
+func (r *Resampler) Channels() int {
+	return r.channels
+}
+
+// Process converts a chunk of interleaved 16-bit little-endian PCM
+// The returned mono PCM is only valid until the next call.
+func (r *Resampler) Process(data []byte) []byte {
+	frameBytes := r.channels * 2
+
+	// Complete a frame split across the previous chunk
+	if r.pendingLen > 0 {
+		n := copy(r.pending[r.pendingLen:], data)
+		r.pendingLen += n
+		data = data[n:]
+		if r.pendingLen < frameBytes {
+			r.out = r.out[:0]
+			return r.out
+		}
+		r.appendFrames(r.pending)
+		r.pendingLen = 0
+	}
+
+	whole := len(data) - len(data)%frameBytes
+	r.appendFrames(data[:whole])
+	r.pendingLen = copy(r.pending, data[whole:])
+
+	return r.filter()
+}
+
+// Flush returns the output still held back by the filter delay, as if the
+// input were followed by silence
+// Call at the end of a stream; Reset before reusing the resampler.
+func (r *Resampler) Flush() []byte {
+	r.pendingLen = 0
+	for n := (r.taps*r.up-1)/2/r.up + 1; n > 0; n-- {
+		r.history = append(r.history, 0)
+	}
+	return r.filter()
+}
+
+// Reset clears the filter state for a new stream
+func (r *Resampler) Reset() {
+	r.history = r.history[:r.taps-1]
+	for i := range r.history {
+		r.history[i] = 0
+	}
+	r.next = r.start
+	r.pendingLen = 0
+}
+
+// appendFrames downmixes whole frames of interleaved samples onto the history
+func (r *Resampler) appendFrames(data []byte) {
+	if r.channels == 1 {
+		for i := 0; i+1 < len(data); i += 2 {
+			r.history = append(r.history, float32(int16(binary.LittleEndian.Uint16(data[i:]))))
+		}
+		return
+	}
+
+	frameBytes := r.channels * 2
+	scale := 1 / float32(r.channels)
+	for i := 0; i+frameBytes <= len(data); i += frameBytes {
+		var sum float32
+		for c := 0; c < frameBytes; c += 2 {
+			sum += float32(int16(binary.LittleEndian.Uint16(data[i+c:])))
+		}
+		r.history = append(r.history, sum*scale)
+	}
+}
+
+// filter produces every output whose input is available, then drops the
+// input no longer needed as history
+func (r *Resampler) filter() []byte {
+	r.out = r.out[:0]
+	for {
+		i := r.next / r.up
+		if i >= len(r.history) {
+			break
+		}
+		phase := r.next % r.up
+		coeffs := r.bank[phase*r.taps : (phase+1)*r.taps]
+		window := r.history[i-r.taps+1 : i+1]
+
+		var acc float32
+		for k, c := range coeffs {
+			acc += c * window[k]
+		}
+
+		sample := int32(math.Round(float64(acc)))
+		sample = min(max(sample, math.MinInt16), math.MaxInt16)
+		r.out = binary.LittleEndian.AppendUint16(r.out, uint16(int16(sample)))
+
+		r.next += r.down
+	}
+
+	if drop := min(r.next/r.up-(r.taps-1), len(r.history)); drop > 0 {
+		kept := copy(r.history, r.history[drop:])
+		r.history = r.history[:kept]
+		r.next -= drop * r.up
+	}
+	return r.out
+}
+
+// resamplingReader converts the PCM read from a source with a Resampler
+type resamplingReader struct {
+	source    io.Reader
+	resampler *Resampler
+	in        []byte
+	out       []byte
+	err       error
+}
+
+// NewResamplingReader returns a reader of source's interleaved 16-bit PCM
+// converted to mono at outRate
+func NewResamplingReader(source io.Reader, inRate, channels, outRate int) (io.Reader, error) {
+	resampler, err := NewResampler(inRate, channels, outRate)
+	if err != nil {
+		return nil, err
+	}
+	return &resamplingReader{
+		source:    source,
+		resampler: resampler,
+		in:        make([]byte, 32*1024),
+	}, nil
+}
+
+// Read fills p with converted audio
+func (r *resamplingReader) Read(p []byte) (int, error) {
+	for len(r.out) == 0 {
+		if r.err != nil {
+			return 0, r.err
+		}
+		n, err := r.source.Read(r.in)
+		r.out = r.resampler.Process(r.in[:n])
+		if err != nil {
+			if err == io.EOF {
+				// Append the filter tail, copying Process's output first
+				// since Flush reuses its buffer
+				r.out = append(append([]byte(nil), r.out...), r.resampler.Flush()...)
+			}
+			r.err = err
+		}
+	}
+
+	n := copy(p, r.out)
+	r.out = r.out[n:]
+	return n, nil
+}
+
+// gcd returns the greatest common divisor of a and b
+func gcd(a, b int) int {
+	for b != 0 {
+		a, b = b, a%b
+	}
+	return a
+}
+
+// besselI0 evaluates the zeroth-order modified Bessel function of the first kind
+func besselI0(x float64) float64 {
+	sum, term := 1.0, 1.0
+	for k := 1; term > 1e-12*sum; k++ {
+		half := x / (2 * float64(k))
+		term *= half * half
+		sum += term
+	}
+	return sum
+}
@@ -0,0 +1,182 @@
+package audio
+
+import (
+	"bytes"
+	"encoding/binary"
+	"fmt"
+	"io"
+	"math"
+	"testing"
+)
+
+// resamplerFormats are the input formats exercised by the resampler tests
+var resamplerFormats = []struct {
+	rate     int
+	channels int
+}{
+	{48000, 2},
+	{44100, 1},
+	{22050, 2},
+	{8000, 1},
+	{16000, 2},
+}
+
+// sineTone returns seconds of a sine at freq Hz and amplitude 10000 as
+// interleaved 16-bit PCM, the same on every channel
+func sineTone(rate, channels int, freq, seconds float64) []byte {
+	n := int(float64(rate) * seconds)
+	data := make([]byte, n*channels*2)
+	for i := 0; i < n; i++ {
+		v := int16(10000 * math.Sin(2*math.Pi*freq*float64(i)/float64(rate)))
+		for c := 0; c < channels; c++ {
+			binary.LittleEndian.PutUint16(data[(i*channels+c)*2:], uint16(v))
+		}
+	}
+	return data
+}
+
+// toneAmplitude returns the amplitude of the freq Hz component of mono PCM
+// and the RMS of the whole signal
+func toneAmplitude(data []byte, rate int, freq float64) (float64, float64) {
+	n := len(data) / 2
+	var re, im, total float64
+	for i := 0; i < n; i++ {
+		x := float64(int16(binary.LittleEndian.Uint16(data[i*2:])))
+		phase := 2 * math.Pi * freq * float64(i) / float64(rate)
+		re += x * math.Cos(phase)
+		im += x * math.Sin(phase)
+		total += x * x
+	}
+	return 2 * math.Hypot(re, im) / float64(n), math.Sqrt(total / float64(n))
+}
+
+// resampleAll converts input in chunks of chunk bytes and flushes the filter
+func resampleAll(t testing.TB, input []byte, rate, channels, chunk int) []byte {
+	r, err := NewResampler(rate, channels, 16000)
+	if err != nil {
+		t.Fatal(err)
+	}
+	var out []byte
+	for i := 0; i < len(input); i += chunk {
+		out = append(out, r.Process(input[i:min(i+chunk, len(input))])...)
+	}
+	return append(out, r.Flush()...)
+}
+
+// trimEdges drops the first and last 1000 samples, where the filter ramps
+func trimEdges(data []byte) []byte {
+	return data[2000 : len(data)-2000]
+}
+
+func TestResamplerChunkSizeIndependence(t *testing.T) {
+	for _, format := range resamplerFormats {
+		input := sineTone(format.rate, format.channels, 1000, 0.5)
+		whole := resampleAll(t, input, format.rate, format.channels, len(input))
+
+		// Chunks split frames and samples at every possible offset
+		for _, chunk := range []int{1, 3, 333, 4097} {
+			if got := resampleAll(t, input, format.rate, format.channels, chunk); !bytes.Equal(got, whole) {
+				t.Errorf("%d Hz x%d: output in %d-byte chunks differs from one call", format.rate, format.channels, chunk)
+			}
+		}
+
+		// The output lasts as long as the input, give or take a sample
+		want := len(input) / (2 * format.channels) * 16000 / format.rate
+		if got := len(whole) / 2; got < want-1 || got > want+1 {
+			t.Errorf("%d Hz x%d: %d output samples; want %d", format.rate, format.channels, got, want)
+		}
+	}
+}
+
+func TestResamplerPassband(t *testing.T) {
+	for _, format := range resamplerFormats {
+		// The passband ends short of the cutoff, at 80% of the lower Nyquist frequency
+		edge := 0.8 * float64(min(format.rate, 16000)) / 2
+		for _, freq := range []float64{300, 1000, 3000, 6000} {
+			if freq > edge {
+				continue
+			}
+			input := sineTone(format.rate, format.channels, freq, 1)
+			output := trimEdges(resampleAll(t, input, format.rate, format.channels, 640))
+
+			if amplitude, _ := toneAmplitude(output, 16000, freq); math.Abs(amplitude-10000) > 100 {
+				t.Errorf("%d Hz x%d: %v Hz tone amplitude %.0f; want 10000 within 1%%",
+					format.rate, format.channels, freq, amplitude)
+			}
+		}
+	}
+}
+
+func TestResamplerStopband(t *testing.T) {
+	for _, format := range resamplerFormats {
+		if format.rate <= 16000 {
+			continue
+		}
+		// Above the 8 kHz output Nyquist frequency, so it would alias
+		for _, freq := range []float64{9000, 10000} {
+			input := sineTone(format.rate, format.channels, freq, 1)
+			output := trimEdges(resampleAll(t, input, format.rate, format.channels, 640))
+
+			// At least 60 dB below the 7071 RMS input
+			if _, rms := toneAmplitude(output, 16000, freq); rms > 7.071 {
+				t.Errorf("%d Hz x%d: %v Hz tone leaks with RMS %.2f; want < 7.07 (-60 dB)",
+					format.rate, format.channels, freq, rms)
+			}
+		}
+	}
+}
+
+func TestResamplerProcessAllocs(t *testing.T) {
+	for _, format := range resamplerFormats {
+		r, err := NewResampler(format.rate, format.channels, 16000)
+		if err != nil {
+			t.Fatal(err)
+		}
+		chunk := sineTone(format.rate, format.channels, 1000, 0.02)
+		r.Process(chunk) // Grow the buffers
+
+		if allocs := testing.AllocsPerRun(100, func() { r.Process(chunk) }); allocs != 0 {
+			t.Errorf("%d Hz x%d: Process allocates %v times per call; want 0", format.rate, format.channels, allocs)
+		}
+	}
+}
+
+func TestResamplingReader(t *testing.T) {
+	input := sineTone(48000, 2, 1000, 0.5)
+	reader, err := NewResamplingReader(bytes.NewReader(input), 48000, 2, 16000)
+	if err != nil {
+		t.Fatal(err)
+	}
+	got, err := io.ReadAll(reader)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if want := resampleAll(t, input, 48000, 2, len(input)); !bytes.Equal(got, want) {
+		t.Errorf("reader output (%d bytes) differs from Resampler output (%d bytes)", len(got), len(want))
+	}
+}
+
+func BenchmarkResampler(b *testing.B) {
+	for _, format := range []struct {
+		rate     int
+		channels int
+	}{
+		{48000, 2},
+		{44100, 1},
+	} {
+		b.Run(fmt.Sprintf("%dHz_x%d", format.rate, format.channels), func(b *testing.B) {
+			// One 20 ms capture period
+			chunk := sineTone(format.rate, format.channels, 1000, 0.02)
+			r, err := NewResampler(format.rate, format.channels, 16000)
+			if err != nil {
+				b.Fatal(err)
+			}
+
+			b.SetBytes(int64(len(chunk)))
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				r.Process(chunk)
+			}
+		})
+	}
+}
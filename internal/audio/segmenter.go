@@ -0,0 +1,188 @@
+package audio
+
+import (
+	"errors"
+	"fmt"
+	"io"
+	"time"
+)
+
+// Segment is a region of speech in a recording of 16-bit mono PCM
+type Segment struct {
+	// StartSample is the index of the first sample of the region
+	StartSample int
+
+	// EndSample is the index one past the last sample of the region
+	EndSample int
+}
+
+// Start returns the start time of the segment
+func (s Segment) Start(sampleRate int) time.Duration {
+	return time.Duration(s.StartSample) * time.Second / time.Duration(sampleRate)
+}
+
+// End returns the end time of the segment
+func (s Segment) End(sampleRate int) time.Duration {
+	return time.Duration(s.EndSample) * time.Second / time.Duration(sampleRate)
+}
+
+// PCM returns the segment's audio from the recording it was found in
+func (s Segment) PCM(data []byte) []byte {
+	return data[s.StartSample*2 : s.EndSample*2]
+}
+
+// SegmenterConfig holds configuration for offline speech segmentation
+type SegmenterConfig struct {
+	// VAD configures the detector run over the recording
+	VAD VADConfig
+
+	// FrameDuration is the analysis frame size
+	FrameDuration time.Duration
+
+	// Padding is the audio kept before and after each detected region
+	Padding time.Duration
+
+	// MinGap merges regions separated by less silence than this (after padding)
+	MinGap time.Duration
+}
+
+// DefaultSegmenterConfig returns a segmentation configuration for 16kHz recordings
+// Silence ends a region sooner than in live transcription; short gaps are
+// merged back afterwards, so segment edges stay tight. The noise floor moves
+// more slowly than live, so seconds of unbroken speech are not mistaken for it.
+func DefaultSegmenterConfig() SegmenterConfig {
+	vadConfig := DefaultVADConfig()
+	vadConfig.SilenceDuration = 300 * time.Millisecond
+	vadConfig.NoiseWindow = 10 * time.Second
+
+	return SegmenterConfig{
+		VAD:           vadConfig,
+		FrameDuration: 30 * time.Millisecond,
+		Padding:       200 * time.Millisecond,
+		MinGap:        500 * time.Millisecond,
+	}
+}
+
+// Segmenter finds speech regions in a stream of audio frames
+// Feed the recording in order with Process, then call Finish.
+type Segmenter struct {
+	config         SegmenterConfig
+	vad            VAD
+	speechSamples  int
+	silenceSamples int
+	position       int
+	start          int
+	regions        []Segment
+}
+
+// NewSegmenter creates a segmenter running the configured VAD
+func NewSegmenter(config SegmenterConfig) (*Segmenter, error) {
+	if config.VAD.SampleRate <= 0 {
+		config.VAD.SampleRate = DefaultVADConfig().SampleRate
+	}
+	vad, err := NewVAD(config.VAD)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create VAD: %w", err)
+	}
+
+	return &Segmenter{
+		config:         config,
+		vad:            vad,
+		speechSamples:  samplesFor(config.VAD.SpeechDuration, config.VAD.SampleRate),
+		silenceSamples: samplesFor(config.VAD.SilenceDuration, config.VAD.SampleRate),
+		start:          -1,
+	}, nil
+}
+
+// Process feeds the next frame of the recording
+func (s *Segmenter) Process(frame []byte) {
+	stats := AnalyzeFrame(frame)
+	_, speechStarted, speechEnded := s.vad.ProcessAnalyzed(frame, stats)
+	s.position += stats.Samples
+
+	// The VAD reports events once speech or silence has lasted long enough,
+	// so move the boundaries back to where they actually began
+	if speechStarted {
+		s.start = max(s.position-s.speechSamples, 0)
+	}
+	if speechEnded && s.start >= 0 {
+		s.regions = append(s.regions, Segment{
+			StartSample: s.start,
+			EndSample:   max(s.position-s.silenceSamples, s.start),
+		})
+		s.start = -1
+	}
+}
+
+// Finish closes any open region and returns the padded, merged speech segments
+func (s *Segmenter) Finish() []Segment {
+	if s.start >= 0 {
+		s.regions = append(s.regions, Segment{StartSample: s.start, EndSample: s.position})
+		s.start = -1
+	}
+
+	padding := samplesFor(s.config.Padding, s.config.VAD.SampleRate)
+	minGap := samplesFor(s.config.MinGap, s.config.VAD.SampleRate)
+
+	segments := make([]Segment, 0, len(s.regions))
+	for _, region := range s.regions {
+		region.StartSample = max(region.StartSample-padding, 0)
+		region.EndSample = min(region.EndSample+padding, s.position)
+
+		if n := len(segments); n > 0 && region.StartSample-segments[n-1].EndSample < minGap {
+			segments[n-1].EndSample = max(segments[n-1].EndSample, region.EndSample)
+			continue
+		}
+		segments = append(segments, region)
+	}
+	return segments
+}
+
+// SegmentPCM finds speech regions in a recording of 16-bit mono PCM
+// The audio is analyzed in place, without copying.
+func SegmentPCM(data []byte, config SegmenterConfig) ([]Segment, error) {
+	s, err := NewSegmenter(config)
+	if err != nil {
+		return nil, err
+	}
+
+	frameBytes := s.frameBytes()
+	for offset := 0; offset < len(data); offset += frameBytes {
+		s.Process(data[offset:min(offset+frameBytes, len(data))])
+	}
+	return s.Finish(), nil
+}
+
+// SegmentReader finds speech regions in a stream of 16-bit mono PCM
+// The stream is read one frame at a time, so recordings of any length are
+// segmented in constant memory.
+func SegmentReader(r io.Reader, config SegmenterConfig) ([]Segment, error) {
+	s, err := NewSegmenter(config)
+	if err != nil {
+		return nil, err
+	}
+
+	frame := make([]byte, s.frameBytes())
+	for {
+		n, err := io.ReadFull(r, frame)
+		if n > 0 {
+			s.Process(frame[:n])
+		}
+		if errors.Is(err, io.EOF) || errors.Is(err, io.ErrUnexpectedEOF) {
+			break
+		}
+		if err != nil {
+			return nil, fmt.Errorf("failed to read audio: %w", err)
+		}
+	}
+	return s.Finish(), nil
+}
+
+// frameBytes returns the analysis frame size in bytes (whole 16-bit samples)
+func (s *Segmenter) frameBytes() int {
+	frameDuration := s.config.FrameDuration
+	if frameDuration <= 0 {
+		frameDuration = DefaultSegmenterConfig().FrameDuration
+	}
+	return max(samplesFor(frameDuration, s.config.VAD.SampleRate), 1) * 2
+}
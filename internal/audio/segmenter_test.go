@@ -0,0 +1,148 @@
+package audio
+
+import (
+	"bytes"
+	"encoding/binary"
+	"math"
+	"testing"
+	"time"
+)
+
+// segmenterRate is the sample rate of the synthetic recordings
+const segmenterRate = 16000
+
+// toneBursts returns seconds of 16 kHz PCM that is silent except for a 300 Hz
+// tone over each [start, end) interval, given in seconds
+func toneBursts(seconds float64, bursts ...[2]float64) []byte {
+	samples := int(seconds * segmenterRate)
+	data := make([]byte, samples*2)
+	for _, burst := range bursts {
+		start, end := int(burst[0]*segmenterRate), min(int(burst[1]*segmenterRate), samples)
+		for i := start; i < end; i++ {
+			value := int16(10000 * math.Sin(2*math.Pi*300*float64(i)/segmenterRate))
+			binary.LittleEndian.PutUint16(data[i*2:], uint16(value))
+		}
+	}
+	return data
+}
+
+// toneSegmenterConfig is the default configuration with a fixed threshold,
+// so the edges depend only on the boundary math, and the given padding and
+// minimum gap
+func toneSegmenterConfig(padding, minGap time.Duration) SegmenterConfig {
+	config := DefaultSegmenterConfig()
+	config.VAD.AdaptiveThreshold = false
+	config.Padding = padding
+	config.MinGap = minGap
+	return config
+}
+
+// checkSegments compares segments with want, in seconds, allowing each edge
+// to be off by one analysis frame
+func checkSegments(t *testing.T, got []Segment, want [][2]float64) {
+	t.Helper()
+	const frame = segmenterRate * 30 / 1000
+	if len(got) != len(want) {
+		t.Fatalf("found %d segments %v; want %d", len(got), got, len(want))
+	}
+	for i, segment := range got {
+		start, end := int(want[i][0]*segmenterRate), int(want[i][1]*segmenterRate)
+		if abs(segment.StartSample-start) > frame || abs(segment.EndSample-end) > frame {
+			t.Errorf("segment %d is samples %d-%d; want %d-%d within %d", i,
+				segment.StartSample, segment.EndSample, start, end, frame)
+		}
+	}
+}
+
+func abs(n int) int {
+	if n < 0 {
+		return -n
+	}
+	return n
+}
+
+func TestSegmentPCMEdges(t *testing.T) {
+	data := toneBursts(7, [2]float64{1, 2}, [2]float64{4, 5.5})
+
+	segments, err := SegmentPCM(data, toneSegmenterConfig(0, 0))
+	if err != nil {
+		t.Fatal(err)
+	}
+	checkSegments(t, segments, [][2]float64{{1, 2}, {4, 5.5}})
+}
+
+func TestSegmentPCMPadding(t *testing.T) {
+	// The first burst starts within the padding of the recording's start and
+	// the last is still open when the recording ends
+	data := toneBursts(6, [2]float64{0.1, 1}, [2]float64{3, 4}, [2]float64{5.5, 6})
+
+	segments, err := SegmentPCM(data, toneSegmenterConfig(200*time.Millisecond, 0))
+	if err != nil {
+		t.Fatal(err)
+	}
+	checkSegments(t, segments, [][2]float64{{0, 1.2}, {2.8, 4.2}, {5.3, 6}})
+	if first, last := segments[0].StartSample, segments[len(segments)-1].EndSample; first != 0 || last != 6*segmenterRate {
+		t.Errorf("padding not clamped to the recording: segments span %d-%d", first, last)
+	}
+}
+
+func TestSegmentPCMMergesShortGaps(t *testing.T) {
+	// 600 ms apart, longer than the 300 ms silence that ends a region
+	data := toneBursts(5, [2]float64{1, 2}, [2]float64{2.6, 3.5})
+
+	segments, err := SegmentPCM(data, toneSegmenterConfig(0, 500*time.Millisecond))
+	if err != nil {
+		t.Fatal(err)
+	}
+	checkSegments(t, segments, [][2]float64{{1, 2}, {2.6, 3.5}})
+
+	segments, err = SegmentPCM(data, toneSegmenterConfig(0, time.Second))
+	if err != nil {
+		t.Fatal(err)
+	}
+	checkSegments(t, segments, [][2]float64{{1, 3.5}})
+}
+
+func TestSegmentReaderMatchesSegmentPCM(t *testing.T) {
+	// A length that is not a whole number of frames, with the default
+	// adaptive threshold
+	data := toneBursts(9.01, [2]float64{0.5, 1.7}, [2]float64{2.2, 2.9}, [2]float64{6, 9.01})
+	config := DefaultSegmenterConfig()
+
+	fromPCM, err := SegmentPCM(data, config)
+	if err != nil {
+		t.Fatal(err)
+	}
+	fromReader, err := SegmentReader(bytes.NewReader(data), config)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(fromPCM) == 0 || len(fromPCM) != len(fromReader) {
+		t.Fatalf("SegmentPCM = %v, SegmentReader = %v; want the same segments", fromPCM, fromReader)
+	}
+	for i := range fromPCM {
+		if fromPCM[i] != fromReader[i] {
+			t.Errorf("segment %d: SegmentPCM %v, SegmentReader %v", i, fromPCM[i], fromReader[i])
+		}
+	}
+}
+
+// BenchmarkSegmentPCM reports how many times faster than real time a minute
+// of speech and pauses is segmented
+func BenchmarkSegmentPCM(b *testing.B) {
+	var bursts [][2]float64
+	for start := 0.5; start < 60; start += 4 {
+		bursts = append(bursts, [2]float64{start, start + 2.5})
+	}
+	data := toneBursts(60, bursts...)
+	config := DefaultSegmenterConfig()
+
+	b.SetBytes(int64(len(data)))
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		if _, err := SegmentPCM(data, config); err != nil {
+			b.Fatal(err)
+		}
+	}
+	b.ReportMetric(60*float64(b.N)/b.Elapsed().Seconds(), "x-realtime")
+}
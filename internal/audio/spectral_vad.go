@@ -0,0 +1,231 @@
+package audio
+
+import (
+	"encoding/binary"
+	"math"
+	"time"
+)
+
+const (
+	// spectralBlockSize is the FFT size (32ms at 16kHz)
+	spectralBlockSize = 512
+
+	// speechBandLow and speechBandHigh bound the band holding most speech
+	// energy (first formant up to upper consonant energy). Mains hum and its
+	// low harmonics, HVAC rumble and handling noise fall below it.
+	speechBandLow  = 200.0
+	speechBandHigh = 4000.0
+)
+
+// SpectralVAD detects speech from the share of frame energy in the speech band
+// combined with the zero-crossing rate
+//
+// Hum and rumble are loud enough to pass an energy threshold but put their
+// energy below the speech band, while fans and hiss spread it over the whole
+// spectrum and cross zero far more often than voiced speech. Frames failing
+// either test are treated as silence, so they no longer reach the recognizer.
+type SpectralVAD struct {
+	config   VADConfig
+	tracker  speechTracker
+	gate     gate
+	spectrum *spectrum
+	lowBin   int
+	highBin  int
+}
+
+// NewSpectralVAD creates a new spectral voice activity detector
+func NewSpectralVAD(config VADConfig) *SpectralVAD {
+	defaults := DefaultVADConfig()
+	if config.SampleRate <= 0 {
+		config.SampleRate = defaults.SampleRate
+	}
+	if config.MinBandRatio <= 0 {
+		config.MinBandRatio = defaults.MinBandRatio
+	}
+	if config.MaxZeroCrossingRate <= 0 {
+		config.MaxZeroCrossingRate = defaults.MaxZeroCrossingRate
+	}
+
+	binWidth := float64(config.SampleRate) / spectralBlockSize
+	highBin := int(speechBandHigh / binWidth)
+	if highBin > spectralBlockSize/2 {
+		highBin = spectralBlockSize / 2
+	}
+
+	return &SpectralVAD{
+		config:   config,
+		tracker:  newSpeechTracker(config),
+		gate:     newGate(config),
+		spectrum: newSpectrum(spectralBlockSize),
+		lowBin:   int(math.Ceil(speechBandLow / binWidth)),
+		highBin:  highBin,
+	}
+}
+
+// ProcessFrame processes an audio frame and returns whether speech is active
+// Returns: (isSpeechActive, speechStarted, speechEnded)
+func (v *SpectralVAD) ProcessFrame(audioData []byte) (bool, bool, bool) {
+	return v.ProcessAnalyzed(audioData, AnalyzeFrame(audioData))
+}
+
+// ProcessAnalyzed processes an audio frame with precomputed stats
+func (v *SpectralVAD) ProcessAnalyzed(audioData []byte, stats FrameStats) (bool, bool, bool) {
+	power := stats.MeanSquare()
+	threshold := v.gate.update(power, stats.Samples)
+
+	// Band energy can't exceed the total, and broadband noise is rejected by
+	// its zero-crossing rate, so only run the FFT when the frame could be speech
+	var bandPower float64
+	if power > threshold && stats.ZeroCrossingRate() <= v.config.MaxZeroCrossingRate {
+		if ratio := v.bandRatio(audioData); ratio >= v.config.MinBandRatio {
+			bandPower = ratio * power
+		}
+	}
+
+	// Hysteresis: use higher threshold to resume speech detection
+	return v.tracker.advance(bandPower > threshold, bandPower > threshold*1.5*1.5, stats.Samples)
+}
+
+// IsSpeaking returns whether speech is currently active
+func (v *SpectralVAD) IsSpeaking() bool {
+	return v.tracker.isSpeaking
+}
+
+// Threshold returns the current speech-band threshold (RMS energy)
+func (v *SpectralVAD) Threshold() float64 {
+	return v.gate.threshold()
+}
+
+// NoiseFloor returns the current noise floor estimate (RMS energy)
+func (v *SpectralVAD) NoiseFloor() float64 {
+	return v.gate.noiseFloor()
+}
+
+// TrailingSilence returns how long the audio has stayed below the threshold
+func (v *SpectralVAD) TrailingSilence() time.Duration {
+	return v.tracker.trailingSilence(v.config.SampleRate)
+}
+
+// Reset resets the VAD state
+func (v *SpectralVAD) Reset() {
+	v.tracker.reset()
+}
+
+// bandRatio returns the fraction of the frame's spectral energy in the speech band
+// Frames longer than one FFT block are analyzed block by block, with the last
+// block aligned to the end of the frame so every block has the same window.
+func (v *SpectralVAD) bandRatio(data []byte) float64 {
+	samples := len(data) / 2
+	if samples == 0 {
+		return 0
+	}
+	blockLen := min(samples, spectralBlockSize)
+
+	var band, total float64
+	for start := 0; start < samples; start += blockLen {
+		if start+blockLen > samples {
+			start = samples - blockLen
+		}
+		v.spectrum.load(data[start*2 : (start+blockLen)*2])
+		v.spectrum.transform()
+		b, t := v.spectrum.bandPower(v.lowBin, v.highBin)
+		band += b
+		total += t
+	}
+
+	if total == 0 {
+		return 0
+	}
+	return band / total
+}
+
+// spectrum computes power spectra of 16-bit audio blocks with a radix-2 FFT
+// Buffers are allocated up front, so analysis does not allocate.
+type spectrum struct {
+	size      int
+	twiddle   []complex128
+	buf       []complex128
+	window    []float64
+	windowLen int
+}
+
+// newSpectrum creates an FFT of the given power-of-two size
+func newSpectrum(size int) *spectrum {
+	s := &spectrum{
+		size:    size,
+		twiddle: make([]complex128, size/2),
+		buf:     make([]complex128, size),
+		window:  make([]float64, size),
+	}
+	for k := range s.twiddle {
+		sin, cos := math.Sincos(-2 * math.Pi * float64(k) / float64(size))
+		s.twiddle[k] = complex(cos, sin)
+	}
+	return s
+}
+
+// load applies a Hann window to up to size little-endian 16-bit samples and
+// zero-pads the rest of the FFT buffer
+func (s *spectrum) load(data []byte) {
+	n := len(data) / 2
+	if n != s.windowLen {
+		// Frames have a fixed length in practice, so this runs once
+		for i := 0; i < n; i++ {
+			s.window[i] = 0.5 - 0.5*math.Cos(2*math.Pi*float64(i)/float64(n))
+		}
+		s.windowLen = n
+	}
+
+	for i := 0; i < n; i++ {
+		sample := float64(int16(binary.LittleEndian.Uint16(data[i*2:])))
+		s.buf[i] = complex(sample*s.window[i], 0)
+	}
+	clear(s.buf[n:])
+}
+
+// transform runs an in-place iterative radix-2 FFT over the buffer
+func (s *spectrum) transform() {
+	buf := s.buf
+	n := s.size
+
+	// Bit-reversal permutation
+	for i, j := 1, 0; i < n; i++ {
+		bit := n >> 1
+		for ; j&bit != 0; bit >>= 1 {
+			j ^= bit
+		}
+		j ^= bit
+		if i < j {
+			buf[i], buf[j] = buf[j], buf[i]
+		}
+	}
+
+	// Butterflies
+	for length := 2; length <= n; length <<= 1 {
+		half := length >> 1
+		step := n / length
+		for start := 0; start < n; start += length {
+			for k := 0; k < half; k++ {
+				w := s.twiddle[k*step]
+				u := buf[start+k]
+				t := buf[start+k+half] * w
+				buf[start+k] = u + t
+				buf[start+k+half] = u - t
+			}
+		}
+	}
+}
+
+// bandPower returns the power in bins low to high and in all bins up to Nyquist
+func (s *spectrum) bandPower(low, high int) (float64, float64) {
+	var band, total float64
+	for k := 0; k <= s.size/2; k++ {
+		re, im := real(s.buf[k]), imag(s.buf[k])
+		p := re*re + im*im
+		total += p
+		if k >= low && k <= high {
+			band += p
+		}
+	}
+	return band, total
+}
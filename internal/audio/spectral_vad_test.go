@@ -0,0 +1,136 @@
+package audio
+
+import (
+	"encoding/binary"
+	"math"
+	"math/rand"
+	"testing"
+	"time"
+)
+
+// vadFrameSamples is the frame size fed to the detectors (30 ms at 16 kHz)
+const vadFrameSamples = 480
+
+// noisyRoom returns seconds of 16 kHz PCM of mains hum with harmonics over
+// brown noise, with a 3 s voiced burst every 10 s, and which frames of
+// vadFrameSamples hold the burst
+func noisyRoom(seconds int) ([]byte, []bool) {
+	const rate = 16000
+	rng := rand.New(rand.NewSource(9))
+	samples := seconds * rate
+	data := make([]byte, samples*2)
+	speech := make([]bool, samples/vadFrameSamples)
+
+	var brown float64
+	for i := 0; i < samples; i++ {
+		t := float64(i) / rate
+
+		hum := 0.08*math.Sin(2*math.Pi*60*t) + 0.04*math.Sin(2*math.Pi*120*t) + 0.02*math.Sin(2*math.Pi*180*t)
+		brown = 0.995*brown + 0.02*rng.NormFloat64()
+		value := hum + 0.3*brown
+
+		// A vowel: 140 Hz pitch with harmonics shaped by formants near
+		// 700 Hz and 1200 Hz, with a syllable-rate envelope
+		if offset := math.Mod(t, 10); offset >= 4 && offset < 7 {
+			envelope := 0.6 + 0.4*math.Sin(2*math.Pi*4*t)
+			var vowel float64
+			for h := 1; h*140 < 4000; h++ {
+				f := float64(h * 140)
+				gain := math.Exp(-math.Pow((f-700)/250, 2)) + 0.6*math.Exp(-math.Pow((f-1200)/300, 2)) + 0.05
+				vowel += gain * math.Sin(2*math.Pi*f*t)
+			}
+			value += 0.12 * envelope * vowel
+			if frame := i / vadFrameSamples; frame < len(speech) {
+				speech[frame] = true
+			}
+		}
+
+		binary.LittleEndian.PutUint16(data[i*2:], uint16(int16(max(-1, min(1, value))*32767)))
+	}
+	return data, speech
+}
+
+// passFractions feeds the audio through vad frame by frame and returns the
+// fraction of non-speech frames and of speech frames it passed as speech
+func passFractions(vad VAD, data []byte, speech []bool) (float64, float64) {
+	var noisePassed, noiseFrames, speechPassed, speechFrames int
+	for frame, isSpeech := range speech {
+		active, _, _ := vad.ProcessFrame(data[frame*vadFrameSamples*2 : (frame+1)*vadFrameSamples*2])
+		if isSpeech {
+			speechFrames++
+			if active {
+				speechPassed++
+			}
+		} else {
+			noiseFrames++
+			if active {
+				noisePassed++
+			}
+		}
+	}
+	return float64(noisePassed) / float64(noiseFrames), float64(speechPassed) / float64(speechFrames)
+}
+
+// noisyRoomVADConfig is the default configuration with a fixed threshold
+// (--vad-adaptive=false), which the hum is loud enough to pass, and a short
+// silence delay, so the hangover after each burst is a small part of the
+// non-speech frames
+func noisyRoomVADConfig(mode VADMode) VADConfig {
+	config := DefaultVADConfig()
+	config.Mode = mode
+	config.AdaptiveThreshold = false
+	config.SilenceDuration = 300 * time.Millisecond
+	return config
+}
+
+func TestSpectralVADRejectsHumAndNoise(t *testing.T) {
+	data, speech := noisyRoom(60)
+
+	energy, err := NewVAD(noisyRoomVADConfig(VADModeEnergy))
+	if err != nil {
+		t.Fatal(err)
+	}
+	spectral, err := NewVAD(noisyRoomVADConfig(VADModeSpectral))
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	energyNoise, energySpeech := passFractions(energy, data, speech)
+	spectralNoise, spectralSpeech := passFractions(spectral, data, speech)
+	t.Logf("energy VAD:   %.1f%% of non-speech frames passed, %.1f%% of speech frames", 100*energyNoise, 100*energySpeech)
+	t.Logf("spectral VAD: %.1f%% of non-speech frames passed, %.1f%% of speech frames", 100*spectralNoise, 100*spectralSpeech)
+
+	if energyNoise < 0.5 {
+		t.Fatalf("energy VAD passed only %.1f%% of non-speech frames; the hum is too quiet to test with", 100*energyNoise)
+	}
+	if spectralNoise > 0.1 {
+		t.Errorf("spectral VAD passed %.1f%% of non-speech frames; want at most 10%%", 100*spectralNoise)
+	}
+	if spectralSpeech < 0.9 {
+		t.Errorf("spectral VAD passed %.1f%% of speech frames; want at least 90%%", 100*spectralSpeech)
+	}
+}
+
+// BenchmarkVADNonSpeechPass reports the fraction of non-speech frames of the
+// noisy room each detector passes to the recognizer, with its cost per frame
+func BenchmarkVADNonSpeechPass(b *testing.B) {
+	data, speech := noisyRoom(20)
+
+	for _, mode := range []VADMode{VADModeEnergy, VADModeSpectral} {
+		b.Run(string(mode), func(b *testing.B) {
+			var noise, voiced float64
+			for i := 0; i < b.N; i++ {
+				vad, err := NewVAD(noisyRoomVADConfig(mode))
+				if err != nil {
+					b.Fatal(err)
+				}
+				n, s := passFractions(vad, data, speech)
+				noise += n
+				voiced += s
+			}
+			b.ReportMetric(noise/float64(b.N), "nonspeech-pass")
+			b.ReportMetric(voiced/float64(b.N), "speech-pass")
+			b.ReportMetric(float64(b.Elapsed().Nanoseconds())/float64(b.N*len(speech)), "ns/frame")
+		})
+	}
+}
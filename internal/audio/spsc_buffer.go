@@ -0,0 +1,230 @@
+package audio
+
+import (
+	"errors"
+	"sync/atomic"
+)
+
+// ErrBufferFull is returned when a write is rejected because the buffer has no free space
+var ErrBufferFull = errors.New("buffer is full")
+
+// FullPolicy controls what a SPSCRingBuffer does when a write does not fit
+type FullPolicy int
+
+const (
+	// RejectWhenFull writes as much as fits and rejects the rest
+	RejectWhenFull FullPolicy = iota
+
+	// OverwriteOldest discards the oldest unread bytes to make room for new data
+	OverwriteOldest
+)
+
+// SPSCRingBuffer is a lock-free circular buffer for one producer and one consumer
+//
+// Exactly one goroutine may call Write and exactly one goroutine may call Read,
+// Reset and Discard. The cursors are monotonic byte counters, so data is moved
+// with at most two copy() calls per operation instead of byte by byte.
+type SPSCRingBuffer struct {
+	buffer []byte
+	size   uint64
+	policy FullPolicy
+
+	// readPos is only advanced by the producer in OverwriteOldest mode
+	readPos  atomic.Uint64
+	writePos atomic.Uint64
+
+	overwritten atomic.Uint64
+
+	// peekPos is the read cursor observed by the last Peek (consumer only)
+	peekPos uint64
+}
+
+// NewSPSCRingBuffer creates a new single-producer/single-consumer ring buffer
+// with the specified size in bytes
+func NewSPSCRingBuffer(size int, policy FullPolicy) *SPSCRingBuffer {
+	return &SPSCRingBuffer{
+		buffer: make([]byte, size),
+		size:   uint64(size),
+		policy: policy,
+	}
+}
+
+// Write writes data to the buffer (producer side)
+// With RejectWhenFull it returns the number of bytes that fit and ErrBufferFull
+// if nothing could be written. With OverwriteOldest it always accepts the data,
+// keeping only the newest Size() bytes when data is larger than the buffer.
+func (rb *SPSCRingBuffer) Write(data []byte) (int, error) {
+	if rb.size == 0 {
+		return 0, ErrBufferFull
+	}
+
+	w := rb.writePos.Load()
+	n := uint64(len(data))
+
+	if rb.policy == OverwriteOldest {
+		if n > rb.size {
+			rb.overwritten.Add(n - rb.size)
+			data = data[n-rb.size:]
+			n = rb.size
+		}
+		// Advance the read cursor past the bytes we are about to overwrite.
+		// The consumer validates its own reads with a CAS on the same cursor.
+		for {
+			r := rb.readPos.Load()
+			free := rb.size - (w - r)
+			if free >= n {
+				break
+			}
+			if rb.readPos.CompareAndSwap(r, r+(n-free)) {
+				rb.overwritten.Add(n - free)
+				break
+			}
+		}
+	} else {
+		free := rb.size - (w - rb.readPos.Load())
+		if free == 0 {
+			return 0, ErrBufferFull
+		}
+		if n > free {
+			n = free
+		}
+	}
+
+	rb.copyIn(w, data[:n])
+	rb.writePos.Store(w + n)
+	return int(n), nil
+}
+
+// Read reads up to len(data) bytes from the buffer (consumer side)
+// Returns the number of bytes read
+func (rb *SPSCRingBuffer) Read(data []byte) int {
+	for {
+		r := rb.readPos.Load()
+		w := rb.writePos.Load()
+
+		n := w - r
+		if n == 0 {
+			return 0 // Buffer is empty
+		}
+		if n > rb.size {
+			n = rb.size // Stale cursor, the CAS below will retry
+		}
+		if n > uint64(len(data)) {
+			n = uint64(len(data))
+		}
+
+		rb.copyOut(r, data[:n])
+
+		// If the producer overwrote our region while we were copying, the
+		// CAS fails and we retry from the new oldest byte.
+		if rb.readPos.CompareAndSwap(r, r+n) {
+			return int(n)
+		}
+	}
+}
+
+// Peek returns up to limit readable bytes in place without consuming them
+// (consumer side, limit <= 0 means all). The data is returned as at most two
+// slices over the internal buffer and must be released with Commit.
+func (rb *SPSCRingBuffer) Peek(limit int) (first, second []byte) {
+	r := rb.readPos.Load()
+	n := rb.writePos.Load() - r
+	if n > rb.size {
+		n = rb.size
+	}
+	if limit > 0 && uint64(limit) < n {
+		n = uint64(limit)
+	}
+	rb.peekPos = r
+	if n == 0 {
+		return nil, nil
+	}
+
+	start := r % rb.size
+	if start+n <= rb.size {
+		return rb.buffer[start : start+n], nil
+	}
+	return rb.buffer[start:], rb.buffer[:start+n-rb.size]
+}
+
+// Commit consumes n bytes returned by the last Peek (consumer side)
+// Returns false if the producer overwrote the peeked region in the meantime
+// (OverwriteOldest only), in which case the peeked data must be discarded.
+func (rb *SPSCRingBuffer) Commit(n int) bool {
+	return rb.readPos.CompareAndSwap(rb.peekPos, rb.peekPos+uint64(n))
+}
+
+// copyIn copies data into the buffer starting at cursor position pos
+func (rb *SPSCRingBuffer) copyIn(pos uint64, data []byte) {
+	start := pos % rb.size
+	n := copy(rb.buffer[start:], data)
+	copy(rb.buffer, data[n:])
+}
+
+// copyOut copies len(data) bytes out of the buffer starting at cursor position pos
+func (rb *SPSCRingBuffer) copyOut(pos uint64, data []byte) {
+	start := pos % rb.size
+	n := copy(data, rb.buffer[start:])
+	copy(data[n:], rb.buffer)
+}
+
+// Discard drops up to n unread bytes without copying them (consumer side)
+// Returns the number of bytes dropped
+func (rb *SPSCRingBuffer) Discard(n int) int {
+	for {
+		r := rb.readPos.Load()
+		avail := rb.writePos.Load() - r
+		skip := uint64(n)
+		if skip > avail {
+			skip = avail
+		}
+		if rb.readPos.CompareAndSwap(r, r+skip) {
+			return int(skip)
+		}
+	}
+}
+
+// Available returns the number of bytes available to read
+func (rb *SPSCRingBuffer) Available() int {
+	r := rb.readPos.Load()
+	w := rb.writePos.Load()
+	if w-r > rb.size {
+		return int(rb.size)
+	}
+	return int(w - r)
+}
+
+// Free returns the number of bytes available to write
+func (rb *SPSCRingBuffer) Free() int {
+	return int(rb.size) - rb.Available()
+}
+
+// Reset discards all unread data (consumer side)
+func (rb *SPSCRingBuffer) Reset() {
+	rb.Discard(rb.Available())
+}
+
+// Size returns the total size of the buffer
+func (rb *SPSCRingBuffer) Size() int {
+	return int(rb.size)
+}
+
+// Policy returns the full-buffer policy of the buffer
+func (rb *SPSCRingBuffer) Policy() FullPolicy {
+	return rb.policy
+}
+
+// Overwritten returns the total number of unread bytes discarded by OverwriteOldest
+func (rb *SPSCRingBuffer) Overwritten() uint64 {
+	return rb.overwritten.Load()
+}
+
+// IsFull returns true if the buffer is full
+func (rb *SPSCRingBuffer) IsFull() bool {
+	return rb.Available() == int(rb.size)
+}
+
+// IsEmpty returns true if the buffer is empty
+func (rb *SPSCRingBuffer) IsEmpty() bool {
+	return rb.Available() == 0
+}
@@ -0,0 +1,239 @@
+package audio
+
+import (
+	"bytes"
+	"runtime"
+	"sync"
+	"sync/atomic"
+	"testing"
+)
+
+// sequence returns n bytes counting up from start
+func sequence(start, n int) []byte {
+	data := make([]byte, n)
+	for i := range data {
+		data[i] = byte(start + i)
+	}
+	return data
+}
+
+func TestSPSCRingBufferWrapAround(t *testing.T) {
+	rb := NewSPSCRingBuffer(8, RejectWhenFull)
+
+	if n, err := rb.Write(sequence(0, 6)); n != 6 || err != nil {
+		t.Fatalf("Write = %d, %v; want 6, nil", n, err)
+	}
+	out := make([]byte, 4)
+	if n := rb.Read(out); n != 4 || !bytes.Equal(out, sequence(0, 4)) {
+		t.Fatalf("Read = %d %v; want 4 %v", n, out, sequence(0, 4))
+	}
+
+	// Wraps past the end of the buffer and is cut to the free space
+	if n, err := rb.Write(sequence(6, 10)); n != 6 || err != nil {
+		t.Fatalf("Write = %d, %v; want 6, nil", n, err)
+	}
+	if _, err := rb.Write([]byte{0}); err != ErrBufferFull {
+		t.Fatalf("Write to full buffer: err = %v; want ErrBufferFull", err)
+	}
+
+	first, second := rb.Peek(0)
+	if got := append(append([]byte(nil), first...), second...); !bytes.Equal(got, sequence(4, 8)) {
+		t.Fatalf("Peek = %v; want %v", got, sequence(4, 8))
+	}
+	if len(second) == 0 {
+		t.Fatal("Peek of wrapped data returned a single slice")
+	}
+	if !rb.Commit(len(first) + len(second)) {
+		t.Fatal("Commit failed without a concurrent writer")
+	}
+	if !rb.IsEmpty() {
+		t.Fatalf("Available = %d after committing everything", rb.Available())
+	}
+}
+
+func TestSPSCRingBufferOverwriteOldest(t *testing.T) {
+	rb := NewSPSCRingBuffer(8, OverwriteOldest)
+
+	rb.Write(sequence(0, 6))
+	rb.Write(sequence(6, 6))
+	if got := rb.Overwritten(); got != 4 {
+		t.Fatalf("Overwritten = %d; want 4", got)
+	}
+	out := make([]byte, 8)
+	if n := rb.Read(out); n != 8 || !bytes.Equal(out, sequence(4, 8)) {
+		t.Fatalf("Read = %d %v; want 8 %v", n, out, sequence(4, 8))
+	}
+
+	// A write larger than the buffer keeps only its newest bytes
+	rb.Write(sequence(0, 20))
+	if n := rb.Read(out); n != 8 || !bytes.Equal(out, sequence(12, 8)) {
+		t.Fatalf("Read = %d %v; want 8 %v", n, out, sequence(12, 8))
+	}
+}
+
+// TestSPSCRingBufferConcurrent streams a counting sequence from a producer to
+// a consumer goroutine; run with -race to check the cursor handoff
+func TestSPSCRingBufferConcurrent(t *testing.T) {
+	const total = 1 << 18
+
+	for _, policy := range []FullPolicy{RejectWhenFull, OverwriteOldest} {
+		rb := NewSPSCRingBuffer(4096, policy)
+
+		var wg sync.WaitGroup
+		var finished atomic.Bool
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			defer finished.Store(true)
+			chunk := make([]byte, 320)
+			for written := 0; written < total; {
+				chunk := chunk[:min(len(chunk), total-written)]
+				for i := range chunk {
+					chunk[i] = byte(written + i)
+				}
+				n, _ := rb.Write(chunk)
+				if n == 0 {
+					runtime.Gosched()
+				}
+				written += n
+			}
+		}()
+
+		out := make([]byte, 512)
+		received := 0
+		for received < total {
+			n := rb.Read(out)
+			if n == 0 {
+				if policy == OverwriteOldest && finished.Load() && rb.IsEmpty() {
+					break
+				}
+				runtime.Gosched()
+				continue
+			}
+			// Every read is a contiguous run of the stream, even when the
+			// producer overwrites the region being read
+			for i := 1; i < n; i++ {
+				if out[i] != out[i-1]+1 {
+					t.Fatalf("policy %d: read is not contiguous at byte %d: %v", policy, i, out[:n])
+				}
+			}
+			if policy == RejectWhenFull && out[0] != byte(received) {
+				t.Fatalf("policy %d: byte %d = %d; want %d", policy, received, out[0], byte(received))
+			}
+			received += n
+		}
+		wg.Wait()
+
+		if policy == RejectWhenFull && received != total {
+			t.Fatalf("received %d bytes; want %d", received, total)
+		}
+		if policy == OverwriteOldest && uint64(received)+rb.Overwritten()+uint64(rb.Available()) != total {
+			t.Fatalf("received %d + overwritten %d + left %d bytes; want %d",
+				received, rb.Overwritten(), rb.Available(), total)
+		}
+	}
+}
+
+// benchmarkChunk is one 20 ms capture period of 16 kHz mono PCM
+const benchmarkChunk = 640
+
+func BenchmarkRingBufferWriteRead(b *testing.B) {
+	rb := NewRingBuffer(64 * 1024)
+	chunk := make([]byte, benchmarkChunk)
+	out := make([]byte, benchmarkChunk)
+
+	b.SetBytes(benchmarkChunk)
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		rb.Write(chunk)
+		rb.Read(out)
+	}
+}
+
+func BenchmarkSPSCRingBufferWriteRead(b *testing.B) {
+	for _, bench := range []struct {
+		name   string
+		policy FullPolicy
+	}{
+		{"RejectWhenFull", RejectWhenFull},
+		{"OverwriteOldest", OverwriteOldest},
+	} {
+		b.Run(bench.name, func(b *testing.B) {
+			rb := NewSPSCRingBuffer(64*1024, bench.policy)
+			chunk := make([]byte, benchmarkChunk)
+			out := make([]byte, benchmarkChunk)
+
+			b.SetBytes(benchmarkChunk)
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				rb.Write(chunk)
+				rb.Read(out)
+			}
+		})
+	}
+}
+
+// benchmarkConcurrent streams b.N chunks from a producer goroutine to the
+// benchmark goroutine through write and read
+func benchmarkConcurrent(b *testing.B, write func([]byte) int, read func([]byte) int) {
+	chunk := make([]byte, benchmarkChunk)
+	out := make([]byte, benchmarkChunk)
+	total := b.N * benchmarkChunk
+
+	b.SetBytes(benchmarkChunk)
+	b.ReportAllocs()
+	b.ResetTimer()
+
+	go func() {
+		for written := 0; written < total; {
+			n := write(chunk[:min(len(chunk), total-written)])
+			if n == 0 {
+				runtime.Gosched()
+			}
+			written += n
+		}
+	}()
+	for received := 0; received < total; {
+		n := read(out)
+		if n == 0 {
+			runtime.Gosched()
+		}
+		received += n
+	}
+}
+
+func BenchmarkRingBufferConcurrent(b *testing.B) {
+	rb := NewRingBuffer(64 * 1024)
+	benchmarkConcurrent(b,
+		func(data []byte) int {
+			n, _ := rb.Write(data)
+			return n
+		},
+		rb.Read)
+}
+
+func BenchmarkSPSCRingBufferConcurrent(b *testing.B) {
+	b.Run("RejectWhenFull", func(b *testing.B) {
+		rb := NewSPSCRingBuffer(64*1024, RejectWhenFull)
+		benchmarkConcurrent(b,
+			func(data []byte) int {
+				n, _ := rb.Write(data)
+				return n
+			},
+			rb.Read)
+	})
+
+	// The consumer keeps up, so nothing is overwritten and every byte arrives
+	b.Run("OverwriteOldest", func(b *testing.B) {
+		rb := NewSPSCRingBuffer(64*1024, OverwriteOldest)
+		benchmarkConcurrent(b,
+			func(data []byte) int {
+				if rb.Free() < len(data) {
+					return 0
+				}
+				n, _ := rb.Write(data)
+				return n
+			},
+			rb.Read)
+	})
+}
@@ -0,0 +1,282 @@
+package audio
+
+import (
+	"bufio"
+	"context"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"time"
+)
+
+// StdinSource is the CaptureConfig.Source that reads audio from standard input
+const StdinSource = "-"
+
+// Pacing selects how fast a recorded source delivers its audio
+type Pacing string
+
+const (
+	// PacingRealtime delivers one capture period per period of wall time,
+	// like a microphone; frames the consumer can't take are handled by the
+	// overflow policy
+	PacingRealtime Pacing = "realtime"
+
+	// PacingFast delivers frames as fast as the consumer takes them and
+	// never drops any, for throughput runs and reproducible benchmarks
+	PacingFast Pacing = "fast"
+)
+
+// ParsePacing converts a pacing name to a Pacing
+// An empty name selects real-time pacing.
+func ParsePacing(name string) (Pacing, error) {
+	switch Pacing(name) {
+	case "", PacingRealtime:
+		return PacingRealtime, nil
+	case PacingFast:
+		return PacingFast, nil
+	default:
+		return "", fmt.Errorf("unknown pacing %q (valid: realtime, fast)", name)
+	}
+}
+
+// StreamCapturer implements the Capturer interface over recorded audio
+//
+// The source is a WAV or raw PCM file, or standard input, of 16-bit samples.
+// WAV input in another rate or channel count is converted to the configured
+// format; raw input must already be in it. Audio is delivered in
+// capture-period frames; when the input ends the capturer stops itself and
+// closes its channels, as a microphone capturer does on Stop.
+type StreamCapturer struct {
+	config    CaptureConfig
+	pacing    Pacing
+	samples   chan AudioSample
+	errors    chan error
+	framePool *FramePool
+	running   bool
+	mu        sync.RWMutex
+	stopChan  chan struct{}
+	stopOnce  sync.Once
+	file      *os.File // Closed on Stop to unblock reads; nil for stdin
+
+	// queue applies the overflow policy, only delivered to from the reader
+	queue *overflowQueue
+}
+
+// NewStreamCapturer creates a capturer reading config.Source
+func NewStreamCapturer(config CaptureConfig) (*StreamCapturer, error) {
+	pacing, err := ParsePacing(string(config.Pacing))
+	if err != nil {
+		return nil, err
+	}
+	if config.BitDepth != 16 {
+		return nil, fmt.Errorf("unsupported bit depth for recorded input: %d (only 16-bit is supported)", config.BitDepth)
+	}
+
+	bufferSize := config.SampleBufferSize
+	if bufferSize == 0 {
+		bufferSize = 50
+	}
+	capacity := max(maxSampleBufferSize(config), bufferSize)
+
+	s := &StreamCapturer{
+		config:    config,
+		pacing:    pacing,
+		samples:   make(chan AudioSample, capacity),
+		errors:    make(chan error, 10),
+		framePool: NewFramePool(config.FrameBytes(), capacity+4),
+		stopChan:  make(chan struct{}),
+	}
+	queue, err := newOverflowQueue(config, s.samples, s.errors, s.framePool)
+	if err != nil {
+		return nil, err
+	}
+	s.queue = queue
+	return s, nil
+}
+
+// Start opens the source and begins delivering audio
+func (s *StreamCapturer) Start(ctx context.Context) error {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	if s.running {
+		return fmt.Errorf("capturer is already running")
+	}
+
+	var source io.Reader = os.Stdin
+	if s.config.Source != StdinSource {
+		file, err := os.Open(s.config.Source)
+		if err != nil {
+			return fmt.Errorf("failed to open audio source: %w", err)
+		}
+		s.file = file
+		source = file
+	}
+
+	reader, err := s.openAudio(source)
+	if err != nil {
+		if s.file != nil {
+			s.file.Close()
+		}
+		return err
+	}
+	s.running = true
+
+	go s.run(reader)
+	go func() {
+		select {
+		case <-ctx.Done():
+			s.Stop()
+		case <-s.stopChan:
+		}
+	}()
+
+	return nil
+}
+
+// openAudio checks the WAV header of the source, if it has one, and returns a
+// reader positioned at the PCM data
+func (s *StreamCapturer) openAudio(source io.Reader) (io.Reader, error) {
+	buffered := bufio.NewReader(source)
+	magic, _ := buffered.Peek(4)
+	isWAV := string(magic) == "RIFF" || strings.EqualFold(filepath.Ext(s.config.Source), ".wav")
+	if !isWAV {
+		return buffered, nil
+	}
+
+	format, err := ReadWAVHeader(buffered)
+	if err != nil {
+		return nil, fmt.Errorf("%s: %w", s.config.Source, err)
+	}
+	reader, err := openWAVData(buffered, format, int(s.config.Channels), int(s.config.SampleRate))
+	if err != nil {
+		return nil, fmt.Errorf("%s: %w", s.config.Source, err)
+	}
+	return reader, nil
+}
+
+// run reads the source frame by frame until it ends or the capturer stops
+// Audio held back by the overflow policy is delivered when the input ends.
+func (s *StreamCapturer) run(reader io.Reader) {
+	defer close(s.errors)
+	defer close(s.samples)
+	defer s.queue.release()
+	defer s.Stop()
+
+	frameBytes := s.config.FrameBytes()
+	bytesPerFrame := frameBytes / int(max(s.config.BufferFrames, 1))
+	next := time.Now()
+
+	for {
+		data := s.framePool.Get(frameBytes)
+		n, err := io.ReadFull(reader, data)
+		n -= n % bytesPerFrame
+
+		if n > 0 {
+			sample := AudioSample{
+				Data:      data[:n],
+				Timestamp: time.Now(),
+				Frames:    uint32(n / bytesPerFrame),
+				pool:      s.framePool,
+			}
+			if !s.deliver(sample, &next) {
+				return
+			}
+		} else {
+			s.framePool.Put(data)
+		}
+
+		if errors.Is(err, io.EOF) || errors.Is(err, io.ErrUnexpectedEOF) {
+			s.queue.flush(s.stopChan)
+			return
+		}
+		if err != nil {
+			if s.IsRunning() {
+				select {
+				case s.errors <- fmt.Errorf("failed to read audio source: %w", err):
+				default:
+				}
+			}
+			return
+		}
+	}
+}
+
+// deliver hands a frame to the consumer according to the pacing
+// Returns false once the capturer has been stopped.
+func (s *StreamCapturer) deliver(sample AudioSample, next *time.Time) bool {
+	if s.pacing == PacingFast {
+		defer s.queue.trackQueueDepth()
+		select {
+		case s.samples <- sample:
+			return true
+		case <-s.stopChan:
+			sample.Release()
+			return false
+		}
+	}
+
+	// Wait until the frame would have been captured live
+	*next = next.Add(time.Duration(sample.Frames) * time.Second / time.Duration(s.config.SampleRate))
+	if wait := time.Until(*next); wait > 0 {
+		timer := time.NewTimer(wait)
+		select {
+		case <-timer.C:
+		case <-s.stopChan:
+			timer.Stop()
+			sample.Release()
+			return false
+		}
+	}
+
+	s.queue.deliver(sample)
+	return true
+}
+
+// Stop stops delivering audio
+// The channels are closed once the reader has exited; a read blocked on
+// standard input only returns when more input arrives or it is closed.
+func (s *StreamCapturer) Stop() error {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	if !s.running {
+		return nil
+	}
+	s.running = false
+
+	s.stopOnce.Do(func() { close(s.stopChan) })
+	if s.file != nil {
+		s.file.Close()
+	}
+	return nil
+}
+
+// Samples returns a channel that receives audio samples
+func (s *StreamCapturer) Samples() <-chan AudioSample {
+	return s.samples
+}
+
+// Errors returns a channel that receives capture errors
+func (s *StreamCapturer) Errors() <-chan error {
+	return s.errors
+}
+
+// IsRunning returns true if capture is currently active
+func (s *StreamCapturer) IsRunning() bool {
+	s.mu.RLock()
+	defer s.mu.RUnlock()
+	return s.running
+}
+
+// SetSampleBufferSize changes the sample buffer limit, clamped to the channel capacity
+func (s *StreamCapturer) SetSampleBufferSize(size int) {
+	s.queue.setLimit(size)
+}
+
+// Stats returns runtime counters for the capturer
+func (s *StreamCapturer) Stats() CaptureStats {
+	return s.queue.stats()
+}
@@ -1,143 +1,306 @@
 package audio
 
 import (
-	"math"
+	"fmt"
+	"strings"
+	"time"
 )
 
+// VADMode selects a voice activity detector implementation
+type VADMode string
+
+const (
+	// VADModeEnergy detects speech from the frame's RMS energy (default)
+	VADModeEnergy VADMode = "energy"
+
+	// VADModeSpectral detects speech from speech-band energy and zero-crossing
+	// rate, rejecting hum, rumble and hiss that the energy detector lets through
+	VADModeSpectral VADMode = "spectral"
+)
+
+// ParseVADMode parses a VAD mode name
+// An empty string selects VADModeEnergy.
+func ParseVADMode(name string) (VADMode, error) {
+	switch mode := VADMode(strings.ToLower(strings.TrimSpace(name))); mode {
+	case "":
+		return VADModeEnergy, nil
+	case VADModeEnergy, VADModeSpectral:
+		return mode, nil
+	default:
+		return "", fmt.Errorf("unknown VAD mode: %s (valid: energy, spectral)", name)
+	}
+}
+
 // VADConfig holds configuration for Voice Activity Detection
 type VADConfig struct {
+	// Mode selects the detector implementation
+	Mode VADMode
+
 	// EnergyThreshold is the minimum energy level to consider as speech
 	// Typical values: 0.001 to 0.1 (lower = more sensitive)
+	// The spectral detector applies it to the speech-band part of the energy.
+	// With AdaptiveThreshold it is the lowest threshold the tracker may select.
 	EnergyThreshold float64
 
-	// SilenceFrames is the number of consecutive silent frames before considering pause
-	// At 16kHz with 30ms frames: 10 frames = 300ms of silence
-	SilenceFrames int
+	// AdaptiveThreshold derives the threshold from a running noise floor estimate
+	AdaptiveThreshold bool
+
+	// NoiseMarginDB is how far above the noise floor speech must be (adaptive only)
+	NoiseMarginDB float64
+
+	// NoiseWindow is how much recent audio the noise floor is tracked over
+	NoiseWindow time.Duration
 
-	// SpeechFrames is the number of consecutive speech frames before triggering speech start
-	// At 16kHz with 30ms frames: 3 frames = 90ms of speech
-	SpeechFrames int
+	// SilenceDuration is how long audio must stay silent before considering pause
+	SilenceDuration time.Duration
+
+	// SpeechDuration is how long audio must contain speech before triggering speech start
+	SpeechDuration time.Duration
+
+	// PreRoll is how much audio before speech start is replayed to the recognizer
+	// (see PreRoll), covering onsets spent confirming speech
+	PreRoll time.Duration
+
+	// SampleRate is the audio sample rate in Hz
+	// Durations are measured in samples, so they hold for any frame size.
+	SampleRate int
+
+	// MinBandRatio is the minimum fraction of a frame's energy that must fall in
+	// the speech band (spectral mode only)
+	MinBandRatio float64
+
+	// MaxZeroCrossingRate is the zero-crossing rate (crossings per sample) above
+	// which a frame is treated as broadband noise (spectral mode only)
+	MaxZeroCrossingRate float64
 }
 
 // DefaultVADConfig returns a default VAD configuration
 func DefaultVADConfig() VADConfig {
 	return VADConfig{
-		EnergyThreshold: 0.01,   // Moderate sensitivity
-		SilenceFrames:   33 * 8, // 1s of silence
-		SpeechFrames:    3,      // 90ms of speech
+		Mode:                VADModeEnergy,
+		EnergyThreshold:     0.01, // Moderate sensitivity
+		SilenceDuration:     time.Second,
+		SpeechDuration:      90 * time.Millisecond,
+		PreRoll:             300 * time.Millisecond,
+		SampleRate:          16000,
+		MinBandRatio:        0.3,
+		MaxZeroCrossingRate: 0.35,
+		AdaptiveThreshold:   true,
+		NoiseMarginDB:       6, // 2x the noise floor RMS
+		NoiseWindow:         3 * time.Second,
 	}
 }
 
-// VAD (Voice Activity Detector) detects speech vs silence in audio
-type VAD struct {
-	config              VADConfig
-	silenceFrameCount   int
-	speechFrameCount    int
-	isSpeaking          bool
-	lastSpeechDetection bool
+// VAD is the interface for voice activity detectors
+type VAD interface {
+	// ProcessFrame processes an audio frame and returns whether speech is active
+	// Returns: (isSpeechActive, speechStarted, speechEnded)
+	ProcessFrame(audioData []byte) (bool, bool, bool)
+
+	// ProcessAnalyzed processes an audio frame whose FrameStats the caller
+	// already computed, so the frame is not scanned again for them
+	ProcessAnalyzed(audioData []byte, stats FrameStats) (bool, bool, bool)
+
+	// IsSpeaking returns whether speech is currently active
+	IsSpeaking() bool
+
+	// Threshold returns the current speech threshold (RMS energy)
+	Threshold() float64
+
+	// NoiseFloor returns the current noise floor estimate (RMS energy),
+	// or 0 when the threshold is not adaptive
+	NoiseFloor() float64
+
+	// TrailingSilence returns how long the audio has stayed below the speech
+	// threshold, the quiet at the end of the current utterance while speaking
+	TrailingSilence() time.Duration
+
+	// Reset resets the speech state
+	// The noise floor estimate is kept, as the environment has not changed.
+	Reset()
 }
 
-// NewVAD creates a new voice activity detector
-func NewVAD(config VADConfig) *VAD {
-	return &VAD{
-		config:     config,
-		isSpeaking: false,
+// NewVAD creates a new voice activity detector of the configured mode
+func NewVAD(config VADConfig) (VAD, error) {
+	mode, err := ParseVADMode(string(config.Mode))
+	if err != nil {
+		return nil, err
+	}
+
+	switch mode {
+	case VADModeSpectral:
+		return NewSpectralVAD(config), nil
+	default:
+		return NewEnergyVAD(config), nil
 	}
 }
 
-// ProcessFrame processes an audio frame and returns whether speech is active
-// Returns: (isSpeechActive, speechStarted, speechEnded)
-func (v *VAD) ProcessFrame(audioData []byte) (bool, bool, bool) {
-	// Calculate energy (RMS) of the audio frame
-	energy := calculateEnergy(audioData)
+// speechTracker is the hysteresis state machine shared by the detectors
+// It turns per-frame speech decisions into speech start and end events,
+// measuring speech and silence in samples so any frame size behaves the same.
+type speechTracker struct {
+	silenceSamples int
+	speechSamples  int
+	silenceCount   int
+	speechCount    int
+	isSpeaking     bool
+}
 
-	// DEBUG: Log energy levels
-	// log.Printf("[VAD] Energy: %.6f | Threshold: %.6f | Speech: %v", energy, v.config.EnergyThreshold, energy > v.config.EnergyThreshold)
+// newSpeechTracker creates a state machine with the configured durations
+func newSpeechTracker(config VADConfig) speechTracker {
+	return speechTracker{
+		silenceSamples: samplesFor(config.SilenceDuration, config.SampleRate),
+		speechSamples:  samplesFor(config.SpeechDuration, config.SampleRate),
+	}
+}
 
+// samplesFor converts a duration to a number of samples at sampleRate
+func samplesFor(d time.Duration, sampleRate int) int {
+	if sampleRate <= 0 {
+		sampleRate = DefaultVADConfig().SampleRate
+	}
+	return int(int64(d) * int64(sampleRate) / int64(time.Second))
+}
+
+// advance feeds the decision for a frame of the given number of samples to the state machine
+// active means the frame looks like speech, strong that it also clears the
+// higher hysteresis threshold used to keep an utterance going.
+func (t *speechTracker) advance(active, strong bool, samples int) (bool, bool, bool) {
 	speechStarted := false
 	speechEnded := false
 
-	// Hysteresis: use higher threshold to resume speech detection
-	resumeThreshold := v.config.EnergyThreshold * 1.5
-
-	if v.isSpeaking {
+	if t.isSpeaking {
 		// Currently speaking: use hysteresis for silence detection
-		if energy > resumeThreshold {
+		if strong {
 			// Strong speech: reset silence counter
-			v.silenceFrameCount = 0
-			v.speechFrameCount++
-		} else if energy <= v.config.EnergyThreshold {
+			t.silenceCount = 0
+			t.speechCount += samples
+		} else if !active {
 			// Below threshold: count as silence
-			v.silenceFrameCount++
-			// Don't reset speechFrameCount - allow brief dips
+			t.silenceCount += samples
+			// Don't reset speechCount - allow brief dips
 		}
-		// Energy between thresholds: don't change counters (dead zone)
+		// Between thresholds: don't change counters (dead zone)
 
 		// Check if we've crossed the silence threshold
-		if v.silenceFrameCount >= v.config.SilenceFrames {
-			v.isSpeaking = false
+		if t.silenceCount >= t.silenceSamples {
+			t.isSpeaking = false
 			speechEnded = true
 		}
 	} else {
 		// Not speaking: use normal threshold for speech start
-		if energy > v.config.EnergyThreshold {
-			v.speechFrameCount++
-			v.silenceFrameCount = 0
+		if active {
+			t.speechCount += samples
+			t.silenceCount = 0
 
 			// Check if we've crossed the speech threshold
-			if v.speechFrameCount >= v.config.SpeechFrames {
-				v.isSpeaking = true
+			if t.speechCount >= t.speechSamples {
+				t.isSpeaking = true
 				speechStarted = true
 			}
 		} else {
-			v.silenceFrameCount++
-			v.speechFrameCount = 0
+			t.silenceCount += samples
+			t.speechCount = 0
 		}
 	}
 
-	v.lastSpeechDetection = energy > v.config.EnergyThreshold
-	return v.isSpeaking, speechStarted, speechEnded
+	return t.isSpeaking, speechStarted, speechEnded
+}
+
+// trailingSilence converts the current run of silent samples to a duration
+func (t *speechTracker) trailingSilence(sampleRate int) time.Duration {
+	if sampleRate <= 0 {
+		sampleRate = DefaultVADConfig().SampleRate
+	}
+	return time.Duration(t.silenceCount) * time.Second / time.Duration(sampleRate)
+}
+
+// reset returns the state machine to silence
+func (t *speechTracker) reset() {
+	t.silenceCount = 0
+	t.speechCount = 0
+	t.isSpeaking = false
+}
+
+// EnergyVAD detects speech vs silence from the RMS energy of each frame
+type EnergyVAD struct {
+	config              VADConfig
+	tracker             speechTracker
+	gate                gate
+	lastSpeechDetection bool
+}
+
+// NewEnergyVAD creates a new energy-threshold voice activity detector
+func NewEnergyVAD(config VADConfig) *EnergyVAD {
+	return &EnergyVAD{
+		config:  config,
+		tracker: newSpeechTracker(config),
+		gate:    newGate(config),
+	}
+}
+
+// ProcessFrame processes an audio frame and returns whether speech is active
+// Returns: (isSpeechActive, speechStarted, speechEnded)
+func (v *EnergyVAD) ProcessFrame(audioData []byte) (bool, bool, bool) {
+	return v.ProcessStats(AnalyzeFrame(audioData))
+}
+
+// ProcessAnalyzed processes an audio frame with precomputed stats
+func (v *EnergyVAD) ProcessAnalyzed(audioData []byte, stats FrameStats) (bool, bool, bool) {
+	return v.ProcessStats(stats)
+}
+
+// ProcessStats processes a frame that has already been analyzed
+func (v *EnergyVAD) ProcessStats(stats FrameStats) (bool, bool, bool) {
+	// Compare the frame's mean square against squared thresholds, no sqrt needed
+	power := stats.MeanSquare()
+
+	// DEBUG: Log energy levels
+	// log.Printf("[VAD] Energy: %.6f | Threshold: %.6f | Speech: %v", stats.RMS(), v.Threshold(), stats.RMS() > v.Threshold())
+
+	// RMS > threshold is equivalent to mean square > threshold²
+	threshold := v.gate.update(power, stats.Samples)
+
+	// Hysteresis: use higher threshold to resume speech detection
+	resumeThreshold := threshold * 1.5 * 1.5
+
+	v.lastSpeechDetection = power > threshold
+	return v.tracker.advance(power > threshold, power > resumeThreshold, stats.Samples)
 }
 
 // IsSpeaking returns whether speech is currently active
-func (v *VAD) IsSpeaking() bool {
-	return v.isSpeaking
+func (v *EnergyVAD) IsSpeaking() bool {
+	return v.tracker.isSpeaking
+}
+
+// Threshold returns the current speech threshold (RMS energy)
+func (v *EnergyVAD) Threshold() float64 {
+	return v.gate.threshold()
+}
+
+// NoiseFloor returns the current noise floor estimate (RMS energy)
+func (v *EnergyVAD) NoiseFloor() float64 {
+	return v.gate.noiseFloor()
+}
+
+// TrailingSilence returns how long the audio has stayed below the threshold
+func (v *EnergyVAD) TrailingSilence() time.Duration {
+	return v.tracker.trailingSilence(v.config.SampleRate)
 }
 
 // Reset resets the VAD state
-func (v *VAD) Reset() {
-	v.silenceFrameCount = 0
-	v.speechFrameCount = 0
-	v.isSpeaking = false
+func (v *EnergyVAD) Reset() {
+	v.tracker.reset()
 	v.lastSpeechDetection = false
 }
 
 // calculateEnergy calculates the energy (RMS) of an audio buffer
 func calculateEnergy(data []byte) float64 {
-	if len(data) == 0 {
-		return 0
-	}
-
 	// Assuming 16-bit signed integers (2 bytes per sample)
-	var sum float64
-	sampleCount := len(data) / 2
-
-	for i := 0; i < sampleCount; i++ {
-		// Read 16-bit sample (little-endian)
-		sample := int16(data[i*2]) | int16(data[i*2+1])<<8
-		normalized := float64(sample) / 32768.0 // Normalize to -1.0 to 1.0
-		sum += normalized * normalized
-	}
-
-	if sampleCount == 0 {
-		return 0
-	}
-
-	// Return RMS (Root Mean Square) energy
-	return math.Sqrt(sum / float64(sampleCount))
+	return AnalyzeFrame(data).RMS()
 }
 
 // GetEnergyLevel returns the energy threshold for debugging/calibration
-func (v *VAD) GetEnergyLevel(audioData []byte) float64 {
+func (v *EnergyVAD) GetEnergyLevel(audioData []byte) float64 {
 	return calculateEnergy(audioData)
 }
@@ -0,0 +1,127 @@
+package audio
+
+import (
+	"encoding/binary"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"strings"
+)
+
+// WAVFormat describes the PCM audio in a WAV file
+type WAVFormat struct {
+	SampleRate    int
+	Channels      int
+	BitsPerSample int
+
+	// DataSize is the length of the audio data in bytes
+	DataSize int64
+}
+
+// ReadWAVHeader parses a RIFF/WAVE header, leaving r at the start of the audio data
+// Only uncompressed PCM (including WAVE_FORMAT_EXTENSIBLE PCM) is accepted.
+func ReadWAVHeader(r io.Reader) (WAVFormat, error) {
+	var format WAVFormat
+
+	var riff [12]byte
+	if _, err := io.ReadFull(r, riff[:]); err != nil {
+		return format, fmt.Errorf("failed to read WAV header: %w", err)
+	}
+	if string(riff[0:4]) != "RIFF" || string(riff[8:12]) != "WAVE" {
+		return format, fmt.Errorf("not a WAV file")
+	}
+
+	haveFormat := false
+	var chunk [8]byte
+	for {
+		if _, err := io.ReadFull(r, chunk[:]); err != nil {
+			return format, fmt.Errorf("failed to read WAV chunk: %w", err)
+		}
+		id := string(chunk[0:4])
+		size := int64(binary.LittleEndian.Uint32(chunk[4:8]))
+
+		switch id {
+		case "fmt ":
+			if size < 16 {
+				return format, fmt.Errorf("invalid WAV format chunk size: %d", size)
+			}
+			body := make([]byte, size+size%2)
+			if _, err := io.ReadFull(r, body); err != nil {
+				return format, fmt.Errorf("failed to read WAV format: %w", err)
+			}
+			encoding := binary.LittleEndian.Uint16(body[0:2])
+			if encoding == 0xFFFE && size >= 26 {
+				// WAVE_FORMAT_EXTENSIBLE, the real format is in the sub-format GUID
+				encoding = binary.LittleEndian.Uint16(body[24:26])
+			}
+			if encoding != 1 {
+				return format, fmt.Errorf("unsupported WAV encoding %d (only PCM is supported)", encoding)
+			}
+			format.Channels = int(binary.LittleEndian.Uint16(body[2:4]))
+			format.SampleRate = int(binary.LittleEndian.Uint32(body[4:8]))
+			format.BitsPerSample = int(binary.LittleEndian.Uint16(body[14:16]))
+			haveFormat = true
+
+		case "data":
+			if !haveFormat {
+				return format, fmt.Errorf("WAV data chunk before format chunk")
+			}
+			format.DataSize = size
+			return format, nil
+
+		default:
+			// Skip chunks we don't need (LIST, fact, ...), which are word aligned
+			if _, err := io.CopyN(io.Discard, r, size+size%2); err != nil {
+				return format, fmt.Errorf("failed to skip WAV chunk %q: %w", id, err)
+			}
+		}
+	}
+}
+
+// ReadPCMFile reads a recording as 16-bit mono PCM at sampleRate
+// .wav files must be 16-bit and are downmixed and resampled as needed; any
+// other file is read as raw 16-bit little-endian mono PCM at sampleRate.
+func ReadPCMFile(path string, sampleRate int) ([]byte, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to open %s: %w", path, err)
+	}
+	defer file.Close()
+
+	var r io.Reader = file
+	if strings.EqualFold(filepath.Ext(path), ".wav") {
+		format, err := ReadWAVHeader(file)
+		if err != nil {
+			return nil, fmt.Errorf("%s: %w", path, err)
+		}
+		r, err = openWAVData(file, format, 1, sampleRate)
+		if err != nil {
+			return nil, fmt.Errorf("%s: %w", path, err)
+		}
+	}
+
+	data, err := io.ReadAll(r)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read %s: %w", path, err)
+	}
+	return data[:len(data)&^1], nil
+}
+
+// openWAVData returns a reader of the audio data following a WAV header, in
+// channels channels at sampleRate
+// 16-bit data in another format is converted, which is only possible to mono.
+func openWAVData(r io.Reader, format WAVFormat, channels, sampleRate int) (io.Reader, error) {
+	if format.BitsPerSample != 16 {
+		return nil, fmt.Errorf("unsupported sample size: %d bits (only 16-bit is supported)", format.BitsPerSample)
+	}
+	data := io.LimitReader(r, format.DataSize)
+	if format.Channels == channels && format.SampleRate == sampleRate {
+		return data, nil
+	}
+	if channels != 1 {
+		return nil, fmt.Errorf("unsupported format %d Hz, %d channels (need %d Hz, %d channels)",
+			format.SampleRate, format.Channels, sampleRate, channels)
+	}
+	return NewResamplingReader(data, format.SampleRate, format.Channels, sampleRate)
+}
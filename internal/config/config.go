@@ -18,19 +18,33 @@ type Config struct {
 	// VAD settings
 	VAD struct {
 		Enabled      bool    `yaml:"enabled"`
+		Mode         string  `yaml:"mode"`
+		Adaptive     bool    `yaml:"adaptive"`
 		Threshold    float64 `yaml:"threshold"`
 		SilenceDelay float64 `yaml:"silence_delay"`
+		PreRoll      float64 `yaml:"pre_roll"`
+
+		// Endpointing is "vad" or "decoder"; EndpointSilence is the decoder
+		// mode's trailing silence in seconds
+		Endpointing     string  `yaml:"endpointing"`
+		EndpointSilence float64 `yaml:"endpoint_silence"`
 	} `yaml:"vad"`
 
 	// Output settings
 	Output struct {
 		Format string `yaml:"format"`
 		File   string `yaml:"file"`
+
+		// PartialInterval is the minimum time between partial results in
+		// seconds (0 = after every decoded batch)
+		PartialInterval float64 `yaml:"partial_interval"`
 	} `yaml:"output"`
 
 	// Audio settings
 	Audio struct {
-		Device string `yaml:"device"`
+		Device           string `yaml:"device"`
+		OverflowPolicy   string `yaml:"overflow_policy"`
+		OverflowBudgetKB int    `yaml:"overflow_budget_kb"`
 	} `yaml:"audio"`
 
 	// Push-to-talk settings
@@ -59,8 +73,13 @@ func DefaultConfig() *Config {
 
 	// VAD defaults
 	cfg.VAD.Enabled = true
-	cfg.VAD.Threshold = 0.1
+	cfg.VAD.Mode = "energy"
+	cfg.VAD.Adaptive = true
+	cfg.VAD.Threshold = 0.01
 	cfg.VAD.SilenceDelay = 2.5
+	cfg.VAD.PreRoll = 0.3
+	cfg.VAD.Endpointing = "vad"
+	cfg.VAD.EndpointSilence = 0.3
 
 	// Output defaults
 	cfg.Output.Format = "json"
@@ -68,6 +87,8 @@ func DefaultConfig() *Config {
 
 	// Audio defaults
 	cfg.Audio.Device = ""
+	cfg.Audio.OverflowPolicy = "drop-newest"
+	cfg.Audio.OverflowBudgetKB = 1024
 
 	// Push-to-talk defaults
 	cfg.PushToTalk.Enabled = false
@@ -0,0 +1,31 @@
+//go:build !linux
+
+package models
+
+import (
+	"fmt"
+	"io"
+	"os"
+)
+
+// warmFile reads the file at path into the page cache
+// Locking is only supported on Linux.
+func warmFile(path string, size int64, lock bool) ([]byte, error) {
+	if lock {
+		return nil, fmt.Errorf("locking model files in memory is not supported on this platform")
+	}
+
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer file.Close()
+
+	if _, err := io.CopyBuffer(io.Discard, file, make([]byte, 1<<20)); err != nil {
+		return nil, fmt.Errorf("failed to read %s: %w", path, err)
+	}
+	return nil, nil
+}
+
+// unmapFile releases a mapping returned by warmFile
+func unmapFile(data []byte) {}
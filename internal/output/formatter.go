@@ -15,6 +15,17 @@ type TranscriptionResult struct {
 	Timestamp  time.Time `json:"timestamp"`
 	Partial    bool      `json:"partial"`
 	Type       string    `json:"type,omitempty"`
+
+	// Source, Start and End place results from recordings: the file and the
+	// offsets in seconds from its start. Live results leave them unset.
+	Source string   `json:"source,omitempty"`
+	Start  *float64 `json:"start,omitempty"`
+	End    *float64 `json:"end,omitempty"`
+
+	// Endpoint names the rule that ended the utterance and LatencyMs how
+	// long after the end of speech it was finalized, when endpointing is on
+	Endpoint  string  `json:"endpoint,omitempty"`
+	LatencyMs float64 `json:"latency_ms,omitempty"`
 }
 
 // Event represents a system event
@@ -128,6 +139,9 @@ func (p *PlainTextFormatter) WriteResult(result TranscriptionResult) error {
 	}
 
 	timestamp := result.Timestamp.Format("15:04:05")
+	if result.Start != nil && result.End != nil {
+		timestamp = fmt.Sprintf("%s %.2f-%.2f", result.Source, *result.Start, *result.End)
+	}
 	text := fmt.Sprintf("[%s] %s\n", timestamp, result.Text)
 
 	_, err := p.writer.Write([]byte(text))
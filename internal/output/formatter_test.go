@@ -0,0 +1,48 @@
+package output
+
+import (
+	"bytes"
+	"encoding/json"
+	"strings"
+	"testing"
+)
+
+func TestJSONFormatterOffsets(t *testing.T) {
+	var buf bytes.Buffer
+	formatter := NewJSONFormatter(&buf)
+
+	start, end := 0.0, 1.5
+	formatter.WriteResult(TranscriptionResult{Index: 1, Text: "first", Source: "a.wav", Start: &start, End: &end})
+	formatter.WriteResult(TranscriptionResult{Index: 2, Text: "live"})
+
+	decoder := json.NewDecoder(&buf)
+	var recorded, live map[string]any
+	if err := decoder.Decode(&recorded); err != nil {
+		t.Fatal(err)
+	}
+	if err := decoder.Decode(&live); err != nil {
+		t.Fatal(err)
+	}
+
+	// A result at the very start of a recording keeps its zero offset
+	if got, ok := recorded["start"]; !ok || got != 0.0 {
+		t.Errorf("recorded result start = %v (present %v); want 0", got, ok)
+	}
+	if got := recorded["end"]; got != 1.5 {
+		t.Errorf("recorded result end = %v; want 1.5", got)
+	}
+	if _, ok := live["start"]; ok {
+		t.Error("live result has a start offset")
+	}
+}
+
+func TestPlainTextFormatterOffsets(t *testing.T) {
+	var buf bytes.Buffer
+	formatter := NewPlainTextFormatter(&buf)
+
+	start, end := 0.0, 1.5
+	formatter.WriteResult(TranscriptionResult{Text: "first", Source: "a.wav", Start: &start, End: &end})
+	if got := buf.String(); !strings.HasPrefix(got, "[a.wav 0.00-1.50] first") {
+		t.Errorf("plain text = %q; want offsets 0.00-1.50", got)
+	}
+}
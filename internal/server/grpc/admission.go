@@ -0,0 +1,89 @@
+package grpc
+
+import (
+	"context"
+	"runtime"
+	"time"
+
+	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/status"
+)
+
+// SessionConfig holds the admission limits for recognizer sessions
+type SessionConfig struct {
+	// MaxSessions is the number of streams decoding at once
+	MaxSessions int
+
+	// MaxQueue is the number of streams that may wait for a session; further
+	// streams are rejected with RESOURCE_EXHAUSTED
+	MaxQueue int
+
+	// QueueTimeout is how long a stream waits for a session before it is
+	// rejected with RESOURCE_EXHAUSTED
+	QueueTimeout time.Duration
+
+	// IdleTimeout ends streams that send no audio for this long (0 = never)
+	IdleTimeout time.Duration
+}
+
+// DefaultSessionConfig returns limits of one decoding session per CPU
+func DefaultSessionConfig() SessionConfig {
+	return SessionConfig{
+		MaxSessions:  runtime.NumCPU(),
+		MaxQueue:     runtime.NumCPU(),
+		QueueTimeout: 10 * time.Second,
+		IdleTimeout:  30 * time.Second,
+	}
+}
+
+// admission bounds the number of concurrent sessions and waiting streams
+type admission struct {
+	slots   chan struct{}
+	queue   chan struct{}
+	timeout time.Duration
+}
+
+// newAdmission creates an admission controller for config's limits
+func newAdmission(config SessionConfig) *admission {
+	return &admission{
+		slots:   make(chan struct{}, max(config.MaxSessions, 1)),
+		queue:   make(chan struct{}, max(config.MaxQueue, 0)),
+		timeout: config.QueueTimeout,
+	}
+}
+
+// acquire takes a session slot, queueing for one if all are taken
+// The returned function gives the slot back. Errors are gRPC statuses.
+func (a *admission) acquire(ctx context.Context) (func(), error) {
+	release := func() { <-a.slots }
+
+	select {
+	case a.slots <- struct{}{}:
+		return release, nil
+	default:
+	}
+
+	// All sessions busy: wait in the queue if there is room in it
+	select {
+	case a.queue <- struct{}{}:
+		defer func() { <-a.queue }()
+	default:
+		return nil, status.Errorf(codes.ResourceExhausted, "all %d sessions busy and %d streams waiting", cap(a.slots), cap(a.queue))
+	}
+
+	var expired <-chan time.Time
+	if a.timeout > 0 {
+		timer := time.NewTimer(a.timeout)
+		defer timer.Stop()
+		expired = timer.C
+	}
+
+	select {
+	case a.slots <- struct{}{}:
+		return release, nil
+	case <-expired:
+		return nil, status.Errorf(codes.ResourceExhausted, "no session became free within %v", a.timeout)
+	case <-ctx.Done():
+		return nil, status.FromContextError(ctx.Err()).Err()
+	}
+}
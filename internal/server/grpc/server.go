@@ -1,13 +1,18 @@
 package grpc
 
 import (
+	"context"
 	"fmt"
 	"net"
+	"time"
 
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/health"
+	healthpb "google.golang.org/grpc/health/grpc_health_v1"
 	"google.golang.org/grpc/reflection"
 
 	voxpb "github.com/emmett/vox/api/proto"
+	"github.com/emmett/vox/internal/models"
 	"github.com/emmett/vox/internal/stt"
 	"github.com/emmett/vox/internal/tts"
 )
@@ -15,7 +20,10 @@ import (
 // Server wraps the gRPC server and services
 type Server struct {
 	grpcServer *grpc.Server
-	sttEngine  stt.Engine
+	health     *health.Server
+	stt        *STTService
+	models     *stt.ModelRegistry
+	ready      chan struct{} // Closed once the default STT model has loaded (or failed to)
 	ttsEngine  tts.Engine
 	port       int
 }
@@ -23,19 +31,17 @@ type Server struct {
 // Config holds server configuration
 type Config struct {
 	Port         int
-	STTModelPath string
+	STTModel     string        // Default STT model name, used when a stream doesn't select one
+	STTMemory    int64         // Budget for cached STT models in bytes, 0 for no limit
+	LockSTTModel bool          // Lock STT model files in memory while loaded
+	Sessions     SessionConfig // Limits on concurrent STT streams
 	TTSModelPath string
 }
 
 // NewServer creates a new gRPC server
+// The default STT model is loaded in the background; the health service
+// reports NOT_SERVING until it is loaded and warmed up.
 func NewServer(cfg Config) (*Server, error) {
-	// Initialize STT engine
-	sttEngine := stt.NewVoskEngine()
-	sttCfg := stt.DefaultConfig(cfg.STTModelPath)
-	if err := sttEngine.Initialize(sttCfg); err != nil {
-		return nil, fmt.Errorf("failed to initialize STT engine: %w", err)
-	}
-
 	// Initialize TTS engine
 	ttsEngine := tts.NewPiperEngine()
 	ttsCfg := tts.DefaultConfig(cfg.TTSModelPath)
@@ -45,14 +51,21 @@ func NewServer(cfg Config) (*Server, error) {
 
 	s := &Server{
 		grpcServer: grpc.NewServer(),
-		sttEngine:  sttEngine,
+		health:     health.NewServer(),
+		models:     stt.NewModelRegistry(cfg.STTMemory, cfg.LockSTTModel, models.GetModelPath),
+		ready:      make(chan struct{}),
 		ttsEngine:  ttsEngine,
 		port:       cfg.Port,
 	}
 
+	// Report not serving until the default model is warm
+	s.health.SetServingStatus("", healthpb.HealthCheckResponse_NOT_SERVING)
+	s.health.SetServingStatus(sttServiceName, healthpb.HealthCheckResponse_NOT_SERVING)
+	healthpb.RegisterHealthServer(s.grpcServer, s.health)
+
 	// Register services
-	sttService := NewSTTService(sttEngine)
-	voxpb.RegisterSTTServer(s.grpcServer, sttService)
+	s.stt = NewSTTService(s.models, cfg.STTModel, s.ready, cfg.Sessions)
+	voxpb.RegisterSTTServer(s.grpcServer, s.stt)
 
 	ttsService := NewTTSService(ttsEngine)
 	voxpb.RegisterTTSServer(s.grpcServer, ttsService)
@@ -60,9 +73,28 @@ func NewServer(cfg Config) (*Server, error) {
 	// Enable reflection for grpcurl
 	reflection.Register(s.grpcServer)
 
+	go s.loadModel(cfg.STTModel)
+
 	return s, nil
 }
 
+// loadModel loads and warms the default STT model, then marks the server serving
+// On failure the server stays NOT_SERVING; streams then report the load error.
+func (s *Server) loadModel(name string) {
+	defer close(s.ready)
+
+	start := time.Now()
+	stats, err := s.models.Preload(context.Background(), name)
+	if err != nil {
+		fmt.Printf("Failed to load STT model %s: %v\n", name, err)
+		return
+	}
+	fmt.Printf("STT model %s %s, ready in %v\n", name, stats, time.Since(start).Round(time.Millisecond))
+
+	s.health.SetServingStatus("", healthpb.HealthCheckResponse_SERVING)
+	s.health.SetServingStatus(sttServiceName, healthpb.HealthCheckResponse_SERVING)
+}
+
 // Start starts the gRPC server
 func (s *Server) Start() error {
 	lis, err := net.Listen("tcp", fmt.Sprintf(":%d", s.port))
@@ -76,7 +108,9 @@ func (s *Server) Start() error {
 
 // Stop gracefully stops the server
 func (s *Server) Stop() {
+	s.health.Shutdown()
 	s.grpcServer.GracefulStop()
-	s.sttEngine.Close()
+	s.stt.Close()
+	s.models.Close()
 	s.ttsEngine.Close()
 }
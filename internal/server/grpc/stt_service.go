@@ -2,72 +2,265 @@ package grpc
 
 import (
 	"context"
+	"fmt"
 	"io"
 	"sync"
 	"time"
 
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/metadata"
+	"google.golang.org/grpc/status"
 
 	voxpb "github.com/emmett/vox/api/proto"
+	"github.com/emmett/vox/internal/audio"
 	"github.com/emmett/vox/internal/stt"
 )
 
+// sttServiceName is the STT service's name in health checks
+const sttServiceName = "vox.STT"
+
+// modelMetadataKey is the request metadata key a stream selects its STT model with
+const modelMetadataKey = "model"
+
+// grammarMetadataKey is the request metadata key holding a stream's grammar:
+// comma-separated phrases, possibly over several values
+const grammarMetadataKey = "grammar"
+
 // STTService implements the gRPC STT service
 type STTService struct {
 	voxpb.UnimplementedSTTServer
-	engine stt.Engine
-	mu     sync.Mutex
+	models       *stt.ModelRegistry
+	defaultModel string
+	ready        <-chan struct{}
+	sessions     *admission
+	idleTimeout  time.Duration
+
+	// pools recycles the recognizers of streams without a grammar, per model
+	poolsMu  sync.Mutex
+	pools    map[string]*modelPool
+	poolSize int
+}
+
+// modelPool is a model's recognizer pool and the number of streams using it
+type modelPool struct {
+	pool    *stt.RecognizerPool
+	streams int
 }
 
-// NewSTTService creates a new STT service
-func NewSTTService(engine stt.Engine) *STTService {
-	return &STTService{engine: engine}
+// NewSTTService creates a new STT service serving models from registry
+// Streams wait for ready to close, which signals the default model has been
+// loaded in the background; a nil ready channel never waits. Concurrent
+// streams are limited by limits.
+func NewSTTService(registry *stt.ModelRegistry, defaultModel string, ready <-chan struct{}, limits SessionConfig) *STTService {
+	return &STTService{
+		models:       registry,
+		defaultModel: defaultModel,
+		ready:        ready,
+		sessions:     newAdmission(limits),
+		idleTimeout:  limits.IdleTimeout,
+		pools:        make(map[string]*modelPool),
+		poolSize:     max(limits.MaxSessions, 1),
+	}
+}
+
+// checkout returns a pooled recognizer for a stream without a grammar and
+// the function that hands it back
+// The default model's pool is kept for the next streams. Other models' pools
+// are closed once no stream uses them, so the registry can evict the model.
+func (s *STTService) checkout(ctx context.Context, name string, model *stt.Model) (*stt.VoskEngine, func(), error) {
+	s.poolsMu.Lock()
+	entry, ok := s.pools[name]
+	if !ok {
+		pool, err := stt.NewRecognizerPool(model, stt.DefaultConfig(model.Path()), s.poolSize)
+		if err != nil {
+			s.poolsMu.Unlock()
+			return nil, nil, err
+		}
+		entry = &modelPool{pool: pool}
+		s.pools[name] = entry
+	}
+	entry.streams++
+	s.poolsMu.Unlock()
+
+	done := func() {
+		s.poolsMu.Lock()
+		defer s.poolsMu.Unlock()
+		entry.streams--
+		if entry.streams == 0 && name != s.defaultModel && s.pools[name] == entry {
+			delete(s.pools, name)
+			entry.pool.Close()
+		}
+	}
+
+	engine, err := entry.pool.Get(ctx)
+	if err != nil {
+		done()
+		return nil, nil, err
+	}
+	return engine, func() {
+		entry.pool.Put(engine)
+		done()
+	}, nil
+}
+
+// Close frees the pooled recognizers and their model references
+func (s *STTService) Close() error {
+	s.poolsMu.Lock()
+	defer s.poolsMu.Unlock()
+
+	for name, entry := range s.pools {
+		entry.pool.Close()
+		delete(s.pools, name)
+	}
+	return nil
 }
 
 // Transcribe handles bidirectional streaming transcription
+// Each stream decodes with its own recognizer on a shared model; streams
+// without a grammar check one out of the model's pool and hand it back reset
+// for the next stream. Streams
+// select a model with the "model" request metadata, defaulting to the
+// server's model, and may restrict recognition to the phrases in the
+// "grammar" metadata. At most MaxSessions streams decode at once; others
+// wait in a bounded queue or are rejected with RESOURCE_EXHAUSTED, and
+// streams that stop sending audio are ended after IdleTimeout.
 func (s *STTService) Transcribe(stream grpc.BidiStreamingServer[voxpb.AudioChunk, voxpb.TranscriptResult]) error {
 	ctx := stream.Context()
 
-	for {
+	// Streams opened while the server is starting wait for the default model
+	if s.ready != nil {
 		select {
+		case <-s.ready:
 		case <-ctx.Done():
-			s.mu.Lock()
-			finalResult, err := s.engine.FinalResult()
-			s.mu.Unlock()
-			if err == nil && finalResult.Text != "" {
-				stream.Send(&voxpb.TranscriptResult{
-					Text:        finalResult.Text,
-					IsFinal:     true,
-					Confidence:  float32(finalResult.Confidence),
-					TimestampMs: time.Now().UnixMilli(),
-				})
+			return status.Errorf(codes.Unavailable, "STT model is still loading: %v", ctx.Err())
+		}
+	}
+
+	release, err := s.sessions.acquire(ctx)
+	if err != nil {
+		return err
+	}
+	defer release()
+
+	modelName := s.defaultModel
+	var grammar []string
+	if md, ok := metadata.FromIncomingContext(ctx); ok {
+		if values := md.Get(modelMetadataKey); len(values) > 0 && values[0] != "" {
+			modelName = values[0]
+		}
+		for _, value := range md.Get(grammarMetadataKey) {
+			grammar = append(grammar, stt.ParseGrammar(value)...)
+		}
+	}
+	model, err := s.models.Acquire(modelName)
+	if err != nil {
+		return status.Errorf(codes.NotFound, "failed to load model %s: %v", modelName, err)
+	}
+	defer model.Release()
+
+	// Grammar streams build a recognizer for their phrases, others reuse one
+	sttConfig := stt.DefaultConfig(model.Path())
+	var engine *stt.VoskEngine
+	if len(grammar) > 0 {
+		sttConfig.Grammar = grammar
+		engine, err = stt.NewVoskSession(model, sttConfig)
+		if err != nil {
+			return status.Errorf(codes.Internal, "failed to create recognizer: %v", err)
+		}
+		defer engine.Close()
+	} else {
+		var done func()
+		engine, done, err = s.checkout(ctx, modelName, model)
+		if err != nil {
+			return status.Errorf(codes.Internal, "failed to create recognizer: %v", err)
+		}
+		defer done()
+	}
+
+	// Chunks in another rate or channel count are converted for the recognizer
+	converter := chunkConverter{sampleRate: sttConfig.SampleRate}
+
+	// Track input levels for clipping diagnostics
+	var levels audio.FrameStats
+	defer reportLevels(&levels)
+
+	// Receive on a separate goroutine so an idle stream can be ended while a
+	// Recv is blocked; returning from the handler unblocks it
+	chunks := make(chan *voxpb.AudioChunk)
+	recvErr := make(chan error, 1)
+	done := make(chan struct{})
+	defer close(done)
+	go func() {
+		for {
+			chunk, err := stream.Recv()
+			if err != nil {
+				recvErr <- err
+				return
+			}
+			select {
+			case chunks <- chunk:
+			case <-done:
+				return
 			}
+		}
+	}()
+
+	// Streams that stop sending audio are ended after the idle timeout
+	var idle <-chan time.Time
+	var idleTimer *time.Timer
+	if s.idleTimeout > 0 {
+		idleTimer = time.NewTimer(s.idleTimeout)
+		defer idleTimer.Stop()
+		idle = idleTimer.C
+	}
+
+	for {
+		select {
+		case <-ctx.Done():
+			sendFinal(stream, engine)
 			return ctx.Err()
 
-		default:
-			chunk, err := stream.Recv()
-			if err == io.EOF {
-				s.mu.Lock()
-				finalResult, err := s.engine.FinalResult()
-				s.mu.Unlock()
-				if err == nil && finalResult.Text != "" {
+		case <-idle:
+			sendFinal(stream, engine)
+			return status.Errorf(codes.DeadlineExceeded, "no audio received for %v", s.idleTimeout)
+
+		case err := <-recvErr:
+			if err != io.EOF {
+				return err
+			}
+
+			// Decode the audio held back by the resampler's filter delay
+			if tail := converter.flush(); len(tail) > 0 {
+				if result, err := engine.ProcessAudio(ctx, tail); err == nil && result != nil && result.Text != "" && !result.Partial {
 					stream.Send(&voxpb.TranscriptResult{
-						Text:        finalResult.Text,
+						Text:        result.Text,
 						IsFinal:     true,
-						Confidence:  float32(finalResult.Confidence),
+						Confidence:  float32(result.Confidence),
 						TimestampMs: time.Now().UnixMilli(),
 					})
 				}
-				return nil
 			}
+			sendFinal(stream, engine)
+			return nil
+
+		case chunk := <-chunks:
+			if idleTimer != nil {
+				if !idleTimer.Stop() {
+					<-idleTimer.C
+				}
+				idleTimer.Reset(s.idleTimeout)
+			}
+
+			data, err := converter.convert(chunk)
 			if err != nil {
-				return err
+				return status.Errorf(codes.InvalidArgument, "%v", err)
 			}
 
+			levels.Add(audio.AnalyzeFrame(data))
+
 			// Process audio chunk
-			s.mu.Lock()
-			result, err := s.engine.ProcessAudio(ctx, chunk.Data)
-			s.mu.Unlock()
+			result, err := engine.ProcessAudio(ctx, data)
 			if err != nil {
 				return err
 			}
@@ -84,6 +277,67 @@ func (s *STTService) Transcribe(stream grpc.BidiStreamingServer[voxpb.AudioChunk
 	}
 }
 
+// sendFinal sends the recognizer's final result for the audio decoded so far
+func sendFinal(stream grpc.BidiStreamingServer[voxpb.AudioChunk, voxpb.TranscriptResult], engine stt.Engine) {
+	finalResult, err := engine.FinalResult()
+	if err == nil && finalResult.Text != "" {
+		stream.Send(&voxpb.TranscriptResult{
+			Text:        finalResult.Text,
+			IsFinal:     true,
+			Confidence:  float32(finalResult.Confidence),
+			TimestampMs: time.Now().UnixMilli(),
+		})
+	}
+}
+
+// chunkConverter converts a stream's audio chunks to the recognizer's format
+type chunkConverter struct {
+	sampleRate int
+	resampler  *audio.Resampler
+}
+
+// convert returns a chunk's audio as mono PCM at the recognizer's sample rate
+// A chunk without a sample rate or channel count is taken to be in the
+// recognizer's format. The resampler is created on the first chunk that
+// needs one and replaced if the format changes mid-stream.
+func (c *chunkConverter) convert(chunk *voxpb.AudioChunk) ([]byte, error) {
+	rate, channels := int(chunk.SampleRate), int(chunk.Channels)
+	if rate == 0 {
+		rate = c.sampleRate
+	}
+	if channels == 0 {
+		channels = 1
+	}
+	if rate == c.sampleRate && channels == 1 {
+		return chunk.Data, nil
+	}
+
+	if c.resampler == nil || c.resampler.InputRate() != rate || c.resampler.Channels() != channels {
+		resampler, err := audio.NewResampler(rate, channels, c.sampleRate)
+		if err != nil {
+			return nil, err
+		}
+		c.resampler = resampler
+	}
+	return c.resampler.Process(chunk.Data), nil
+}
+
+// flush returns the converted audio still held back by the resampler
+func (c *chunkConverter) flush() []byte {
+	if c.resampler == nil {
+		return nil
+	}
+	return c.resampler.Flush()
+}
+
+// reportLevels logs a diagnostic when a stream's audio was clipped
+func reportLevels(levels *audio.FrameStats) {
+	if levels.Clipped > 0 {
+		fmt.Printf("Transcribe stream: input clipped in %d of %d samples (peak %.3f)\n",
+			levels.Clipped, levels.Samples, levels.PeakLevel())
+	}
+}
+
 // ListModels returns available STT models
 func (s *STTService) ListModels(ctx context.Context, req *voxpb.ListModelsRequest) (*voxpb.ListModelsResponse, error) {
 	// TODO: Implement actual model listing from models package
@@ -4,6 +4,8 @@ import (
 	"context"
 	"fmt"
 
+	"github.com/emmett/vox/internal/audio"
+	"github.com/emmett/vox/internal/models"
 	"github.com/emmett/vox/internal/stt"
 	sdk "github.com/modelcontextprotocol/go-sdk/mcp"
 )
@@ -11,30 +13,45 @@ import (
 type Config struct {
 	ServerName      string
 	ServerVersion   string
-	ModelPath       string
 	DefaultModel    string
+	ModelMemory     int64 // Budget for cached models in bytes, 0 for no limit
+	LockModel       bool  // Lock model files in memory while loaded
+	VADMode         string
+	VADAdaptive     bool
 	VADThreshold    float64
 	VADSilenceDelay float64
 	VADEnabled      bool
+	AudioSource     string // Recorded input read instead of the microphone, if set
+	AudioPacing     string
 }
 
 type Server struct {
 	config    Config
 	mcpServer *sdk.Server
-	sttEngine stt.Engine
+	models    *stt.ModelRegistry
+	ready     chan struct{} // Closed once the default model has loaded (or failed to)
+	loadStats stt.ModelLoadStats
+	loadErr   error
 }
 
 func NewServer(cfg Config) (*Server, error) {
+	// Standard input carries the stdio transport's JSON-RPC messages
+	if cfg.AudioSource == audio.StdinSource {
+		return nil, fmt.Errorf("audio input cannot be read from stdin, which carries the MCP stdio transport")
+	}
+
 	s := &Server{
 		config: cfg,
+		ready:  make(chan struct{}),
 	}
 
-	// Initialize STT engine
-	s.sttEngine = stt.NewVoskEngine()
-	sttConfig := stt.DefaultConfig(cfg.ModelPath)
-	if err := s.sttEngine.Initialize(sttConfig); err != nil {
-		return nil, fmt.Errorf("failed to initialize STT engine: %w", err)
-	}
+	// Load the default model in the background so the server can answer the
+	// client's handshake right away; others are loaded on first request
+	s.models = stt.NewModelRegistry(cfg.ModelMemory, cfg.LockModel, models.GetModelPath)
+	go func() {
+		defer close(s.ready)
+		s.loadStats, s.loadErr = s.models.Preload(context.Background(), cfg.DefaultModel)
+	}()
 
 	// Create MCP server
 	s.mcpServer = sdk.NewServer(&sdk.Implementation{
@@ -48,13 +65,28 @@ func NewServer(cfg Config) (*Server, error) {
 	return s, nil
 }
 
+// WaitReady blocks until the default model is loaded and warmed up
+// Returns the model's load stats, and the load error or ctx's error if it
+// is done first.
+func (s *Server) WaitReady(ctx context.Context) (stt.ModelLoadStats, error) {
+	select {
+	case <-s.ready:
+		if s.loadErr != nil {
+			return s.loadStats, fmt.Errorf("failed to initialize STT engine: %w", s.loadErr)
+		}
+		return s.loadStats, nil
+	case <-ctx.Done():
+		return stt.ModelLoadStats{}, ctx.Err()
+	}
+}
+
 func (s *Server) Start() error {
 	return s.mcpServer.Run(context.Background(), &sdk.StdioTransport{})
 }
 
 func (s *Server) Stop() error {
-	if s.sttEngine != nil {
-		s.sttEngine.Close()
+	if s.models != nil {
+		s.models.Close()
 	}
 	return nil
 }
@@ -68,8 +100,15 @@ func (s *Server) registerTools() {
 			"properties": map[string]interface{}{
 				"model":             map[string]string{"type": "string"},
 				"vad_enabled":       map[string]interface{}{"type": []string{"boolean", "null"}},
+				"vad_mode":          map[string]interface{}{"type": "string", "enum": []string{"energy", "spectral"}},
+				"vad_adaptive":      map[string]interface{}{"type": []string{"boolean", "null"}},
 				"vad_threshold":     map[string]string{"type": "number"},
 				"vad_silence_delay": map[string]string{"type": "number"},
+				"grammar": map[string]interface{}{
+					"type":        "array",
+					"items":       map[string]string{"type": "string"},
+					"description": "Phrases to restrict recognition to, for command vocabularies",
+				},
 			},
 		},
 	}, s.handleTranscribeAudio)
@@ -3,24 +3,61 @@ package mcp
 import (
 	"context"
 	"fmt"
+	"time"
 
 	"github.com/emmett/vox/internal/audio"
 	"github.com/emmett/vox/internal/models"
+	"github.com/emmett/vox/internal/stt"
 	sdk "github.com/modelcontextprotocol/go-sdk/mcp"
 )
 
 type TranscribeArgs struct {
-	Model           string  `json:"model,omitempty"`
-	VadEnabled      *bool   `json:"vad_enabled,omitempty"`
-	VadThreshold    float64 `json:"vad_threshold,omitempty"`
-	VadSilenceDelay float64 `json:"vad_silence_delay,omitempty"`
+	Model           string   `json:"model,omitempty"`
+	VadEnabled      *bool    `json:"vad_enabled,omitempty"`
+	VadMode         string   `json:"vad_mode,omitempty"`
+	VadAdaptive     *bool    `json:"vad_adaptive,omitempty"`
+	VadThreshold    float64  `json:"vad_threshold,omitempty"`
+	VadSilenceDelay float64  `json:"vad_silence_delay,omitempty"`
+	Grammar         []string `json:"grammar,omitempty"`
 }
 
 type ListModelsArgs struct{}
 
 func (s *Server) handleTranscribeAudio(ctx context.Context, req *sdk.CallToolRequest, args TranscribeArgs) (*sdk.CallToolResult, any, error) {
+	// Calls arriving during startup wait for the default model to load; calls
+	// naming another model load it themselves and don't wait
+	modelName := s.config.DefaultModel
+	if args.Model != "" {
+		modelName = args.Model
+	}
+	if modelName == s.config.DefaultModel {
+		if _, err := s.WaitReady(ctx); err != nil {
+			return nil, nil, err
+		}
+	}
+
+	// Get a recognizer on the requested model, loading it on first use
+	model, err := s.models.Acquire(modelName)
+	if err != nil {
+		return nil, nil, fmt.Errorf("failed to load model: %w", err)
+	}
+	defer model.Release()
+
+	// The tool only returns the final transcript, so partials are never fetched
+	sttConfig := stt.DefaultConfig(model.Path())
+	sttConfig.SkipPartials = true
+	sttConfig.Grammar = args.Grammar
+	engine, err := stt.NewVoskSession(model, sttConfig)
+	if err != nil {
+		return nil, nil, fmt.Errorf("failed to create recognizer: %w", err)
+	}
+	defer engine.Close()
+
 	// Start audio capture
-	capturer, err := audio.NewCapturer(audio.DefaultConfig())
+	captureConfig := audio.DefaultConfig()
+	captureConfig.Source = s.config.AudioSource
+	captureConfig.Pacing = audio.Pacing(s.config.AudioPacing)
+	capturer, err := audio.NewCapturer(captureConfig)
 	if err != nil {
 		return nil, nil, fmt.Errorf("failed to create capturer: %w", err)
 	}
@@ -34,11 +71,31 @@ func (s *Server) handleTranscribeAudio(ctx context.Context, req *sdk.CallToolReq
 	} else if s.config.VADThreshold > 0 {
 		vadConfig.EnergyThreshold = s.config.VADThreshold
 	}
-	vad := audio.NewVAD(vadConfig)
+	if args.VadSilenceDelay > 0 {
+		vadConfig.SilenceDuration = time.Duration(args.VadSilenceDelay * float64(time.Second))
+	} else if s.config.VADSilenceDelay > 0 {
+		vadConfig.SilenceDuration = time.Duration(s.config.VADSilenceDelay * float64(time.Second))
+	}
+	vadConfig.AdaptiveThreshold = s.config.VADAdaptive
+	if args.VadAdaptive != nil {
+		vadConfig.AdaptiveThreshold = *args.VadAdaptive
+	}
+	vadConfig.Mode = audio.VADMode(s.config.VADMode)
+	if args.VadMode != "" {
+		vadConfig.Mode = audio.VADMode(args.VadMode)
+	}
+	vad, err := audio.NewVAD(vadConfig)
+	if err != nil {
+		return nil, nil, err
+	}
 
 	silenceCount := 0
 	speechStarted := false
 	var audioBuffer []byte
+	var levels audio.FrameStats
+
+	// Leading silence is only kept as pre-roll, not sent to the recognizer
+	preRoll := audio.NewPreRoll(vadConfig.PreRoll, vadConfig.SampleRate)
 
 	// Start capture
 	if err := capturer.Start(ctx); err != nil {
@@ -46,21 +103,40 @@ func (s *Server) handleTranscribeAudio(ctx context.Context, req *sdk.CallToolReq
 	}
 
 	// Stop capturing when we detect silence after speech
+	captureErrors := capturer.Errors()
 	for {
 		select {
-		case sample := <-capturer.Samples():
-			audioBuffer = append(audioBuffer, sample.Data...)
-			isSpeech, _, speechEnded := vad.ProcessFrame(sample.Data)
-			if isSpeech {
+		case sample, ok := <-capturer.Samples():
+			if !ok {
+				// A recorded input ended, transcribe what was heard
+				goto transcribe
+			}
+			stats := audio.AnalyzeFrame(sample.Data)
+			levels.Add(stats)
+			isSpeech, _, speechEnded := vad.ProcessAnalyzed(sample.Data, stats)
+			if isSpeech && !speechStarted {
+				first, second := preRoll.Spans()
+				audioBuffer = append(audioBuffer, first...)
+				audioBuffer = append(audioBuffer, second...)
 				speechStarted = true
 			}
+			if speechStarted {
+				audioBuffer = append(audioBuffer, sample.Data...)
+			} else {
+				preRoll.Add(sample.Data)
+			}
+			sample.Release()
 			if speechEnded && speechStarted {
 				silenceCount++
 				if silenceCount >= 1 {
 					goto transcribe
 				}
 			}
-		case err := <-capturer.Errors():
+		case err, ok := <-captureErrors:
+			if !ok {
+				captureErrors = nil
+				continue
+			}
 			return nil, nil, fmt.Errorf("capture error: %w", err)
 		case <-ctx.Done():
 			return nil, nil, ctx.Err()
@@ -71,23 +147,28 @@ transcribe:
 	capturer.Stop()
 
 	// Process audio through STT engine
-	_, err = s.sttEngine.ProcessAudio(ctx, audioBuffer)
+	_, err = engine.ProcessAudio(ctx, audioBuffer)
 	if err != nil {
 		return nil, nil, fmt.Errorf("transcription failed: %w", err)
 	}
 
 	// Get final result
-	finalResult, err := s.sttEngine.FinalResult()
+	finalResult, err := engine.FinalResult()
 	if err != nil {
 		return nil, nil, fmt.Errorf("failed to get final result: %w", err)
 	}
 
-	return &sdk.CallToolResult{
-		Content: []sdk.Content{
-			&sdk.TextContent{Text: finalResult.Text},
-			//&sdk.TextContent{Text: fmt.Sprintf("Confidence: %.2f, Duration: N/A", finalResult.Confidence)},
-		},
-	}, nil, nil
+	content := []sdk.Content{
+		&sdk.TextContent{Text: finalResult.Text},
+		//&sdk.TextContent{Text: fmt.Sprintf("Confidence: %.2f, Duration: N/A", finalResult.Confidence)},
+	}
+	if levels.Clipped > 0 {
+		content = append(content, &sdk.TextContent{Text: fmt.Sprintf(
+			"Warning: microphone input clipped in %d samples (peak %.3f), transcription may be degraded",
+			levels.Clipped, levels.PeakLevel())})
+	}
+
+	return &sdk.CallToolResult{Content: content}, nil, nil
 }
 
 func (s *Server) handleListModels(ctx context.Context, req *sdk.CallToolRequest, args ListModelsArgs) (*sdk.CallToolResult, any, error) {
@@ -104,5 +185,12 @@ func (s *Server) handleListModels(ctx context.Context, req *sdk.CallToolRequest,
 		content = append(content, &sdk.TextContent{Text: fmt.Sprintf("- %s", model)})
 	}
 
+	if cached := s.models.Models(); len(cached) > 0 {
+		content = append(content, &sdk.TextContent{Text: fmt.Sprintf("Loaded models (%d MB):", s.models.Resident()>>20)})
+		for _, model := range cached {
+			content = append(content, &sdk.TextContent{Text: fmt.Sprintf("- %s", model)})
+		}
+	}
+
 	return &sdk.CallToolResult{Content: content}, nil, nil
 }
@@ -0,0 +1,184 @@
+package stt
+
+import (
+	"context"
+	"time"
+)
+
+// BatchConfig holds configuration for adaptive frame batching
+type BatchConfig struct {
+	// SampleRate is the audio sample rate in Hz (16-bit mono PCM assumed)
+	SampleRate int
+
+	// MinChunk is the smallest batch, used while the engine keeps up
+	MinChunk time.Duration
+
+	// InitialChunk is the batch duration to start with
+	InitialChunk time.Duration
+
+	// MaxChunk is the largest batch, used when the engine falls behind
+	MaxChunk time.Duration
+
+	// OnProcess, if set, is called after every engine call with the amount
+	// of audio decoded and the time it took
+	OnProcess func(audio, processing time.Duration)
+}
+
+// DefaultBatchConfig returns a batching configuration for 30ms capture periods
+func DefaultBatchConfig(sampleRate int) BatchConfig {
+	return BatchConfig{
+		SampleRate:   sampleRate,
+		MinChunk:     30 * time.Millisecond,
+		InitialChunk: 60 * time.Millisecond,
+		MaxChunk:     480 * time.Millisecond,
+	}
+}
+
+// BatchStats holds throughput counters for a Batcher
+type BatchStats struct {
+	// Calls is the number of engine calls made
+	Calls int
+
+	// Audio is the total duration of audio sent to the engine
+	Audio time.Duration
+
+	// Processing is the total time spent inside the engine
+	Processing time.Duration
+
+	// Chunk is the current target batch duration
+	Chunk time.Duration
+}
+
+// RTF returns the real-time factor (processing time / audio time)
+// Values below 1.0 mean the engine decodes faster than real time.
+func (s BatchStats) RTF() float64 {
+	if s.Audio == 0 {
+		return 0
+	}
+	return float64(s.Processing) / float64(s.Audio)
+}
+
+// Batcher merges capture frames into larger chunks before handing them to an Engine
+//
+// Every ProcessAudio call is a cgo crossing plus a partial-result round trip,
+// so batching cuts per-frame overhead. The batch grows when the engine falls
+// behind real time (or the capture queue backs up) and shrinks back when the
+// engine is idle, keeping partial results low-latency.
+type Batcher struct {
+	engine Engine
+	config BatchConfig
+	buffer []byte
+	target int // target batch size in bytes
+	stats  BatchStats
+}
+
+// NewBatcher creates a new adaptive batcher in front of engine
+func NewBatcher(engine Engine, config BatchConfig) *Batcher {
+	if config.SampleRate <= 0 {
+		config.SampleRate = 16000
+	}
+	if config.MinChunk <= 0 {
+		config.MinChunk = 30 * time.Millisecond
+	}
+	if config.MaxChunk < config.MinChunk {
+		config.MaxChunk = config.MinChunk
+	}
+	if config.InitialChunk < config.MinChunk || config.InitialChunk > config.MaxChunk {
+		config.InitialChunk = config.MinChunk
+	}
+
+	b := &Batcher{
+		engine: engine,
+		config: config,
+	}
+	b.target = b.bytesFor(config.InitialChunk)
+	b.buffer = make([]byte, 0, b.bytesFor(config.MaxChunk))
+	return b
+}
+
+// Add appends a frame to the current batch and runs the engine once the batch is full
+// backlog is the number of frames still waiting in the capture queue, used as a
+// signal that the engine is falling behind. Returns nil while the batch is filling.
+func (b *Batcher) Add(ctx context.Context, data []byte, backlog int) (*Result, error) {
+	b.buffer = append(b.buffer, data...)
+	if len(b.buffer) < b.target {
+		return nil, nil
+	}
+	return b.process(ctx, backlog)
+}
+
+// Flush sends any partially filled batch to the engine
+// Call before FinalResult so buffered audio is not lost.
+func (b *Batcher) Flush(ctx context.Context) (*Result, error) {
+	if len(b.buffer) == 0 {
+		return nil, nil
+	}
+	return b.process(ctx, 0)
+}
+
+// Reset discards any buffered audio
+func (b *Batcher) Reset() {
+	b.buffer = b.buffer[:0]
+}
+
+// Stats returns a snapshot of the batcher's throughput counters
+func (b *Batcher) Stats() BatchStats {
+	stats := b.stats
+	stats.Chunk = b.durationOf(b.target)
+	return stats
+}
+
+// process runs the engine on the buffered batch and adapts the batch size
+func (b *Batcher) process(ctx context.Context, backlog int) (*Result, error) {
+	audio := b.durationOf(len(b.buffer))
+
+	start := time.Now()
+	result, err := b.engine.ProcessAudio(ctx, b.buffer)
+	elapsed := time.Since(start)
+	b.buffer = b.buffer[:0]
+	if err != nil {
+		return nil, err
+	}
+
+	b.stats.Calls++
+	b.stats.Audio += audio
+	b.stats.Processing += elapsed
+	if audio > 0 {
+		b.adapt(float64(elapsed)/float64(audio), backlog)
+	}
+	if b.config.OnProcess != nil {
+		b.config.OnProcess(audio, elapsed)
+	}
+
+	return result, nil
+}
+
+// adapt grows the batch multiplicatively when behind and shrinks it gradually when idle
+func (b *Batcher) adapt(rtf float64, backlog int) {
+	minBytes := b.bytesFor(b.config.MinChunk)
+	maxBytes := b.bytesFor(b.config.MaxChunk)
+
+	switch {
+	case backlog > 0 || rtf > 0.9:
+		b.target *= 2
+	case rtf < 0.5:
+		b.target = (b.target * 3 / 4) &^ 1 // Keep whole 16-bit samples
+	}
+
+	if b.target < minBytes {
+		b.target = minBytes
+	}
+	if b.target > maxBytes {
+		b.target = maxBytes
+	}
+}
+
+// bytesFor converts a duration to a whole number of 16-bit samples in bytes
+func (b *Batcher) bytesFor(d time.Duration) int {
+	return int(int64(d)*int64(b.config.SampleRate)/int64(time.Second)) * 2
+}
+
+// durationOf converts a byte count of 16-bit samples to a duration
+func (b *Batcher) durationOf(n int) time.Duration {
+	return time.Duration(n/2) * time.Second / time.Duration(b.config.SampleRate)
+}
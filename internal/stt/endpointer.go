@@ -0,0 +1,169 @@
+package stt
+
+import (
+	"fmt"
+	"strings"
+	"time"
+)
+
+// EndpointMode selects how the end of an utterance is decided
+type EndpointMode string
+
+const (
+	// EndpointVAD ends utterances when the energy VAD has heard its full
+	// silence delay (default)
+	EndpointVAD EndpointMode = "vad"
+
+	// EndpointDecoder also ends utterances on the recognizer's own endpoint
+	// decisions and on short trailing silence once its hypothesis is stable
+	EndpointDecoder EndpointMode = "decoder"
+)
+
+// ParseEndpointMode parses an endpointing mode name
+// An empty string selects EndpointVAD.
+func ParseEndpointMode(name string) (EndpointMode, error) {
+	switch mode := EndpointMode(strings.ToLower(strings.TrimSpace(name))); mode {
+	case "":
+		return EndpointVAD, nil
+	case EndpointVAD, EndpointDecoder:
+		return mode, nil
+	default:
+		return "", fmt.Errorf("unknown endpointing mode: %s (valid: vad, decoder)", name)
+	}
+}
+
+// EndpointReason names the rule that ended an utterance
+type EndpointReason string
+
+const (
+	// EndpointNone means the utterance has not ended
+	EndpointNone EndpointReason = ""
+
+	// EndpointFinal means the recognizer returned a final result on its own
+	EndpointFinal EndpointReason = "decoder"
+
+	// EndpointStable means the hypothesis stopped changing and the audio has
+	// been quiet for TrailingSilence
+	EndpointStable EndpointReason = "stable"
+
+	// EndpointSilence means the audio has been quiet for MaxTrailingSilence
+	// after something was decoded, even though the hypothesis kept changing
+	EndpointSilence EndpointReason = "silence"
+
+	// EndpointLength means the utterance reached MaxUtterance
+	EndpointLength EndpointReason = "length"
+)
+
+// EndpointConfig holds the trailing-silence rules of an Endpointer
+type EndpointConfig struct {
+	// SampleRate is the audio sample rate in Hz (16-bit mono PCM assumed)
+	SampleRate int
+
+	// TrailingSilence ends an utterance once the audio has been quiet this
+	// long and the partial hypothesis has not changed during the quiet
+	TrailingSilence time.Duration
+
+	// MaxTrailingSilence ends an utterance that decoded something once the
+	// audio has been quiet this long, whatever the hypothesis does
+	MaxTrailingSilence time.Duration
+
+	// MaxUtterance ends utterances longer than this (0 = no limit)
+	MaxUtterance time.Duration
+}
+
+// DefaultEndpointConfig returns rules that finalize a few hundred ms after speech
+func DefaultEndpointConfig(sampleRate int) EndpointConfig {
+	return EndpointConfig{
+		SampleRate:         sampleRate,
+		TrailingSilence:    300 * time.Millisecond,
+		MaxTrailingSilence: 800 * time.Millisecond,
+		MaxUtterance:       20 * time.Second,
+	}
+}
+
+// Endpoint is an endpointing decision
+type Endpoint struct {
+	// Reason is the rule that fired, EndpointNone if the utterance goes on
+	Reason EndpointReason
+
+	// TrailingSilence is how long the audio had been quiet when the rule
+	// fired, the part of the end-of-speech latency spent listening
+	TrailingSilence time.Duration
+}
+
+// Endpointer decides when an utterance has ended from the recognizer's
+// results and the trailing silence measured by a VAD
+//
+// The recognizer ends an utterance itself when its endpoint rules fire
+// (AcceptWaveform reporting a final result). Noisy input often keeps that
+// from happening, so the Endpointer also ends an utterance on trailing
+// silence, much shorter than a VAD silence delay, once the hypothesis has
+// stopped changing, the usual sign that the speaker is done.
+type Endpointer struct {
+	config EndpointConfig
+
+	utterance   int // Samples decoded in the current utterance
+	hypothesis  string
+	stableAt    time.Duration // Trailing silence when the hypothesis last changed
+	lastSilence time.Duration
+	decoded     bool // Whether a partial hypothesis has been seen
+}
+
+// NewEndpointer creates an endpointer with the given rules
+func NewEndpointer(config EndpointConfig) *Endpointer {
+	if config.SampleRate <= 0 {
+		config.SampleRate = 16000
+	}
+	return &Endpointer{config: config}
+}
+
+// Observe records a decoded chunk of samples and the engine's result for
+// it, nil when the engine returned none, with the VAD's trailing silence
+// after the chunk, and returns whether the utterance has ended
+func (e *Endpointer) Observe(samples int, result *Result, trailingSilence time.Duration) Endpoint {
+	e.utterance += samples
+
+	if trailingSilence < e.lastSilence {
+		// Speech resumed, the quiet so far doesn't count
+		e.stableAt = 0
+	}
+	e.lastSilence = trailingSilence
+
+	if result != nil && result.Text != "" {
+		if !result.Partial {
+			return Endpoint{Reason: EndpointFinal, TrailingSilence: trailingSilence}
+		}
+		e.decoded = true
+		if result.Text != e.hypothesis {
+			e.hypothesis = result.Text
+			e.stableAt = trailingSilence
+		}
+	}
+
+	switch {
+	case !e.decoded:
+		// Nothing decoded yet, leave noise-only utterances to the VAD
+		return Endpoint{}
+	case trailingSilence-e.stableAt >= e.config.TrailingSilence:
+		return Endpoint{Reason: EndpointStable, TrailingSilence: trailingSilence}
+	case trailingSilence >= e.config.MaxTrailingSilence:
+		return Endpoint{Reason: EndpointSilence, TrailingSilence: trailingSilence}
+	case e.config.MaxUtterance > 0 && e.duration(e.utterance) >= e.config.MaxUtterance:
+		return Endpoint{Reason: EndpointLength, TrailingSilence: trailingSilence}
+	}
+	return Endpoint{}
+}
+
+// Reset starts a new utterance
+func (e *Endpointer) Reset() {
+	e.utterance = 0
+	e.hypothesis = ""
+	e.stableAt = 0
+	e.lastSilence = 0
+	e.decoded = false
+}
+
+// duration converts a sample count to a duration
+func (e *Endpointer) duration(samples int) time.Duration {
+	return time.Duration(samples) * time.Second / time.Duration(e.config.SampleRate)
+}
@@ -1,6 +1,9 @@
 package stt
 
-import "context"
+import (
+	"context"
+	"time"
+)
 
 // Result represents a speech recognition result
 type Result struct {
@@ -37,6 +40,22 @@ type Config struct {
 
 	// ShowWords enables word-level timestamps
 	ShowWords bool
+
+	// SkipPartials stops the engine fetching partial results, for callers
+	// that only use final results
+	SkipPartials bool
+
+	// PartialInterval fetches partial results at most this often (0 = after every call)
+	PartialInterval time.Duration
+
+	// LockModel locks the model files in memory when Initialize loads them
+	LockModel bool
+
+	// Grammar restricts recognition to these phrases, decoding against a
+	// small graph built from them instead of the full language model
+	// Speech outside the grammar decodes as "[unk]". Only models with a
+	// dynamic graph (the small and lgraph models) support grammars.
+	Grammar []string
 }
 
 // Engine is the interface for speech-to-text engines
@@ -45,9 +64,14 @@ type Engine interface {
 	Initialize(config Config) error
 
 	// ProcessAudio processes audio data and returns recognition results
-	// Audio data should be 16-bit PCM
+	// Audio data should be 16-bit PCM. Returns a nil result when there is no
+	// final result and partial results are skipped or throttled.
 	ProcessAudio(ctx context.Context, audioData []byte) (*Result, error)
 
+	// ProcessAudioSpans processes audio split across two spans (e.g. from
+	// audio.PreRoll.Spans) in place, without joining them first
+	ProcessAudioSpans(ctx context.Context, first, second []byte) (*Result, error)
+
 	// FinalResult returns the final result and resets the recognizer
 	FinalResult() (*Result, error)
 
@@ -0,0 +1,71 @@
+package stt
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"os"
+	"strings"
+)
+
+// grammarJSON encodes phrases as a Vosk grammar, a JSON array of phrases
+// Phrases are lowercased to match model vocabularies, and "[unk]" is added
+// so speech outside the grammar isn't forced onto the nearest phrase.
+func grammarJSON(phrases []string) (string, error) {
+	grammar := make([]string, 0, len(phrases)+1)
+	hasUnknown := false
+	for _, phrase := range phrases {
+		phrase = strings.ToLower(strings.Join(strings.Fields(phrase), " "))
+		if phrase == "" {
+			continue
+		}
+		hasUnknown = hasUnknown || phrase == "[unk]"
+		grammar = append(grammar, phrase)
+	}
+	if len(grammar) == 0 {
+		return "", fmt.Errorf("grammar has no phrases")
+	}
+	if !hasUnknown {
+		grammar = append(grammar, "[unk]")
+	}
+
+	data, err := json.Marshal(grammar)
+	if err != nil {
+		return "", fmt.Errorf("failed to encode grammar: %w", err)
+	}
+	return string(data), nil
+}
+
+// ParseGrammar splits a comma-separated phrase list
+func ParseGrammar(list string) []string {
+	var phrases []string
+	for _, phrase := range strings.Split(list, ",") {
+		if phrase = strings.TrimSpace(phrase); phrase != "" {
+			phrases = append(phrases, phrase)
+		}
+	}
+	return phrases
+}
+
+// ReadGrammarFile reads a phrase list with one phrase per line
+// Blank lines and lines starting with # are skipped.
+func ReadGrammarFile(path string) ([]string, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to open grammar: %w", err)
+	}
+	defer file.Close()
+
+	var phrases []string
+	scanner := bufio.NewScanner(file)
+	for scanner.Scan() {
+		line := strings.TrimSpace(scanner.Text())
+		if line != "" && !strings.HasPrefix(line, "#") {
+			phrases = append(phrases, line)
+		}
+	}
+	if err := scanner.Err(); err != nil {
+		return nil, fmt.Errorf("failed to read grammar: %w", err)
+	}
+	return phrases, nil
+}
@@ -0,0 +1,84 @@
+package stt
+
+import (
+	"context"
+	"os"
+	"testing"
+	"time"
+)
+
+func TestGrammarJSON(t *testing.T) {
+	tests := []struct {
+		phrases []string
+		want    string
+	}{
+		{[]string{"Lights On", "  volume   up "}, `["lights on","volume up","[unk]"]`},
+		{[]string{"yes", "[unk]", ""}, `["yes","[unk]"]`},
+	}
+	for _, tt := range tests {
+		got, err := grammarJSON(tt.phrases)
+		if err != nil || got != tt.want {
+			t.Errorf("grammarJSON(%q) = %s, %v; want %s", tt.phrases, got, err, tt.want)
+		}
+	}
+	if _, err := grammarJSON([]string{" ", ""}); err == nil {
+		t.Error("grammarJSON accepted a grammar without phrases")
+	}
+}
+
+func TestParseGrammar(t *testing.T) {
+	got := ParseGrammar(" yes, no ,,cancel that,")
+	want := []string{"yes", "no", "cancel that"}
+	if len(got) != len(want) {
+		t.Fatalf("ParseGrammar = %q; want %q", got, want)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Fatalf("ParseGrammar = %q; want %q", got, want)
+		}
+	}
+}
+
+// BenchmarkGrammarRTF compares the real-time factor of a recognizer
+// restricted to a command grammar with a free-form one on the same model
+// Set VOX_TEST_MODEL to a model directory to run it.
+func BenchmarkGrammarRTF(b *testing.B) {
+	path := os.Getenv("VOX_TEST_MODEL")
+	if path == "" {
+		b.Skip("VOX_TEST_MODEL not set")
+	}
+	model, err := LoadModel(path, false)
+	if err != nil {
+		b.Fatal(err)
+	}
+	defer model.Release()
+
+	grammar := ParseGrammar("lights on,lights off,volume up,volume down,next track,previous track,stop,play")
+	for _, bench := range []struct {
+		name    string
+		grammar []string
+	}{
+		{"free-form", nil},
+		{"grammar", grammar},
+	} {
+		b.Run(bench.name, func(b *testing.B) {
+			config := DefaultConfig(path)
+			config.Grammar = bench.grammar
+			engine, err := NewVoskSession(model, config)
+			if err != nil {
+				b.Fatal(err)
+			}
+			defer engine.Close()
+
+			var rtf float64
+			for i := 0; i < b.N; i++ {
+				measured, err := MeasureRTF(context.Background(), engine, config.SampleRate, time.Second)
+				if err != nil {
+					b.Fatal(err)
+				}
+				rtf += measured
+			}
+			b.ReportMetric(rtf/float64(b.N), "rtf")
+		})
+	}
+}
@@ -0,0 +1,161 @@
+package stt
+
+import (
+	"fmt"
+	"sync"
+	"time"
+
+	vosk "github.com/alphacep/vosk-api/go"
+
+	"github.com/emmett/vox/internal/models"
+)
+
+// ModelLoadStats reports how long a model took to load
+type ModelLoadStats struct {
+	// Prewarm is the page cache prewarm done before loading
+	Prewarm models.PrewarmStats
+
+	// Load is the time spent in the Vosk model loader
+	Load time.Duration
+}
+
+// String formats the load stats for status output
+func (s ModelLoadStats) String() string {
+	return fmt.Sprintf("loaded in %v (prewarm: %s)", s.Load.Round(time.Millisecond), s.Prewarm)
+}
+
+// Model is a shared, reference-counted handle on a loaded Vosk model
+//
+// A model holds the acoustic model and decoding graph (up to ~1.8GB for the
+// large models) and is read-only once loaded, so any number of recognizers
+// can decode against it concurrently. Each holder of a reference calls
+// Release when done; the model is freed when the last reference is released.
+type Model struct {
+	path      string
+	model     *vosk.VoskModel
+	files     *models.PrewarmedModel
+	loadStats ModelLoadStats
+	mu        sync.Mutex
+	refs      int
+}
+
+// LoadModel loads the Vosk model at path and returns a handle holding one reference
+// The model files are prewarmed into the page cache first; with lock they
+// are also locked in memory for the life of the model.
+func LoadModel(path string, lock bool) (*Model, error) {
+	// Set log level (0 = errors only, higher = more verbose)
+	vosk.SetLogLevel(-1) // Suppress logs
+
+	// Prewarming is only an optimization, but a requested lock must succeed
+	files, err := models.Prewarm(path, lock)
+	if err != nil && lock {
+		return nil, err
+	}
+
+	var stats ModelLoadStats
+	if files != nil {
+		stats.Prewarm = files.Stats
+	}
+
+	start := time.Now()
+	model, err := vosk.NewModel(path)
+	if err == nil && model == nil {
+		err = fmt.Errorf("model returned nil")
+	}
+	if err != nil {
+		if files != nil {
+			files.Release()
+		}
+		return nil, fmt.Errorf("failed to load model from %s: %w", path, err)
+	}
+	stats.Load = time.Since(start)
+
+	return &Model{path: path, model: model, files: files, loadStats: stats, refs: 1}, nil
+}
+
+// LoadStats returns the time taken to load the model
+func (m *Model) LoadStats() ModelLoadStats {
+	return m.loadStats
+}
+
+// Path returns the directory the model was loaded from
+func (m *Model) Path() string {
+	return m.path
+}
+
+// Retain adds a reference to the model
+// Returns an error if the model has already been freed.
+func (m *Model) Retain() error {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+
+	if m.refs == 0 {
+		return fmt.Errorf("model %s already released", m.path)
+	}
+	m.refs++
+	return nil
+}
+
+// Release drops a reference, freeing the model when none remain
+func (m *Model) Release() {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+
+	if m.refs == 0 {
+		return
+	}
+	m.refs--
+	if m.refs == 0 {
+		m.model.Free()
+		m.model = nil
+		if m.files != nil {
+			m.files.Release()
+		}
+	}
+}
+
+// inUse reports whether anyone besides the loader holds a reference
+func (m *Model) inUse() bool {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	return m.refs > 1
+}
+
+// newRecognizer creates a recognizer on the model configured from config
+// The caller must hold a reference, which keeps the model from being freed,
+// so the lock only guards the check and recognizers (and their grammar
+// graphs) are built concurrently.
+func (m *Model) newRecognizer(config Config) (*vosk.VoskRecognizer, error) {
+	m.mu.Lock()
+	model := m.model
+	released := m.refs == 0
+	m.mu.Unlock()
+	if released {
+		return nil, fmt.Errorf("model %s already released", m.path)
+	}
+
+	var recognizer *vosk.VoskRecognizer
+	var err error
+	if len(config.Grammar) > 0 {
+		var grammar string
+		grammar, err = grammarJSON(config.Grammar)
+		if err != nil {
+			return nil, err
+		}
+		recognizer, err = vosk.NewRecognizerGrm(model, float64(config.SampleRate), grammar)
+	} else {
+		recognizer, err = vosk.NewRecognizer(model, float64(config.SampleRate))
+	}
+	if err != nil {
+		return nil, fmt.Errorf("failed to create recognizer: %w", err)
+	}
+
+	// Configure recognizer
+	if config.MaxAlternatives > 0 {
+		recognizer.SetMaxAlternatives(config.MaxAlternatives)
+	}
+	// Always enable word results to get confidence scores
+	recognizer.SetWords(1)
+
+	return recognizer, nil
+}
@@ -0,0 +1,292 @@
+package stt
+
+import (
+	"context"
+	"fmt"
+	"math"
+	"runtime"
+	"sort"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/emmett/vox/internal/audio"
+)
+
+// parallelFeedChunk is how much audio is handed to the recognizer per call
+// when decoding a segment
+const parallelFeedChunk = 200 * time.Millisecond
+
+const (
+	// splitSearchWindow is how far a cut in a long segment may move from an
+	// equal division to land on a pause
+	splitSearchWindow = time.Second
+
+	// splitFrame is the length of audio compared when looking for the
+	// quietest place to cut
+	splitFrame = 30 * time.Millisecond
+)
+
+// ParallelConfig holds configuration for parallel offline transcription
+type ParallelConfig struct {
+	// Jobs is the number of recognizers decoding at once
+	Jobs int
+
+	// SampleRate is the audio sample rate in Hz (16-bit mono PCM)
+	SampleRate int
+
+	// Segmenter finds the speech regions the recording is split into
+	Segmenter audio.SegmenterConfig
+
+	// MaxSegment splits longer speech regions into pieces cut at the quietest
+	// point near equal divisions, so one long monologue doesn't leave the
+	// other recognizers idle (0 = never split)
+	MaxSegment time.Duration
+
+	// Grammar restricts recognition to these phrases, if set (see Config.Grammar)
+	Grammar []string
+}
+
+// DefaultParallelConfig returns a configuration using one recognizer per CPU
+func DefaultParallelConfig() ParallelConfig {
+	return ParallelConfig{
+		Jobs:       runtime.NumCPU(),
+		SampleRate: 16000,
+		Segmenter:  audio.DefaultSegmenterConfig(),
+		MaxSegment: 30 * time.Second,
+	}
+}
+
+// TimedResult is a final result placed on the recording's timeline
+type TimedResult struct {
+	Result
+
+	// Start is the offset of the decoded segment from the start of the recording
+	Start time.Duration
+
+	// End is the offset of the end of the decoded segment
+	End time.Duration
+}
+
+// ParallelTranscriber decodes whole recordings on a pool of recognizers
+//
+// A recording is split at VAD silence boundaries and its speech segments are
+// decoded concurrently by recognizers sharing one model, then stitched back
+// in order. Silence is never decoded. Transcribe may be called concurrently;
+// all calls share the Jobs recognizers.
+type ParallelTranscriber struct {
+	config ParallelConfig
+	pool   *RecognizerPool
+}
+
+// NewParallelTranscriber creates a parallel transcriber decoding against model
+func NewParallelTranscriber(model *Model, config ParallelConfig) (*ParallelTranscriber, error) {
+	if config.Jobs < 1 {
+		config.Jobs = 1
+	}
+	if config.SampleRate <= 0 {
+		config.SampleRate = 16000
+	}
+	config.Segmenter.VAD.SampleRate = config.SampleRate
+
+	sttConfig := DefaultConfig(model.Path())
+	sttConfig.SampleRate = config.SampleRate
+	sttConfig.SkipPartials = true
+	sttConfig.Grammar = config.Grammar
+	pool, err := NewRecognizerPool(model, sttConfig, config.Jobs)
+	if err != nil {
+		return nil, err
+	}
+
+	return &ParallelTranscriber{config: config, pool: pool}, nil
+}
+
+// Transcribe decodes a recording of 16-bit mono PCM and returns its final
+// results in order, with offsets from the start of the recording
+func (t *ParallelTranscriber) Transcribe(ctx context.Context, pcm []byte) ([]TimedResult, error) {
+	segments, err := audio.SegmentPCM(pcm, t.config.Segmenter)
+	if err != nil {
+		return nil, fmt.Errorf("failed to segment audio: %w", err)
+	}
+	segments = splitSegments(pcm, segments, t.samples(t.config.MaxSegment), t.samples(splitSearchWindow), t.samples(splitFrame))
+	if len(segments) == 0 {
+		return nil, nil
+	}
+
+	// Hand out the longest segments first so the last ones to finish are short
+	order := make([]int, len(segments))
+	for i := range order {
+		order[i] = i
+	}
+	sort.SliceStable(order, func(a, b int) bool {
+		return segments[order[a]].EndSample-segments[order[a]].StartSample >
+			segments[order[b]].EndSample-segments[order[b]].StartSample
+	})
+	queue := make(chan int, len(order))
+	for _, i := range order {
+		queue <- i
+	}
+	close(queue)
+
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	results := make([]*Result, len(segments))
+	var wg sync.WaitGroup
+	var errOnce sync.Once
+	var firstErr error
+	fail := func(err error) {
+		errOnce.Do(func() {
+			firstErr = err
+			cancel()
+		})
+	}
+
+	for w := 0; w < min(t.config.Jobs, len(segments)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+
+			session, err := t.pool.Get(ctx)
+			if err != nil {
+				fail(err)
+				return
+			}
+			defer t.pool.Put(session)
+
+			for i := range queue {
+				if ctx.Err() != nil {
+					return
+				}
+				result, err := decodeSegment(ctx, session, segments[i].PCM(pcm), t.samples(parallelFeedChunk)*2)
+				if err != nil {
+					fail(fmt.Errorf("failed to decode segment at %v: %w", segments[i].Start(t.config.SampleRate), err))
+					return
+				}
+				results[i] = result
+			}
+		}()
+	}
+	wg.Wait()
+
+	if firstErr != nil {
+		return nil, firstErr
+	}
+	if err := ctx.Err(); err != nil {
+		return nil, err
+	}
+
+	timed := make([]TimedResult, 0, len(segments))
+	for i, result := range results {
+		if result == nil || result.Text == "" {
+			continue
+		}
+		timed = append(timed, TimedResult{
+			Result: *result,
+			Start:  segments[i].Start(t.config.SampleRate),
+			End:    segments[i].End(t.config.SampleRate),
+		})
+	}
+	return timed, nil
+}
+
+// Close releases the transcriber's recognizers
+func (t *ParallelTranscriber) Close() error {
+	return t.pool.Close()
+}
+
+// samples converts a duration to a sample count at the configured rate
+func (t *ParallelTranscriber) samples(d time.Duration) int {
+	return int(int64(d) * int64(t.config.SampleRate) / int64(time.Second))
+}
+
+// decodeSegment runs one speech segment through engine and returns its final result
+// Vosk may end utterances inside the segment; their texts are joined.
+func decodeSegment(ctx context.Context, engine Engine, pcm []byte, chunkBytes int) (*Result, error) {
+	var texts []string
+	var confidence float64
+	collect := func(result *Result) {
+		if result != nil && !result.Partial && result.Text != "" {
+			texts = append(texts, result.Text)
+			confidence += result.Confidence
+		}
+	}
+
+	for offset := 0; offset < len(pcm); offset += chunkBytes {
+		result, err := engine.ProcessAudio(ctx, pcm[offset:min(offset+chunkBytes, len(pcm))])
+		if err != nil {
+			return nil, err
+		}
+		collect(result)
+	}
+	result, err := engine.FinalResult()
+	if err != nil {
+		return nil, err
+	}
+	collect(result)
+
+	if err := engine.Reset(); err != nil {
+		return nil, err
+	}
+
+	if len(texts) == 0 {
+		return &Result{}, nil
+	}
+	return &Result{
+		Text:       strings.Join(texts, " "),
+		Confidence: confidence / float64(len(texts)),
+	}, nil
+}
+
+// splitSegments divides segments longer than maxSamples into pieces
+// Each cut is placed at the quietest frame of frameSamples within window
+// samples of an equal division, so pieces break between words rather than
+// through them. The window is kept under a quarter of maxSamples and the
+// piece count chosen so no piece exceeds maxSamples wherever its cuts land.
+func splitSegments(pcm []byte, segments []audio.Segment, maxSamples, window, frameSamples int) []audio.Segment {
+	if maxSamples <= 0 {
+		return segments
+	}
+	window = min(window, maxSamples/4)
+	frameSamples = max(min(frameSamples, window), 1)
+
+	split := make([]audio.Segment, 0, len(segments))
+	for _, segment := range segments {
+		length := segment.EndSample - segment.StartSample
+		if length <= maxSamples {
+			split = append(split, segment)
+			continue
+		}
+
+		pieces := (length + maxSamples - 2*window - 1) / (maxSamples - 2*window)
+		start := segment.StartSample
+		for p := 1; p < pieces; p++ {
+			target := segment.StartSample + length*p/pieces
+			cut := quietestCut(pcm, max(target-window, start+frameSamples), min(target+window, segment.EndSample-frameSamples), frameSamples)
+			split = append(split, audio.Segment{StartSample: start, EndSample: cut})
+			start = cut
+		}
+		split = append(split, audio.Segment{StartSample: start, EndSample: segment.EndSample})
+	}
+	return split
+}
+
+// quietestCut returns the sample index between lo and hi at the center of
+// the frameSamples frame with the least energy
+// Frames are compared every quarter frame.
+func quietestCut(pcm []byte, lo, hi, frameSamples int) int {
+	if hi <= lo {
+		return lo
+	}
+
+	best, bestPower := (lo+hi)/2, math.Inf(1)
+	step := max(frameSamples/4, 1)
+	for center := lo; center <= hi; center += step {
+		first := max(center-frameSamples/2, 0)
+		last := min(first+frameSamples, len(pcm)/2)
+		if power := audio.AnalyzeFrame(pcm[2*first : 2*last]).MeanSquare(); power < bestPower {
+			best, bestPower = center, power
+		}
+	}
+	return best
+}
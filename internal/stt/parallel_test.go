@@ -0,0 +1,70 @@
+package stt
+
+import (
+	"encoding/binary"
+	"math"
+	"testing"
+
+	"github.com/emmett/vox/internal/audio"
+)
+
+// speechWithPauses returns seconds of 16 kHz PCM of a loud tone broken by
+// 100 ms pauses starting at each of pauses (in samples)
+func speechWithPauses(seconds int, pauses ...int) []byte {
+	pcm := make([]byte, seconds*16000*2)
+	for i := 0; i < len(pcm)/2; i++ {
+		value := int16(8000 * math.Sin(2*math.Pi*300*float64(i)/16000))
+		for _, pause := range pauses {
+			if i >= pause && i < pause+1600 {
+				value = 0
+			}
+		}
+		binary.LittleEndian.PutUint16(pcm[2*i:], uint16(value))
+	}
+	return pcm
+}
+
+func TestSplitSegmentsCutsAtPauses(t *testing.T) {
+	// 40 s of speech with pauses near the thirds, off the equal division
+	// points at 213333 and 426667 samples
+	pauses := []int{200000, 440000}
+	pcm := speechWithPauses(40, pauses...)
+	segment := audio.Segment{StartSample: 0, EndSample: 40 * 16000}
+
+	// 20 s pieces, cuts searched within 1 s in 30 ms frames
+	pieces := splitSegments(pcm, []audio.Segment{segment}, 20*16000, 16000, 480)
+	if len(pieces) != 3 {
+		t.Fatalf("split into %d pieces; want 3: %v", len(pieces), pieces)
+	}
+
+	for i, pause := range pauses {
+		cut := pieces[i].EndSample
+		if cut < pause || cut >= pause+1600 {
+			t.Errorf("cut %d at sample %d; want inside the pause at %d-%d", i, cut, pause, pause+1600)
+		}
+		if pieces[i+1].StartSample != cut {
+			t.Errorf("piece %d starts at %d; want %d", i+1, pieces[i+1].StartSample, cut)
+		}
+	}
+	for i, piece := range pieces {
+		if length := piece.EndSample - piece.StartSample; length > 20*16000 {
+			t.Errorf("piece %d is %d samples; want at most %d", i, length, 20*16000)
+		}
+	}
+	if first, last := pieces[0].StartSample, pieces[len(pieces)-1].EndSample; first != 0 || last != segment.EndSample {
+		t.Errorf("pieces span %d-%d; want 0-%d", first, last, segment.EndSample)
+	}
+}
+
+func TestSplitSegmentsKeepsShortSegments(t *testing.T) {
+	pcm := speechWithPauses(10)
+	segments := []audio.Segment{{StartSample: 100, EndSample: 50000}, {StartSample: 60000, EndSample: 160000}}
+
+	got := splitSegments(pcm, segments, 20*16000, 16000, 480)
+	if len(got) != 2 || got[0] != segments[0] || got[1] != segments[1] {
+		t.Errorf("splitSegments = %v; want %v unchanged", got, segments)
+	}
+	if got := splitSegments(pcm, segments, 0, 16000, 480); len(got) != 2 {
+		t.Errorf("splitSegments with no limit = %v; want %v", got, segments)
+	}
+}
@@ -0,0 +1,140 @@
+package stt
+
+import (
+	"context"
+	"fmt"
+	"sync"
+)
+
+// PoolStats holds counters for a RecognizerPool
+type PoolStats struct {
+	// Size is the maximum number of sessions checked out at once
+	Size int
+
+	// InUse is the number of sessions currently checked out
+	InUse int
+
+	// Idle is the number of reset sessions waiting for reuse
+	Idle int
+
+	// Created is the total number of recognizers created
+	Created int
+}
+
+// RecognizerPool hands out recognition sessions on a shared Model
+//
+// Sessions cost recognizer memory only; the model is loaded once. At most
+// size sessions are checked out at a time, and Get blocks until one is
+// returned. Returned sessions are reset and kept for reuse rather than freed.
+type RecognizerPool struct {
+	model  *Model
+	config Config
+	tokens chan struct{}
+
+	mu      sync.Mutex
+	idle    []*VoskEngine
+	created int
+	closed  bool
+}
+
+// NewRecognizerPool creates a pool of up to size sessions decoding against model
+// The pool holds its own reference on model, released by Close.
+func NewRecognizerPool(model *Model, config Config, size int) (*RecognizerPool, error) {
+	if size < 1 {
+		return nil, fmt.Errorf("invalid pool size: %d", size)
+	}
+	if err := model.Retain(); err != nil {
+		return nil, err
+	}
+
+	return &RecognizerPool{
+		model:  model,
+		config: config,
+		tokens: make(chan struct{}, size),
+	}, nil
+}
+
+// Get checks out a session, waiting until one is free or ctx is done
+// The session must be handed back with Put, not closed.
+func (p *RecognizerPool) Get(ctx context.Context) (*VoskEngine, error) {
+	select {
+	case p.tokens <- struct{}{}:
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+
+	p.mu.Lock()
+	if p.closed {
+		p.mu.Unlock()
+		<-p.tokens
+		return nil, fmt.Errorf("recognizer pool closed")
+	}
+	if n := len(p.idle); n > 0 {
+		session := p.idle[n-1]
+		p.idle = p.idle[:n-1]
+		p.mu.Unlock()
+		return session, nil
+	}
+	p.created++
+	p.mu.Unlock()
+
+	session, err := NewVoskSession(p.model, p.config)
+	if err != nil {
+		p.mu.Lock()
+		p.created--
+		p.mu.Unlock()
+		<-p.tokens
+		return nil, err
+	}
+	return session, nil
+}
+
+// Put resets a session and returns it to the pool
+// Sessions that fail to reset are closed instead of reused.
+func (p *RecognizerPool) Put(session *VoskEngine) {
+	defer func() { <-p.tokens }()
+
+	if err := session.Reset(); err != nil {
+		session.Close()
+		return
+	}
+
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	if p.closed {
+		session.Close()
+		return
+	}
+	p.idle = append(p.idle, session)
+}
+
+// Stats returns a snapshot of the pool's counters
+func (p *RecognizerPool) Stats() PoolStats {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	return PoolStats{
+		Size:    cap(p.tokens),
+		InUse:   len(p.tokens),
+		Idle:    len(p.idle),
+		Created: p.created,
+	}
+}
+
+// Close frees the idle sessions and releases the pool's model reference
+// Sessions still checked out are closed as they are returned.
+func (p *RecognizerPool) Close() error {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+
+	if p.closed {
+		return nil
+	}
+	p.closed = true
+
+	for _, session := range p.idle {
+		session.Close()
+	}
+	p.idle = nil
+	p.model.Release()
+	return nil
+}
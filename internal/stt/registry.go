@@ -0,0 +1,272 @@
+package stt
+
+import (
+	"bytes"
+	"context"
+	"fmt"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"sync"
+	"time"
+)
+
+// warmUpDuration is how much silence Preload decodes to prime a model
+const warmUpDuration = time.Second
+
+// CachedModel describes a model held by a ModelRegistry
+type CachedModel struct {
+	// Name is the name the model was requested by
+	Name string
+
+	// Size is the model's estimated resident memory in bytes
+	Size int64
+
+	// InUse reports whether any engine currently holds the model
+	InUse bool
+}
+
+// String formats the cached model for listings
+func (c CachedModel) String() string {
+	state := "idle"
+	if c.InUse {
+		state = "in use"
+	}
+	return fmt.Sprintf("%s (%d MB, %s)", c.Name, c.Size>>20, state)
+}
+
+// ModelRegistry loads models on first use and shares them across the process
+//
+// Each model is loaded once and handed out as a shared Model reference, so
+// selecting a model per request costs a map lookup. The registry tracks each
+// model's resident memory and, when the total exceeds the budget, evicts the
+// least recently used models that no engine is holding.
+type ModelRegistry struct {
+	resolve func(name string) (string, error)
+	budget  int64
+	lock    bool
+
+	// loadMu serializes loads so a model is never loaded twice and the
+	// resident memory growth of a load can be attributed to it
+	loadMu sync.Mutex
+
+	mu      sync.Mutex
+	entries map[string]*registryEntry
+	clock   uint64
+}
+
+// registryEntry is a cached model and its bookkeeping
+type registryEntry struct {
+	model    *Model
+	size     int64
+	lastUsed uint64
+}
+
+// NewModelRegistry creates a registry that keeps loaded models within budget bytes
+// resolve maps a model name to its directory. A budget of 0 or less never
+// evicts. With lock, model files are locked in memory while loaded.
+func NewModelRegistry(budget int64, lock bool, resolve func(name string) (string, error)) *ModelRegistry {
+	return &ModelRegistry{
+		resolve: resolve,
+		budget:  budget,
+		lock:    lock,
+		entries: make(map[string]*registryEntry),
+	}
+}
+
+// Acquire returns a reference on the named model, loading it if needed
+// The caller must Release the model when done with it.
+func (r *ModelRegistry) Acquire(name string) (*Model, error) {
+	if model, ok := r.lookup(name); ok {
+		return model, nil
+	}
+
+	r.loadMu.Lock()
+	defer r.loadMu.Unlock()
+
+	// Another caller may have loaded it while we waited
+	if model, ok := r.lookup(name); ok {
+		return model, nil
+	}
+
+	path, err := r.resolve(name)
+	if err != nil {
+		return nil, err
+	}
+
+	before := residentMemory()
+	model, err := LoadModel(path, r.lock)
+	if err != nil {
+		return nil, err
+	}
+	size := residentMemory() - before
+	if before == 0 || size <= 0 {
+		// No usable RSS reading, fall back to the model's size on disk
+		size = diskUsage(path)
+	}
+
+	// The registry keeps the reference from LoadModel, the caller gets another
+	if err := model.Retain(); err != nil {
+		return nil, err
+	}
+
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	r.clock++
+	r.entries[name] = &registryEntry{model: model, size: size, lastUsed: r.clock}
+	r.evict(name)
+
+	return model, nil
+}
+
+// Preload loads the named model and warms it with a decode of silence, so the
+// first request using it finds the model resident and the decoder primed
+// Returns the model's load stats.
+func (r *ModelRegistry) Preload(ctx context.Context, name string) (ModelLoadStats, error) {
+	model, err := r.Acquire(name)
+	if err != nil {
+		return ModelLoadStats{}, err
+	}
+	defer model.Release()
+
+	config := DefaultConfig(model.Path())
+	config.SkipPartials = true
+	engine, err := NewVoskSession(model, config)
+	if err != nil {
+		return ModelLoadStats{}, fmt.Errorf("failed to create recognizer: %w", err)
+	}
+	defer engine.Close()
+
+	return model.LoadStats(), WarmUp(ctx, engine, config.SampleRate, warmUpDuration)
+}
+
+// lookup returns a new reference on a cached model and marks it recently used
+func (r *ModelRegistry) lookup(name string) (*Model, bool) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	entry, ok := r.entries[name]
+	if !ok || entry.model.Retain() != nil {
+		return nil, false
+	}
+	r.clock++
+	entry.lastUsed = r.clock
+	r.evict(name)
+	return entry.model, true
+}
+
+// evict drops least recently used idle models until the cache fits the budget
+// keep is never evicted. Models held by engines are skipped, since evicting
+// them would not free their memory. Must be called with r.mu held.
+func (r *ModelRegistry) evict(keep string) {
+	if r.budget <= 0 {
+		return
+	}
+
+	for r.resident() > r.budget {
+		var victim string
+		var oldest *registryEntry
+		for name, entry := range r.entries {
+			if name == keep || entry.model.inUse() {
+				continue
+			}
+			if oldest == nil || entry.lastUsed < oldest.lastUsed {
+				victim, oldest = name, entry
+			}
+		}
+		if oldest == nil {
+			return
+		}
+		delete(r.entries, victim)
+		oldest.model.Release()
+	}
+}
+
+// resident returns the estimated memory of all cached models
+// Must be called with r.mu held.
+func (r *ModelRegistry) resident() int64 {
+	var total int64
+	for _, entry := range r.entries {
+		total += entry.size
+	}
+	return total
+}
+
+// Resident returns the estimated memory of all cached models in bytes
+func (r *ModelRegistry) Resident() int64 {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	return r.resident()
+}
+
+// Models returns the cached models, most recently used first
+func (r *ModelRegistry) Models() []CachedModel {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	type ordered struct {
+		CachedModel
+		lastUsed uint64
+	}
+	list := make([]ordered, 0, len(r.entries))
+	for name, entry := range r.entries {
+		list = append(list, ordered{
+			CachedModel: CachedModel{Name: name, Size: entry.size, InUse: entry.model.inUse()},
+			lastUsed:    entry.lastUsed,
+		})
+	}
+	sort.Slice(list, func(i, j int) bool { return list[i].lastUsed > list[j].lastUsed })
+
+	cached := make([]CachedModel, len(list))
+	for i, entry := range list {
+		cached[i] = entry.CachedModel
+	}
+	return cached
+}
+
+// Close drops the registry's references on all cached models
+// Models still held by engines are freed when those engines close.
+func (r *ModelRegistry) Close() error {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+
+	for name, entry := range r.entries {
+		entry.model.Release()
+		delete(r.entries, name)
+	}
+	return nil
+}
+
+// residentMemory returns the process's resident set size in bytes, or 0 if unknown
+func residentMemory() int64 {
+	data, err := os.ReadFile("/proc/self/statm")
+	if err != nil {
+		return 0
+	}
+	fields := bytes.Fields(data)
+	if len(fields) < 2 {
+		return 0
+	}
+	pages, err := strconv.ParseInt(string(fields[1]), 10, 64)
+	if err != nil {
+		return 0
+	}
+	return pages * int64(os.Getpagesize())
+}
+
+// diskUsage returns the total size of the files under path
+func diskUsage(path string) int64 {
+	var total int64
+	filepath.WalkDir(path, func(_ string, d fs.DirEntry, err error) error {
+		if err != nil || d.IsDir() {
+			return nil
+		}
+		if info, err := d.Info(); err == nil {
+			total += info.Size()
+		}
+		return nil
+	})
+	return total
+}
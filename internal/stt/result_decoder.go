@@ -0,0 +1,158 @@
+package stt
+
+import (
+	"encoding/json"
+	"strconv"
+	"strings"
+)
+
+// voskFields holds the fields read from a Vosk result or partial result
+type voskFields struct {
+	text     string
+	partial  string
+	confSum  float64
+	words    int
+	multiple bool // alternatives present, not handled by the fast path
+}
+
+// decodeResult returns the text and average word confidence of a Vosk result
+//
+// Vosk emits a few fixed JSON shapes, so the common ones are scanned in place:
+// the text is a substring of data and word confidences are summed without
+// building the word array. Anything unexpected (escapes, alternatives) falls
+// back to encoding/json.
+func decodeResult(data string) (string, float64, error) {
+	fields, ok := scanVoskJSON(data)
+	if !ok || fields.multiple {
+		var voskResult VoskResult
+		if err := json.Unmarshal([]byte(data), &voskResult); err != nil {
+			return "", 0, err
+		}
+		return voskResult.Text, calculateAverageConfidence(voskResult), nil
+	}
+
+	if fields.words == 0 {
+		return fields.text, 0, nil
+	}
+	return fields.text, fields.confSum / float64(fields.words), nil
+}
+
+// decodePartial returns the text of a Vosk partial result
+func decodePartial(data string) (string, error) {
+	fields, ok := scanVoskJSON(data)
+	if !ok {
+		var voskResult VoskResult
+		if err := json.Unmarshal([]byte(data), &voskResult); err != nil {
+			return "", err
+		}
+		return voskResult.Partial, nil
+	}
+	return fields.partial, nil
+}
+
+// scanVoskJSON walks a Vosk result object, picking out the top-level "text"
+// and "partial" strings and every "conf" number
+// Returns false if the input uses JSON the scanner doesn't handle or is
+// malformed, leaving encoding/json to decode it or report the error.
+func scanVoskJSON(data string) (voskFields, bool) {
+	var fields voskFields
+	var key string
+	depth := 0
+	objects := 0
+	expectColon := false // A key was read, its ':' comes next
+	expectValue := false
+
+	for i := 0; i < len(data); i++ {
+		c := data[i]
+		if depth == 0 && c != '{' && strings.IndexByte(" \n\r\t", c) < 0 {
+			// Only a single object may appear at the top level
+			return fields, false
+		}
+
+		switch c {
+		case ' ', '\n', '\r', '\t':
+		case ',':
+			if expectColon || expectValue {
+				return fields, false
+			}
+		case '{', '[':
+			if expectColon {
+				return fields, false
+			}
+			if depth == 0 {
+				if objects > 0 {
+					return fields, false
+				}
+				objects++
+			}
+			depth++
+			expectValue = false
+		case '}', ']':
+			if expectColon || expectValue {
+				return fields, false
+			}
+			depth--
+		case ':':
+			if !expectColon {
+				return fields, false
+			}
+			expectColon = false
+			expectValue = true
+		case '"':
+			end := strings.IndexByte(data[i+1:], '"')
+			if end < 0 {
+				return fields, false
+			}
+			s := data[i+1 : i+1+end]
+			if strings.IndexByte(s, '\\') >= 0 {
+				return fields, false
+			}
+			i += end + 1
+
+			if !expectValue {
+				if expectColon {
+					return fields, false
+				}
+				expectColon = true
+				key = s
+				if key == "alternatives" {
+					fields.multiple = true
+				}
+				continue
+			}
+			expectValue = false
+			if depth == 1 {
+				switch key {
+				case "text":
+					fields.text = s
+				case "partial":
+					fields.partial = s
+				}
+			}
+		default:
+			if !expectValue {
+				return fields, false
+			}
+			expectValue = false
+
+			end := i
+			for end < len(data) && strings.IndexByte("+-.0123456789eE", data[end]) >= 0 {
+				end++
+			}
+			if end == i {
+				return fields, false
+			}
+			if key == "conf" {
+				conf, err := strconv.ParseFloat(data[i:end], 64)
+				if err != nil {
+					return fields, false
+				}
+				fields.confSum += conf
+				fields.words++
+			}
+			i = end - 1
+		}
+	}
+
+	return fields, depth == 0 && objects == 1
+}
@@ -0,0 +1,134 @@
+package stt
+
+import (
+	"encoding/json"
+	"fmt"
+	"strings"
+	"testing"
+)
+
+// voskResultJSON builds a final result the way Vosk formats one, with n words
+func voskResultJSON(n int) string {
+	if n == 0 {
+		return "{\n  \"text\" : \"\"\n}"
+	}
+	var words, text []string
+	for i := 0; i < n; i++ {
+		word := fmt.Sprintf("word%d", i)
+		words = append(words, fmt.Sprintf(
+			"{\n      \"conf\" : %.6f,\n      \"end\" : %.6f,\n      \"start\" : %.6f,\n      \"word\" : \"%s\"\n    }",
+			0.5+float64(i%5)/10, float64(i)+0.9, float64(i), word))
+		text = append(text, word)
+	}
+	return fmt.Sprintf("{\n  \"result\" : [%s],\n  \"text\" : \"%s\"\n}", strings.Join(words, ", "), strings.Join(text, " "))
+}
+
+// referenceDecode decodes a result with encoding/json, as before the scanner
+func referenceDecode(data string) (string, float64, error) {
+	var result VoskResult
+	if err := json.Unmarshal([]byte(data), &result); err != nil {
+		return "", 0, err
+	}
+	return result.Text, calculateAverageConfidence(result), nil
+}
+
+func TestDecodeResult(t *testing.T) {
+	tests := []struct {
+		name     string
+		data     string
+		fastPath bool // Whether the scanner handles the input itself
+	}{
+		{"no words", voskResultJSON(0), true},
+		{"one word", voskResultJSON(1), true},
+		{"twelve words", voskResultJSON(12), true},
+		{"empty object", `{}`, true},
+		{"compact", `{"result":[{"conf":1,"end":0.5,"start":0.1,"word":"yes"}],"text":"yes"}`, true},
+		{"exponent", `{"result":[{"conf":9.5e-1,"word":"go"}],"text":"go"}`, true},
+		{"nested text ignored", `{"result":[{"conf":0.5,"text":"inner","word":"a"}],"text":"a"}`, true},
+		{"escaped text", `{"text" : "say \"stop\" now"}`, false},
+		{"escaped word", `{"result":[{"conf":0.8,"word":"caf\u00e9"}],"text":"caf\u00e9"}`, false},
+		{"alternatives", `{"alternatives":[{"confidence":212.5,"text":"one two"},{"confidence":200.1,"text":"won too"}]}`, false},
+		{"literal", `{"result":[{"conf":0.9,"word":"on","spk":null}],"text":"on"}`, false},
+		{"boolean", `{"text":"on","final":true}`, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			fields, ok := scanVoskJSON(tt.data)
+			if fast := ok && !fields.multiple; fast != tt.fastPath {
+				t.Errorf("fast path = %v; want %v", fast, tt.fastPath)
+			}
+
+			text, conf, err := decodeResult(tt.data)
+			if err != nil {
+				t.Fatalf("decodeResult: %v", err)
+			}
+			wantText, wantConf, _ := referenceDecode(tt.data)
+			if text != wantText || conf != wantConf {
+				t.Errorf("decodeResult = %q, %v; want %q, %v", text, conf, wantText, wantConf)
+			}
+		})
+	}
+}
+
+func TestDecodeResultMalformed(t *testing.T) {
+	for _, data := range []string{
+		``,
+		`{"text":"unterminated`,
+		`{"text":"open object"`,
+		`{"text":"a"}}`,
+		`{"text":"a"} trailing`,
+		`{"result":[{"conf":}],"text":"a"}`,
+		`{"result":[{"conf":1..2}],"text":"a"}`,
+		`not json`,
+		`{"text":"a"}{"text":"b"}`,
+		`"text"`,
+		`{"text" "a"}`,
+		`{"text":"a","partial"}`,
+	} {
+		if _, ok := scanVoskJSON(data); ok {
+			t.Errorf("scanVoskJSON(%q) accepted malformed input", data)
+		}
+		if _, _, err := decodeResult(data); err == nil {
+			t.Errorf("decodeResult(%q) returned no error", data)
+		}
+	}
+}
+
+func TestDecodePartial(t *testing.T) {
+	for _, tt := range []struct {
+		data string
+		want string
+	}{
+		{"{\n  \"partial\" : \"turn on the\"\n}", "turn on the"},
+		{"{\n  \"partial\" : \"\"\n}", ""},
+		{`{"partial" : "say \"hi\""}`, `say "hi"`},
+	} {
+		got, err := decodePartial(tt.data)
+		if err != nil || got != tt.want {
+			t.Errorf("decodePartial(%q) = %q, %v; want %q", tt.data, got, err, tt.want)
+		}
+	}
+	if _, err := decodePartial(`{"partial" : "x`); err == nil {
+		t.Error("decodePartial accepted malformed input")
+	}
+}
+
+func BenchmarkDecodeResult(b *testing.B) {
+	for _, words := range []int{0, 1, 12} {
+		data := voskResultJSON(words)
+
+		b.Run(fmt.Sprintf("scan/%dwords", words), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				decodeResult(data)
+			}
+		})
+		b.Run(fmt.Sprintf("json/%dwords", words), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				referenceDecode(data)
+			}
+		})
+	}
+}
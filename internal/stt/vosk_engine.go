@@ -2,20 +2,51 @@ package stt
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
+	"strings"
 	"sync"
+	"time"
 
 	vosk "github.com/alphacep/vosk-api/go"
 )
 
 // VoskEngine implements the Engine interface using Vosk
+// It is one recognition session: a recognizer plus a reference on the Model it
+// decodes against. Engines created with NewVoskSession share a loaded model.
 type VoskEngine struct {
-	model       *vosk.VoskModel
+	model       *Model
 	recognizer  *vosk.VoskRecognizer
 	config      Config
 	mu          sync.Mutex
 	initialized bool
+
+	// straddle holds a sample split across two spans in ProcessAudioSpans
+	straddle [2]byte
+
+	// lastPartial is when a partial result was last fetched, for PartialInterval
+	lastPartial time.Time
+
+	resets ResetStats
+}
+
+// ResetStats holds latency counters for recognizer resets
+type ResetStats struct {
+	// Resets is the number of resets performed
+	Resets int
+
+	// Total is the total time spent resetting
+	Total time.Duration
+
+	// Max is the slowest reset
+	Max time.Duration
+}
+
+// Mean returns the average reset latency
+func (s ResetStats) Mean() time.Duration {
+	if s.Resets == 0 {
+		return 0
+	}
+	return s.Total / time.Duration(s.Resets)
 }
 
 // VoskResult represents the JSON result from Vosk
@@ -44,42 +75,57 @@ func (v *VoskEngine) Initialize(config Config) error {
 		return fmt.Errorf("engine already initialized")
 	}
 
-	// Set log level (0 = errors only, higher = more verbose)
-	vosk.SetLogLevel(-1) // Suppress logs
-
-	// Load the model
-	model, err := vosk.NewModel(config.ModelPath)
+	model, err := LoadModel(config.ModelPath, config.LockModel)
 	if err != nil {
-		return fmt.Errorf("failed to load model from %s: %w", config.ModelPath, err)
-	}
-	if model == nil {
-		return fmt.Errorf("failed to load model from %s: model returned nil", config.ModelPath)
+		return err
 	}
-	v.model = model
 
-	// Create recognizer
-	recognizer, err := vosk.NewRecognizer(model, float64(config.SampleRate))
+	recognizer, err := model.newRecognizer(config)
 	if err != nil {
-		model.Free()
-		return fmt.Errorf("failed to create recognizer: %w", err)
+		model.Release()
+		return err
 	}
+	v.model = model
 	v.recognizer = recognizer
 
-	// Configure recognizer
-	if config.MaxAlternatives > 0 {
-		v.recognizer.SetMaxAlternatives(config.MaxAlternatives)
-	}
-	// Always enable word results to get confidence scores
-	v.recognizer.SetWords(1)
-
 	v.config = config
 	v.initialized = true
 
 	return nil
 }
 
+// NewVoskSession creates an initialized engine decoding against a shared model
+// The session holds its own reference on model, released by Close, so the
+// caller may release theirs independently.
+func NewVoskSession(model *Model, config Config) (*VoskEngine, error) {
+	if err := model.Retain(); err != nil {
+		return nil, err
+	}
+
+	recognizer, err := model.newRecognizer(config)
+	if err != nil {
+		model.Release()
+		return nil, err
+	}
+
+	config.ModelPath = model.Path()
+	return &VoskEngine{
+		model:       model,
+		recognizer:  recognizer,
+		config:      config,
+		initialized: true,
+	}, nil
+}
+
 // ProcessAudio processes audio data and returns recognition results
 func (v *VoskEngine) ProcessAudio(ctx context.Context, audioData []byte) (*Result, error) {
+	return v.ProcessAudioSpans(ctx, audioData, nil)
+}
+
+// ProcessAudioSpans processes audio split across two spans without copying it
+// into a contiguous buffer first. A sample straddling the two spans is
+// reassembled in a two-byte scratch buffer.
+func (v *VoskEngine) ProcessAudioSpans(ctx context.Context, first, second []byte) (*Result, error) {
 	v.mu.Lock()
 	defer v.mu.Unlock()
 
@@ -94,31 +140,62 @@ func (v *VoskEngine) ProcessAudio(ctx context.Context, audioData []byte) (*Resul
 	default:
 	}
 
-	// Accept waveform data
-	state := v.recognizer.AcceptWaveform(audioData)
-
-	var result Result
+	var final []string
+	var confidence float64
+	accept := func(data []byte) error {
+		if len(data) == 0 {
+			return nil
+		}
+		// Accept waveform data
+		if v.recognizer.AcceptWaveform(data) > 0 {
+			// Final result available, collect it before feeding more audio
+			text, conf, err := v.readResult()
+			if err != nil {
+				return err
+			}
+			if text != "" {
+				final = append(final, text)
+				confidence += conf
+			}
+		}
+		return nil
+	}
 
-	if state > 0 {
-		// Final result available
-		resultJSON := v.recognizer.Result()
-		var voskResult VoskResult
-		if err := json.Unmarshal([]byte(resultJSON), &voskResult); err != nil {
-			return nil, fmt.Errorf("failed to parse result: %w", err)
+	if len(second) > 0 && len(first)%2 == 1 {
+		last := len(first) - 1
+		v.straddle[0], v.straddle[1] = first[last], second[0]
+		if err := accept(first[:last]); err != nil {
+			return nil, err
+		}
+		if err := accept(v.straddle[:]); err != nil {
+			return nil, err
 		}
+		second = second[1:]
+	} else if err := accept(first); err != nil {
+		return nil, err
+	}
+	if err := accept(second); err != nil {
+		return nil, err
+	}
+
+	var result Result
 
-		result.Text = voskResult.Text
+	if len(final) > 0 {
+		result.Text = strings.Join(final, " ")
 		result.Partial = false
-		result.Confidence = calculateAverageConfidence(voskResult)
+		result.Confidence = confidence / float64(len(final))
 	} else {
-		// Partial result
-		partialJSON := v.recognizer.PartialResult()
-		var voskResult VoskResult
-		if err := json.Unmarshal([]byte(partialJSON), &voskResult); err != nil {
+		// Partial result, unless skipped or fetched too recently
+		if !v.partialDue(time.Now()) {
+			return nil, nil
+		}
+
+		partial, err := decodePartial(v.recognizer.PartialResult())
+		if err != nil {
 			return nil, fmt.Errorf("failed to parse partial result: %w", err)
 		}
 
-		result.Text = voskResult.Partial
+		result.Text = partial
 		result.Partial = true
 		result.Confidence = 0.0
 	}
@@ -126,6 +203,28 @@ func (v *VoskEngine) ProcessAudio(ctx context.Context, audioData []byte) (*Resul
 	return &result, nil
 }
 
+// partialDue reports whether a partial result may be fetched at now, and
+// records the fetch if so. Must be called with v.mu held.
+func (v *VoskEngine) partialDue(now time.Time) bool {
+	if v.config.SkipPartials {
+		return false
+	}
+	if v.config.PartialInterval > 0 && now.Sub(v.lastPartial) < v.config.PartialInterval {
+		return false
+	}
+	v.lastPartial = now
+	return true
+}
+
+// readResult fetches and parses the recognizer's current final result
+func (v *VoskEngine) readResult() (string, float64, error) {
+	text, conf, err := decodeResult(v.recognizer.Result())
+	if err != nil {
+		return "", 0, fmt.Errorf("failed to parse result: %w", err)
+	}
+	return text, conf, nil
+}
+
 // FinalResult returns the final result and resets the recognizer
 func (v *VoskEngine) FinalResult() (*Result, error) {
 	v.mu.Lock()
@@ -136,22 +235,24 @@ func (v *VoskEngine) FinalResult() (*Result, error) {
 	}
 
 	// Get final result
-	resultJSON := v.recognizer.FinalResult()
-	var voskResult VoskResult
-	if err := json.Unmarshal([]byte(resultJSON), &voskResult); err != nil {
+	text, conf, err := decodeResult(v.recognizer.FinalResult())
+	if err != nil {
 		return nil, fmt.Errorf("failed to parse final result: %w", err)
 	}
 
 	result := Result{
-		Text:       voskResult.Text,
+		Text:       text,
 		Partial:    false,
-		Confidence: calculateAverageConfidence(voskResult),
+		Confidence: conf,
 	}
 
 	return &result, nil
 }
 
 // Reset resets the recognizer state
+// The recognizer is reused: Vosk restarts the decoder in place instead of
+// rebuilding the recognizer and its rescoring and grammar graphs, so a reset
+// between utterances costs far less than constructing a new one.
 func (v *VoskEngine) Reset() error {
 	v.mu.Lock()
 	defer v.mu.Unlock()
@@ -160,19 +261,33 @@ func (v *VoskEngine) Reset() error {
 		return fmt.Errorf("engine not initialized")
 	}
 
-	// Force reset by recreating the recognizer
-	if v.recognizer != nil {
-		v.recognizer.Free()
-	}
-	recognizer, err := vosk.NewRecognizer(v.model, float64(v.config.SampleRate))
-	if err != nil {
-		return fmt.Errorf("failed to recreate recognizer: %w", err)
-	}
-	v.recognizer = recognizer
-	v.recognizer.SetWords(1)
+	start := time.Now()
+	v.recognizer.Reset()
+	elapsed := time.Since(start)
+
+	v.resets.Resets++
+	v.resets.Total += elapsed
+	v.resets.Max = max(v.resets.Max, elapsed)
 	return nil
 }
 
+// ResetStats returns a snapshot of the engine's reset latency counters
+func (v *VoskEngine) ResetStats() ResetStats {
+	v.mu.Lock()
+	defer v.mu.Unlock()
+	return v.resets
+}
+
+// LoadStats returns the time taken to load the engine's model
+func (v *VoskEngine) LoadStats() ModelLoadStats {
+	v.mu.Lock()
+	defer v.mu.Unlock()
+	if v.model == nil {
+		return ModelLoadStats{}
+	}
+	return v.model.LoadStats()
+}
+
 // Close releases resources
 func (v *VoskEngine) Close() error {
 	v.mu.Lock()
@@ -188,9 +303,9 @@ func (v *VoskEngine) Close() error {
 		v.recognizer = nil
 	}
 
-	// Free model
+	// Drop this session's reference on the model
 	if v.model != nil {
-		v.model.Free()
+		v.model.Release()
 		v.model = nil
 	}
 
@@ -0,0 +1,35 @@
+package stt
+
+import (
+	"testing"
+	"time"
+)
+
+func TestPartialDue(t *testing.T) {
+	start := time.Unix(1000, 0)
+	tests := []struct {
+		name   string
+		config Config
+		calls  []time.Duration // offsets from start
+		want   []bool
+	}{
+		{"every call", Config{}, []time.Duration{0, 1, 2}, []bool{true, true, true}},
+		{"skipped", Config{SkipPartials: true}, []time.Duration{0, time.Second}, []bool{false, false}},
+		{
+			"throttled",
+			Config{PartialInterval: 100 * time.Millisecond},
+			[]time.Duration{0, 50 * time.Millisecond, 99 * time.Millisecond, 100 * time.Millisecond, 150 * time.Millisecond, 250 * time.Millisecond},
+			[]bool{true, false, false, true, false, true},
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			engine := &VoskEngine{config: tt.config}
+			for i, offset := range tt.calls {
+				if got := engine.partialDue(start.Add(offset)); got != tt.want[i] {
+					t.Errorf("partialDue at +%v = %v; want %v", offset, got, tt.want[i])
+				}
+			}
+		})
+	}
+}